@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Celery configuration for AIBOA Analysis Service
+분석 작업을 웹 프로세스(FastAPI BackgroundTasks) 밖의 worker 프로세스에서 실행
+
+30~90분짜리 종합 분석이 배포/OOM으로 웹 프로세스와 함께 사라지지 않도록,
+작업 완료 후 ack(acks_late)하고 worker가 죽으면 다른 worker에 재전달한다.
+API와 worker는 별도 프로세스이므로 worker 수만 독립적으로 늘릴 수 있다.
+
+환경변수:
+    ANALYSIS_TASK_TIME_LIMIT: 작업 hard time limit (초, 기본값: 7200)
+    ANALYSIS_TASK_MAX_RETRIES: 일시적 오류 재시도 횟수 (기본값: 2)
+    ANALYSIS_WORKER_CONCURRENCY: worker 프로세스당 동시 작업 수 (기본값: 2)
+    CACHE_WARMUP_TIME_LIMIT: 캐시 워밍 작업 hard time limit (초, 기본값: 43200, 초과 시 cursor에서 재개 가능)
+"""
+
+import os
+from celery import Celery
+from celery.signals import after_setup_logger
+import logging
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+ANALYSIS_QUEUE = "analysis"
+
+TASK_TIME_LIMIT = int(os.getenv("ANALYSIS_TASK_TIME_LIMIT", "7200"))
+TASK_MAX_RETRIES = int(os.getenv("ANALYSIS_TASK_MAX_RETRIES", "2"))
+CACHE_WARMUP_TIME_LIMIT = int(os.getenv("CACHE_WARMUP_TIME_LIMIT", "43200"))
+
+_redis_password = os.getenv('REDIS_PASSWORD')
+_redis_auth = f":{_redis_password}@" if _redis_password else ""
+_redis_url = f"redis://{_redis_auth}{os.getenv('REDIS_HOST', 'redis')}:{os.getenv('REDIS_PORT', '6379')}/0"
+
+# Create Celery app
+celery_app = Celery(
+    "analysis_service",
+    broker=_redis_url,
+    backend=_redis_url,
+    include=["celery_tasks"]
+)
+
+celery_app.conf.update(
+    # Task routing
+    task_default_queue=ANALYSIS_QUEUE,
+    task_routes={
+        'analysis_service.*': {'queue': ANALYSIS_QUEUE}
+    },
+
+    # Worker configuration (LLM 대기 위주의 긴 작업)
+    worker_concurrency=int(os.getenv("ANALYSIS_WORKER_CONCURRENCY", "2")),
+    task_time_limit=TASK_TIME_LIMIT,
+    task_soft_time_limit=max(60, TASK_TIME_LIMIT - 300),
+    worker_max_tasks_per_child=20,  # Restart worker process periodically to release memory
+
+    # Result backend settings (작업 상태/결과는 analysis_job_status/analysis_job_result 키에 저장하므로 짧게)
+    result_expires=3600,
+    result_backend_transport_options={
+        'retry_on_timeout': True,
+    },
+
+    # Acknowledgement: 완료 후 ack, worker가 죽으면 재전달
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=1,  # One task at a time per worker process
+
+    # Monitoring and logging
+    worker_send_task_events=True,
+    task_send_sent_event=True,
+
+    # Redis settings (visibility timeout은 가장 긴 작업보다 길어야 실행 중 작업이 중복 전달되지 않음)
+    broker_transport_options={
+        'retry_on_timeout': True,
+        'visibility_timeout': TASK_TIME_LIMIT + 1800,
+    },
+
+    # Task serialization
+    task_serializer='json',
+    result_serializer='json',
+    accept_content=['json'],
+    timezone='UTC',
+    enable_utc=True,
+)
+
+@after_setup_logger.connect
+def setup_loggers(logger, *args, **kwargs):
+    """Setup logging for Celery workers"""
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    handler = logging.StreamHandler()
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
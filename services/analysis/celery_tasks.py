@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Celery tasks for AIBOA Analysis Service
+웹 프로세스의 BackgroundTasks와 같은 작업 함수(main.process_*)를 worker 프로세스에서 실행
+
+- ack: 작업 완료 후 (celery_app: task_acks_late, task_reject_on_worker_lost)
+- 재시도: 일시적 오류(LLM/DB 장애 등)는 지수 backoff로 ANALYSIS_TASK_MAX_RETRIES회,
+  입력 오류(AnalysisInputError)와 soft time limit 초과는 재시도하지 않음
+- 종료 상태: 재시도 중에는 pending만 기록하고, failed는 재시도하지 않는 경우에만 기록
+  (SSE/게이트웨이가 재시도될 작업을 실패로 보고하지 않도록)
+- 캐시 워밍(services/cache_warmup.py): 수 시간짜리 재생 작업도 웹 프로세스 밖에서 실행.
+  진행 상태(cursor)가 Redis에 남으므로 재시도/재전달 대신 다시 요청하면 이어서 처리
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from celery.exceptions import SoftTimeLimitExceeded
+
+from celery_app import celery_app, TASK_MAX_RETRIES, CACHE_WARMUP_TIME_LIMIT
+from main import (
+    job_store, save_job_status, process_analysis_job, process_comprehensive_cbil_analysis,
+    AnalysisInputError, semantic_cache
+)
+
+logger = logging.getLogger(__name__)
+
+# worker 프로세스마다 하나의 event loop를 재사용
+# (OpenAIService/LLM 스케줄러의 asyncio 객체가 작업 간에 다른 loop에 묶이지 않도록)
+_loop = None
+
+
+def _run(coro):
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop.run_until_complete(coro)
+
+
+def _update_status(job_id: str, ttl: int, **fields):
+    job_data = job_store.load_status(job_id) or {"job_id": job_id}
+    job_data.update(fields, updated_at=datetime.now().isoformat())
+    save_job_status(job_id, job_data, ttl)
+
+
+def _mark_retrying(job_id: str, ttl: int, attempt: int, countdown: int, error: Exception):
+    """재시도 예정 상태 기록"""
+    _update_status(
+        job_id, ttl,
+        status="pending",
+        message=f"Retrying in {countdown}s (attempt {attempt}/{TASK_MAX_RETRIES}): {error}",
+        retries=attempt
+    )
+
+
+def _mark_failed(job_id: str, ttl: int, message: str):
+    """최종 실패 상태 기록 (재시도하지 않는 경우)"""
+    _update_status(job_id, ttl, status="failed", message=message)
+
+
+def _retry(task, job_id: str, ttl: int, error: Exception, failure_message: str):
+    if task.request.retries >= TASK_MAX_RETRIES:
+        logger.error(f"Job {job_id}: giving up after {task.request.retries} retries: {error}")
+        _mark_failed(job_id, ttl, failure_message)
+        raise error
+
+    countdown = 60 * 2 ** task.request.retries
+    _mark_retrying(job_id, ttl, task.request.retries + 1, countdown, error)
+    raise task.retry(exc=error, countdown=countdown, max_retries=TASK_MAX_RETRIES)
+
+
+@celery_app.task(bind=True, name='analysis_service.process_comprehensive_cbil_analysis')
+def process_comprehensive_cbil_analysis_task(
+    self,
+    job_id: str,
+    text: str,
+    metadata: Dict[str, Any],
+    segments: List[Dict[str, Any]]
+):
+    """종합 CBIL + Module 3 분석 (main.process_comprehensive_cbil_analysis)"""
+    logger.info(f"Starting Celery task for comprehensive job {job_id} (retry {self.request.retries})")
+    try:
+        _run(process_comprehensive_cbil_analysis(
+            job_id, text, metadata, segments, raise_errors=True
+        ))
+    except AnalysisInputError:
+        # failed 상태는 이미 기록됨
+        return {"job_id": job_id, "status": "failed"}
+    except SoftTimeLimitExceeded:
+        # 같은 time limit으로 다시 실행해도 초과할 가능성이 높으므로 재시도하지 않음
+        logger.error(f"Job {job_id}: soft time limit exceeded")
+        _mark_failed(job_id, 7200, "Comprehensive analysis failed: time limit exceeded")
+        return {"job_id": job_id, "status": "failed"}
+    except Exception as e:
+        _retry(self, job_id, 7200, e, f"Comprehensive analysis failed: {str(e)}")
+    return {"job_id": job_id, "status": "completed"}
+
+
+@celery_app.task(bind=True, name='analysis_service.process_analysis_job')
+def process_analysis_job_task(
+    self,
+    job_id: str,
+    text: str,
+    framework: str,
+    metadata: Dict[str, Any]
+):
+    """단일 프레임워크 분석 (main.process_analysis_job)"""
+    logger.info(f"Starting Celery task for {framework} job {job_id} (retry {self.request.retries})")
+    try:
+        _run(process_analysis_job(job_id, text, framework, metadata, raise_errors=True))
+    except AnalysisInputError:
+        return {"job_id": job_id, "status": "failed"}
+    except SoftTimeLimitExceeded:
+        logger.error(f"Job {job_id}: soft time limit exceeded")
+        _mark_failed(job_id, 3600, "Analysis failed: time limit exceeded")
+        return {"job_id": job_id, "status": "failed"}
+    except Exception as e:
+        _retry(self, job_id, 3600, e, f"Analysis failed: {str(e)}")
+    return {"job_id": job_id, "status": "completed"}
+
+
+@celery_app.task(
+    bind=True,
+    name='analysis_service.cache_warmup',
+    acks_late=False,  # 재전달 대신 cursor에서 재개 (visibility timeout보다 오래 실행될 수 있음)
+    time_limit=CACHE_WARMUP_TIME_LIMIT,
+    soft_time_limit=max(60, CACHE_WARMUP_TIME_LIMIT - 300)
+)
+def cache_warmup_task(self, limit: Optional[int] = None):
+    """SemanticCache 워밍 (services.cache_warmup.CacheWarmupJob)"""
+    from services.cache_warmup import CacheWarmupJob
+
+    logger.info(f"Starting Celery task for cache warm-up (limit={limit or 'none'})")
+    try:
+        return _run(CacheWarmupJob(semantic_cache).run(limit=limit))
+    except SoftTimeLimitExceeded:
+        # lock은 해제되고 cursor는 남아 있으므로 다시 요청하면 이어서 처리
+        logger.error("Cache warm-up: soft time limit exceeded, resume with POST /api/cache/warmup")
+        return {"status": "failed", "error": "time limit exceeded"}
@@ -11,7 +11,13 @@ from typing import Dict, List, Any, Optional
 from pathlib import Path
 
 from services.openai_service import OpenAIService
-from utils.semantic_cache import SemanticCache
+from utils.semantic_cache import SemanticCache, compute_fingerprint
+from utils.concurrency import gather_bounded, get_default_concurrency
+from utils.checkpoint_store import ClassificationProgress, PASS_CONTEXT
+from utils.fast_rules import (
+    FastRuleEngine, get_fast_rules_mode,
+    MODE_ON, MODE_SHADOW, MODE_OFF, DECISION_SOURCE_RULE, DECISION_SOURCE_LLM
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,13 +29,15 @@ class ContextTagger:
         self,
         checklist_path: Optional[str] = None,
         openai_service: Optional[OpenAIService] = None,
-        semantic_cache: Optional[SemanticCache] = None
+        semantic_cache: Optional[SemanticCache] = None,
+        max_concurrency: Optional[int] = None
     ):
         """
         Args:
             checklist_path: 체크리스트 YAML 파일 경로
             openai_service: OpenAI 서비스 인스턴스
             semantic_cache: Semantic cache 인스턴스 (일관성 보장용)
+            max_concurrency: 동시에 태깅할 최대 발화 수 (기본값: 환경변수 CLASSIFIER_CONCURRENCY 또는 1)
         """
         # 체크리스트 로드
         if checklist_path is None:
@@ -49,6 +57,32 @@ class ContextTagger:
         # Semantic cache (일관성 보장)
         self.semantic_cache = semantic_cache
 
+        # 체크리스트(프롬프트/결정 규칙 포함)나 모델이 바뀌면 캐시 키도 바뀜 (이전 결과 재사용 방지)
+        # fast_rules는 LLM 응답에 영향이 없으므로 제외 (규칙 수정으로 캐시가 만료되지 않도록)
+        self.cache_fingerprint = compute_fingerprint(
+            {k: v for k, v in self.config.items() if k != "fast_rules"},
+            self.openai_service.model
+        )
+        # 배치 모드 결과는 묶음 프롬프트로 만들어지므로 별도 타입(context_batch)과 fingerprint로 저장
+        self.batch_cache_type = "context_batch"
+        if self.semantic_cache:
+            self.semantic_cache.register_fingerprint("context", self.cache_fingerprint)
+            if self.openai_service.batch_size > 1:
+                self.semantic_cache.register_fingerprint(
+                    self.batch_cache_type,
+                    compute_fingerprint(self.cache_fingerprint, self.openai_service.batch_prompt_fingerprint())
+                )
+
+        # 규칙 기반 사전 분류 (YAML에 fast_rules가 있을 때만, FAST_RULES_MODE로 on/shadow/off)
+        self.fast_rules_mode = get_fast_rules_mode()
+        self.fast_rules = (
+            FastRuleEngine.from_config(self.config, name="context")
+            if self.fast_rules_mode != MODE_OFF else None
+        )
+
+        # 발화 단위 동시 실행 수
+        self.max_concurrency = max_concurrency or get_default_concurrency()
+
         logger.info("Context Tagger initialized (caching: %s)", "enabled" if semantic_cache else "disabled")
 
     def _build_checklist_items(self, context_name: str) -> str:
@@ -113,12 +147,49 @@ class ContextTagger:
         context = self.contexts[context_name]
         return [item["id"] for item in context["checklist"]]
 
+    def _apply_fast_rules(self, utterance: str) -> Optional[Dict[str, Any]]:
+        """
+        fast_rules로 결정 가능한 발화면 tag_single_utterance와 같은 형식의 결과 반환 (on 모드),
+        애매하거나 규칙이 없으면 None
+        """
+        if self.fast_rules is None or self.fast_rules_mode != MODE_ON:
+            return None
+
+        decision = self.fast_rules.match(utterance)
+        if decision is None:
+            return None
+
+        label = decision["label"]
+        max_score = len(self.contexts[label]["checklist"]) * decision["confidence"]
+        return {
+            "contexts": [label],
+            "context_scores": {
+                name: round(max_score, 2) if name == label else 0
+                for name in self.contexts
+            },
+            "checklist_results": {},
+            "primary_context": label,
+            "decision_source": DECISION_SOURCE_RULE,
+            "rule_id": decision["rule_id"]
+        }
+
+    def _record_fast_rule_shadow(self, utterance: str, result: Dict[str, Any]):
+        """shadow 모드: LLM 결과에 규칙 결정을 기록하고 일치율 집계"""
+        if self.fast_rules is None or self.fast_rules_mode != MODE_SHADOW:
+            return
+
+        decision = self.fast_rules.match(utterance)
+        if decision is not None:
+            self.fast_rules.record_shadow(decision, result["contexts"])
+            result["fast_rule_decision"] = decision
+
     async def tag_single_utterance(
         self,
         utterance: str,
         timestamp: Optional[str] = None,
         previous_utterance: Optional[str] = None,
-        next_utterance: Optional[str] = None
+        next_utterance: Optional[str] = None,
+        apply_fast_rules: bool = True
     ) -> Dict[str, Any]:
         """
         단일 발화의 맥락 태깅 (Multi-label)
@@ -128,6 +199,7 @@ class ContextTagger:
             timestamp: 발화 시간
             previous_utterance: 이전 발화
             next_utterance: 다음 발화
+            apply_fast_rules: fast_rules로 먼저 결정 시도 (호출자가 이미 확인했으면 False)
 
         Returns:
             {
@@ -147,6 +219,12 @@ class ContextTagger:
         """
         logger.info(f"Tagging utterance: {utterance[:50]}...")
 
+        # ✅ 명백한 발화는 규칙으로 결정 (캐시/LLM 생략)
+        if apply_fast_rules:
+            rule_result = self._apply_fast_rules(utterance)
+            if rule_result is not None:
+                return rule_result
+
         # ✅ Semantic Cache 확인 (일관성 보장)
         if self.semantic_cache:
             context = {
@@ -201,8 +279,10 @@ class ContextTagger:
             "contexts": decision["contexts"],
             "context_scores": decision["scores"],
             "checklist_results": checklist_results,
-            "primary_context": decision["primary_context"]
+            "primary_context": decision["primary_context"],
+            "decision_source": DECISION_SOURCE_LLM
         }
+        self._record_fast_rule_shadow(utterance, result)
 
         # ✅ Semantic Cache에 결과 저장 (일관성 보장)
         if self.semantic_cache:
@@ -278,7 +358,8 @@ class ContextTagger:
 
     async def tag_multiple_utterances(
         self,
-        utterances: List[Dict[str, Any]]
+        utterances: List[Dict[str, Any]],
+        progress: Optional[ClassificationProgress] = None
     ) -> List[Dict[str, Any]]:
         """
         여러 발화를 배치로 태깅
@@ -292,36 +373,160 @@ class ContextTagger:
                 },
                 ...
             ]
+            progress: 발화별 분류 checkpoint (이전 실행에서 완료된 발화는 건너뛰고, 완료되는 발화를 기록)
 
         Returns:
             각 발화의 태깅 결과 리스트
         """
         logger.info(f"Tagging {len(utterances)} utterances")
 
-        results = []
-        for i, utterance in enumerate(utterances):
-            # 이전/다음 발화 컨텍스트
-            prev_text = utterances[i-1]["text"] if i > 0 else None
-            next_text = utterances[i+1]["text"] if i < len(utterances)-1 else None
+        # 캐시 일괄 조회 (MGET 1회), miss인 발화만 LLM으로 전송
+        cache_type = self.batch_cache_type if self.openai_service.batch_size > 1 else "context"
+        cached_results = (
+            self.semantic_cache.prefetch(utterances, cache_type)
+            if self.semantic_cache else [None] * len(utterances)
+        )
 
-            result = await self.tag_single_utterance(
-                utterance=utterance["text"],
-                timestamp=utterance.get("timestamp"),
-                previous_utterance=prev_text,
-                next_utterance=next_text
-            )
+        # 규칙으로 결정되는 발화는 LLM으로 보내지 않음 (캐시된 결과보다 우선)
+        for i, utterance in enumerate(utterances):
+            rule_result = self._apply_fast_rules(utterance["text"])
+            if rule_result is not None:
+                cached_results[i] = rule_result
+
+        # 이전 실행(재시도)에서 이미 태깅된 발화
+        if progress:
+            for i, result in progress.completed(PASS_CONTEXT).items():
+                cached_results[i] = result
+
+        # 배치 모드: 여러 발화의 체크리스트를 한 프롬프트로 묶어서 실행
+        batched_results = None
+        if self.openai_service.batch_size > 1:
+            batched_results = await self._tag_utterances_batched(utterances, cached_results)
+
+        async def tag_one(i: int, utterance: Dict[str, Any]) -> Dict[str, Any]:
+            if batched_results is not None:
+                result = batched_results[i]
+            elif cached_results[i] is not None:
+                result = cached_results[i]
+            else:
+                # 이전/다음 발화 컨텍스트
+                prev_text = utterances[i-1]["text"] if i > 0 else None
+                next_text = utterances[i+1]["text"] if i < len(utterances)-1 else None
+
+                result = await self.tag_single_utterance(
+                    utterance=utterance["text"],
+                    timestamp=utterance.get("timestamp"),
+                    previous_utterance=prev_text,
+                    next_utterance=next_text,
+                    apply_fast_rules=False
+                )
 
             # 메타데이터 추가
             result["utterance_id"] = utterance.get("id")
             result["utterance_text"] = utterance["text"]
 
-            results.append(result)
-
             logger.info(
                 f"[{i+1}/{len(utterances)}] {utterance.get('id')}: "
                 f"{', '.join(result['contexts'])} (primary={result['primary_context']})"
             )
 
+            if progress:
+                progress.record(PASS_CONTEXT, i, result)
+            return result
+
+        # 발화 간 독립적이므로 max_concurrency개씩 동시 실행 (결과 순서 유지)
+        return await gather_bounded(utterances, tag_one, self.max_concurrency)
+
+    async def _tag_utterances_batched(
+        self,
+        utterances: List[Dict[str, Any]],
+        cached_results: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        배치 모드 태깅 (openai_service.batch_size > 1)
+
+        캐시에 없는 발화들의 같은 맥락 체크리스트를 batch_execute_checklists로 묶어 실행하고,
+        각 발화별로 _make_tagging_decision을 적용한다.
+
+        Returns:
+            tag_single_utterance와 같은 형식의 결과 리스트 (입력 순서 유지)
+        """
+        if cached_results is None:
+            cached_results = (
+                self.semantic_cache.prefetch(utterances, self.batch_cache_type)
+                if self.semantic_cache else [None] * len(utterances)
+            )
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(utterances)
+        pending = []
+
+        for i, utterance in enumerate(utterances):
+            prev_text = utterances[i-1]["text"] if i > 0 else None
+            next_text = utterances[i+1]["text"] if i < len(utterances)-1 else None
+            context = {
+                "timestamp": utterance.get("timestamp"),
+                "has_previous": prev_text is not None,
+                "has_next": next_text is not None
+            }
+
+            if cached_results[i] is not None:
+                results[i] = cached_results[i]
+                continue
+
+            pending.append((i, prev_text, next_text, context))
+
+        if not pending:
+            return results
+
+        context_names = ["explanation", "question", "feedback", "facilitation", "management"]
+        checklist_results = {i: {} for i, _, _, _ in pending}
+
+        for context_name in context_names:
+            expected_keys = self._get_expected_keys(context_name)
+            items = [
+                {
+                    "prompt": self._build_prompt(
+                        utterance=utterances[i]["text"],
+                        context_name=context_name,
+                        timestamp=utterances[i].get("timestamp"),
+                        previous_utterance=prev_text,
+                        next_utterance=next_text
+                    ),
+                    "expected_keys": expected_keys
+                }
+                for i, prev_text, next_text, _ in pending
+            ]
+
+            context_results = await self.openai_service.batch_execute_checklists(items)
+
+            for (i, _, _, _), result in zip(pending, context_results):
+                yes_count = self.openai_service.count_yes_responses(result["results"])
+                checklist_results[i][context_name] = {
+                    **result,
+                    "yes_count": yes_count
+                }
+
+        for i, _, _, context in pending:
+            decision = self._make_tagging_decision(checklist_results[i])
+
+            result = {
+                "contexts": decision["contexts"],
+                "context_scores": decision["scores"],
+                "checklist_results": checklist_results[i],
+                "primary_context": decision["primary_context"],
+                "decision_source": DECISION_SOURCE_LLM
+            }
+            self._record_fast_rule_shadow(utterances[i]["text"], result)
+
+            results[i] = result
+
+        # 새 결과를 파이프라인 1회로 저장
+        if self.semantic_cache:
+            self.semantic_cache.set_many([
+                (utterances[i]["text"], self.batch_cache_type, results[i], context)
+                for i, _, _, context in pending
+            ])
+
         return results
 
     def get_context_statistics(
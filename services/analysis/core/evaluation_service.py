@@ -3,16 +3,21 @@ Evaluation Service - Orchestrates comprehensive teaching evaluation
 Integrates 3D Matrix, Metrics, Pattern Matching, and Coaching Generation
 """
 
+import asyncio
+import inspect
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Awaitable, Dict, List, Any, Optional, Union
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
 from core.matrix_builder import MatrixBuilder
-from core.metrics_calculator import MetricsCalculator
+from core.metrics_calculator import MetricsCalculator, MetricResult
 from core.pattern_matcher import PatternMatcher
 from core.coaching_generator import CoachingGenerator
 from utils.semantic_cache import SemanticCache
+from utils.checkpoint_store import (
+    StageCheckpointStore, STAGE_CBIL_ANALYSIS, STAGE_MATRIX, STAGE_METRICS, STAGE_PATTERN, STAGE_COACHING
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +39,9 @@ class EvaluationResult:
     input_metadata: Optional[Dict[str, Any]] = None
     processing_time: Optional[float] = None
 
+    # CBIL 7-stage analysis text (evaluate_with_cbil only)
+    cbil_analysis_text: Optional[str] = None
+
 
 class EvaluationService:
     """Comprehensive teaching evaluation orchestrator"""
@@ -70,7 +78,8 @@ class EvaluationService:
         utterances: List[Dict[str, Any]],
         evaluation_id: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None,
-        include_raw_data: bool = False
+        include_raw_data: bool = False,
+        checkpoints: Optional[StageCheckpointStore] = None
     ) -> EvaluationResult:
         """
         Perform comprehensive teaching evaluation
@@ -86,6 +95,7 @@ class EvaluationService:
             evaluation_id: Optional custom evaluation ID
             context: Additional context (subject, grade_level, duration)
             include_raw_data: Include raw classification data
+            checkpoints: Stage checkpoint store; completed stages are loaded instead of re-run
 
         Returns:
             EvaluationResult with all analysis components
@@ -97,66 +107,95 @@ class EvaluationService:
         logger.info(f"Starting evaluation {evaluation_id} with {len(utterances)} utterances")
 
         # Step 1: Build 3D Matrix
-        logger.info("Step 1/4: Building 3D matrix...")
-        matrix_result = await self.matrix_builder.build_3d_matrix(
-            utterances=utterances,
-            include_raw_data=include_raw_data
-        )
+        matrix_result = checkpoints.load(STAGE_MATRIX) if checkpoints else None
+        if matrix_result is None:
+            logger.info("Step 1/4: Building 3D matrix...")
+            matrix_result = await self.matrix_builder.build_3d_matrix(
+                utterances=utterances,
+                include_raw_data=include_raw_data,
+                checkpoints=checkpoints
+            )
+            if checkpoints:
+                checkpoints.save(STAGE_MATRIX, matrix_result)
+            logger.info("3D matrix completed")
         matrix_data = matrix_result.get('matrix', {})
-        logger.info("3D matrix completed")
 
         # Step 2: Calculate Quantitative Metrics
-        logger.info("Step 2/4: Calculating quantitative metrics...")
-        all_metrics = self.metrics_calculator.calculate_all_metrics(
-            matrix_data=matrix_data,
-            utterances=utterances
-        )
-
-        # Convert metrics to serializable format
-        metrics_dict = {
-            name: {
-                'value': metric.value,
-                'normalized_score': metric.normalized_score,
-                'optimal_range': metric.optimal_range,
-                'status': metric.status,
-                'description': metric.description
+        metrics_dict = checkpoints.load(STAGE_METRICS) if checkpoints else None
+        if metrics_dict is None:
+            logger.info("Step 2/4: Calculating quantitative metrics...")
+            all_metrics = self.metrics_calculator.calculate_all_metrics(
+                matrix_data=matrix_data,
+                utterances=utterances
+            )
+
+            # Convert metrics to serializable format
+            metrics_dict = {
+                name: {
+                    'value': metric.value,
+                    'normalized_score': metric.normalized_score,
+                    'optimal_range': metric.optimal_range,
+                    'status': metric.status,
+                    'description': metric.description
+                }
+                for name, metric in all_metrics.items()
+            }
+            if checkpoints:
+                checkpoints.save(STAGE_METRICS, metrics_dict)
+            logger.info(f"Calculated {len(all_metrics)} metrics")
+        else:
+            all_metrics = {
+                name: MetricResult(
+                    name=name,
+                    value=data['value'],
+                    normalized_score=data['normalized_score'],
+                    optimal_range=tuple(data['optimal_range']),
+                    status=data['status'],
+                    description=data['description']
+                )
+                for name, data in metrics_dict.items()
             }
-            for name, metric in all_metrics.items()
-        }
-        logger.info(f"Calculated {len(all_metrics)} metrics")
 
         # Step 3: Match Teaching Pattern
-        logger.info("Step 3/4: Matching teaching pattern...")
-        pattern_match = self.pattern_matcher.match_pattern(matrix_data)
-
-        # Get all pattern similarities for comparison
-        all_pattern_similarities = self.pattern_matcher.get_all_pattern_similarities(matrix_data)
-
-        pattern_dict = {
-            'best_match': {
-                'pattern_name': pattern_match.pattern_name,
-                'pattern_description': pattern_match.pattern_description,
-                'similarity_score': pattern_match.similarity_score,
-                'match_quality': pattern_match.match_quality,
-                'stage_similarities': pattern_match.stage_similarities,
-                'characteristics': pattern_match.characteristics,
-                'recommendations': pattern_match.recommendations
-            },
-            'all_pattern_similarities': all_pattern_similarities
-        }
-        logger.info(f"Best match: {pattern_match.pattern_name} ({pattern_match.similarity_score:.3f})")
+        pattern_dict = checkpoints.load(STAGE_PATTERN) if checkpoints else None
+        if pattern_dict is None:
+            logger.info("Step 3/4: Matching teaching pattern...")
+            pattern_match = self.pattern_matcher.match_pattern(matrix_data)
+
+            # Get all pattern similarities for comparison
+            all_pattern_similarities = self.pattern_matcher.get_all_pattern_similarities(matrix_data)
+
+            pattern_dict = {
+                'best_match': {
+                    'pattern_name': pattern_match.pattern_name,
+                    'pattern_description': pattern_match.pattern_description,
+                    'similarity_score': pattern_match.similarity_score,
+                    'match_quality': pattern_match.match_quality,
+                    'stage_similarities': pattern_match.stage_similarities,
+                    'characteristics': pattern_match.characteristics,
+                    'recommendations': pattern_match.recommendations
+                },
+                'all_pattern_similarities': all_pattern_similarities
+            }
+            if checkpoints:
+                checkpoints.save(STAGE_PATTERN, pattern_dict)
+            logger.info(f"Best match: {pattern_match.pattern_name} ({pattern_match.similarity_score:.3f})")
 
         # Step 4: Generate Coaching Feedback
-        logger.info("Step 4/4: Generating coaching feedback...")
-        coaching_feedback = await self.coaching_generator.generate_coaching(
-            matrix_data=matrix_result,
-            metrics_data=all_metrics,
-            pattern_match=pattern_dict['best_match'],
-            context=context
-        )
-
-        coaching_dict = self.coaching_generator.to_dict(coaching_feedback)
-        logger.info("Coaching feedback generated")
+        coaching_dict = checkpoints.load(STAGE_COACHING) if checkpoints else None
+        if coaching_dict is None:
+            logger.info("Step 4/4: Generating coaching feedback...")
+            coaching_feedback = await self.coaching_generator.generate_coaching(
+                matrix_data=matrix_result,
+                metrics_data=all_metrics,
+                pattern_match=pattern_dict['best_match'],
+                context=context
+            )
+
+            coaching_dict = self.coaching_generator.to_dict(coaching_feedback)
+            if checkpoints:
+                checkpoints.save(STAGE_COACHING, coaching_dict)
+            logger.info("Coaching feedback generated")
 
         # Calculate processing time
         processing_time = (datetime.now() - start_time).total_seconds()
@@ -246,26 +285,32 @@ class EvaluationService:
     async def evaluate_with_cbil(
         self,
         utterances: List[Dict[str, Any]],
-        cbil_analysis_text: str,
+        cbil_analysis_text: Union[str, Awaitable[str]],
         evaluation_id: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None,
-        include_raw_data: bool = False
+        include_raw_data: bool = False,
+        checkpoints: Optional[StageCheckpointStore] = None
     ):
         """
         Perform comprehensive evaluation with CBIL integration
 
         Workflow:
-        1. Parse CBIL analysis text
-        2. Run standard Module 3 evaluation
+        1. Run standard Module 3 evaluation (concurrently with the CBIL analysis if still running)
+        2. Parse CBIL analysis text
         3. Integrate CBIL with Module 3 results
         4. Generate unified coaching
 
         Args:
             utterances: List of teacher utterances
-            cbil_analysis_text: CBIL 7-stage analysis text from Solar API
+            cbil_analysis_text: CBIL 7-stage analysis text from Solar API, or an awaitable
+                that produces it (e.g. the in-flight Solar API call); only the CBIL
+                integration step waits for it
             evaluation_id: Optional custom evaluation ID
             context: Additional context
             include_raw_data: Include raw classification data
+            checkpoints: Stage checkpoint store (job id + input hash); completed stages
+                (CBIL analysis, matrix, metrics, pattern, coaching) are loaded instead of re-run,
+                and a checkpointed CBIL analysis replaces the awaitable without awaiting it
 
         Returns:
             Enhanced EvaluationResult with CBIL integration
@@ -278,21 +323,53 @@ class EvaluationService:
 
         logger.info(f"Starting CBIL-integrated evaluation {evaluation_id}")
 
-        # Step 1: Parse CBIL analysis
-        logger.info("Step 1/5: Parsing CBIL analysis...")
-        cbil_integrator = CBILIntegration()
-        cbil_result = cbil_integrator.parse_cbil_analysis(cbil_analysis_text)
-        logger.info(f"CBIL total score: {cbil_result.total_score}/{cbil_result.max_total_score}")
-
-        # Step 2-4: Standard Module 3 evaluation
-        logger.info("Step 2-4/5: Running Module 3 evaluation...")
-        base_result = await self.evaluate_teaching(
+        checkpointed_text = checkpoints.load(STAGE_CBIL_ANALYSIS) if checkpoints else None
+        if checkpointed_text is not None:
+            # Don't repeat the CBIL LLM call
+            if inspect.iscoroutine(cbil_analysis_text):
+                cbil_analysis_text.close()
+            elif isinstance(cbil_analysis_text, asyncio.Future):
+                cbil_analysis_text.cancel()
+            cbil_analysis_text = checkpointed_text
+
+        # Step 1-4: Standard Module 3 evaluation (matrix → metrics → pattern → coaching)
+        # runs concurrently with the CBIL analysis; neither depends on the other
+        logger.info("Step 1-4/5: Running Module 3 evaluation...")
+        evaluation_task = asyncio.ensure_future(self.evaluate_teaching(
             utterances=utterances,
             evaluation_id=evaluation_id,
             context=context,
-            include_raw_data=include_raw_data
+            include_raw_data=include_raw_data,
+            checkpoints=checkpoints
+        ))
+        cbil_text_task = (
+            asyncio.ensure_future(cbil_analysis_text)
+            if inspect.isawaitable(cbil_analysis_text) else None
         )
 
+        async def cbil_analysis() -> str:
+            text = await cbil_text_task
+            if checkpoints:
+                checkpoints.save(STAGE_CBIL_ANALYSIS, text)
+            return text
+
+        try:
+            if cbil_text_task is not None:
+                cbil_analysis_text, base_result = await asyncio.gather(cbil_analysis(), evaluation_task)
+            else:
+                base_result = await evaluation_task
+        except BaseException:
+            # One branch failed (or the job was cancelled): don't leave the other running
+            for task in (evaluation_task, cbil_text_task):
+                if task is not None and not task.done():
+                    task.cancel()
+            raise
+
+        # Parse CBIL analysis
+        cbil_integrator = CBILIntegration()
+        cbil_result = cbil_integrator.parse_cbil_analysis(cbil_analysis_text)
+        logger.info(f"CBIL total score: {cbil_result.total_score}/{cbil_result.max_total_score}")
+
         # Step 5: Integrate CBIL with Module 3
         logger.info("Step 5/5: Integrating CBIL with Module 3...")
 
@@ -348,7 +425,8 @@ class EvaluationService:
                 'cbil_percentage': cbil_result.overall_percentage,
                 'context': context
             },
-            processing_time=processing_time
+            processing_time=processing_time,
+            cbil_analysis_text=cbil_analysis_text
         )
 
         logger.info(f"CBIL-integrated evaluation {evaluation_id} completed in {processing_time:.2f}s")
@@ -360,8 +438,6 @@ class EvaluationService:
 # ============ Demo/Test Code ============
 
 if __name__ == "__main__":
-    import asyncio
-
     print("=" * 60)
     print("Evaluation Service Demo")
     print("=" * 60)
@@ -0,0 +1,481 @@
+"""
+Fused Classifier
+수업 단계(Stage) + 맥락(Context) + 인지 수준(Level) 체크리스트를 발화당 1회 호출로 통합 실행
+
+각 분류기의 체크리스트(checklists/*.yaml)를 하나의 structured-output 프롬프트로 묶고,
+응답을 차원별로 분리한 뒤 기존 분류기의 결정 로직(_make_classification_decision,
+_make_tagging_decision)을 그대로 적용한다. 결과 형식은 개별 분류기와 동일하다.
+
+FAST_RULES_MODE도 개별 분류기와 같이 동작한다: 단계/맥락 fast_rules로 결정되는 발화는 해당 차원만
+규칙 결과로 교체하고(on), shadow 모드에서는 일치율을 집계한다. 인지 수준에는 규칙이 없으므로
+통합 호출 자체는 생략되지 않는다.
+"""
+
+import logging
+from typing import Dict, List, Any, Optional, Tuple
+
+from core.stage_classifier import StageClassifier
+from core.context_tagger import ContextTagger
+from core.level_classifier import LevelClassifier
+from services.openai_service import OpenAIService
+from utils.semantic_cache import SemanticCache, compute_fingerprint, utterance_cache_context
+from utils.fast_rules import DECISION_SOURCE_LLM
+from utils.concurrency import gather_bounded
+from utils.checkpoint_store import ClassificationProgress, PASS_FUSED
+
+logger = logging.getLogger(__name__)
+
+
+FUSED_PROMPT_TEMPLATE = """다음은 교사의 수업 발화입니다. 이 발화의 수업 단계, 수업 맥락, 인지 수준을 한 번에 분류하기 위한 체크리스트입니다.
+
+**주의사항:**
+- 각 체크리스트 그룹은 서로 독립적으로 평가하세요.
+- 하나의 발화가 여러 맥락을 동시에 가질 수 있습니다.
+- 각 질문에 대해 "Yes" 또는 "No"로만 답변하세요.
+
+**발화 내용:**
+"{utterance}"
+
+**발화 맥락:**
+- 발화 시간: {timestamp}
+- 이전 발화: "{previous_utterance}"
+- 다음 발화: "{next_utterance}"
+
+**인지 수준 기준:**
+- L1 (기억/이해): 사실 기억, 개념 이해
+- L2 (적용/분석): 지식 적용, 요소 분석
+- L3 (종합/평가): 창의적 종합, 비판적 평가
+
+{checklist_sections}
+
+모든 질문 ID(총 {total_keys}개)에 대한 답변을 다음 형식의 하나의 JSON으로 제공하세요:
+{answer_format}
+
+추가 설명 없이 JSON 형식으로만 답변하세요.
+"""
+
+
+class FusedClassifier:
+    """Stage + Context + Level 통합 분류기 (발화당 1회 체크리스트 호출)"""
+
+    STAGE_NAMES = ["introduction", "development", "closing"]
+    CONTEXT_NAMES = ["explanation", "question", "feedback", "facilitation", "management"]
+    LEVEL_NAMES = ["L1", "L2", "L3"]
+
+    def __init__(
+        self,
+        stage_classifier: StageClassifier,
+        context_tagger: ContextTagger,
+        level_classifier: LevelClassifier,
+        openai_service: Optional[OpenAIService] = None,
+        semantic_cache: Optional[SemanticCache] = None
+    ):
+        """
+        Args:
+            stage_classifier: 결정 로직/체크리스트를 제공할 StageClassifier
+            context_tagger: 결정 로직/체크리스트를 제공할 ContextTagger
+            level_classifier: 결정 로직/체크리스트를 제공할 LevelClassifier
+            openai_service: OpenAI 서비스 인스턴스 (기본값: stage_classifier의 서비스)
+            semantic_cache: Semantic cache 인스턴스 (통합 프롬프트 결과는 개별 분류기와 별도 타입에 저장)
+        """
+        self.stage_classifier = stage_classifier
+        self.context_tagger = context_tagger
+        self.level_classifier = level_classifier
+        self.openai_service = openai_service or stage_classifier.openai_service
+        self.semantic_cache = semantic_cache
+
+        # (classifier_type, 그룹 이름, 표시 이름, 체크리스트 키) 목록
+        self.groups: List[Tuple[str, str, str, List[str]]] = []
+        for name in self.STAGE_NAMES:
+            self.groups.append((
+                "stage", name, stage_classifier.stages[name]["name"],
+                stage_classifier._get_expected_keys(name)
+            ))
+        for name in self.CONTEXT_NAMES:
+            self.groups.append((
+                "context", name, context_tagger.contexts[name]["name"],
+                context_tagger._get_expected_keys(name)
+            ))
+        for name in self.LEVEL_NAMES:
+            self.groups.append((
+                "level", name, level_classifier.levels[name]["name"],
+                level_classifier._get_expected_keys(name)
+            ))
+
+        self.expected_keys = [key for _, _, _, keys in self.groups for key in keys]
+        self.checklist_sections = self._build_checklist_sections()
+
+        # 통합 프롬프트 결과는 개별 분류기의 프롬프트와 다르므로 별도 타입({type}_fused, 배치 모드는
+        # {type}_fused_batch)에 저장하고, 통합 템플릿/체크리스트/개별 분류기 fingerprint를 키에 포함
+        self.cache_fingerprint = compute_fingerprint(
+            FUSED_PROMPT_TEMPLATE,
+            self.checklist_sections,
+            stage_classifier.cache_fingerprint,
+            context_tagger.cache_fingerprint,
+            level_classifier.cache_fingerprint,
+            self.openai_service.model
+        )
+        self.cache_types = {name: f"{name}_fused" for name in self.CLASSIFIER_TYPES}
+        self.batch_cache_types = {name: f"{name}_fused_batch" for name in self.CLASSIFIER_TYPES}
+        if semantic_cache:
+            for name in self.CLASSIFIER_TYPES:
+                semantic_cache.register_fingerprint(self.cache_types[name], self.cache_fingerprint)
+            if self.openai_service.batch_size > 1:
+                batch_fingerprint = compute_fingerprint(
+                    self.cache_fingerprint, self.openai_service.batch_prompt_fingerprint()
+                )
+                for name in self.CLASSIFIER_TYPES:
+                    semantic_cache.register_fingerprint(self.batch_cache_types[name], batch_fingerprint)
+
+        logger.info(
+            "Fused Classifier initialized: %d checklist groups, %d keys per call (caching: %s)",
+            len(self.groups), len(self.expected_keys),
+            "enabled" if semantic_cache else "disabled"
+        )
+
+    def _build_checklist_sections(self) -> str:
+        """세 분류기의 체크리스트 항목을 차원별 섹션으로 변환"""
+        dimension_titles = {
+            "stage": "1. 수업 단계 (도입/전개/정리)",
+            "context": "2. 수업 맥락 (복수 선택 가능)",
+            "level": "3. 인지 수준"
+        }
+        item_builders = {
+            "stage": self.stage_classifier._build_checklist_items,
+            "context": self.context_tagger._build_checklist_items,
+            "level": self.level_classifier._build_checklist_items
+        }
+
+        sections = []
+        current_dimension = None
+        for dimension, name, display_name, _ in self.groups:
+            if dimension != current_dimension:
+                sections.append(f"## {dimension_titles[dimension]}")
+                current_dimension = dimension
+            sections.append(f"**체크리스트 ({display_name}):**\n{item_builders[dimension](name)}")
+
+        return "\n\n".join(sections)
+
+    def _build_prompt(
+        self,
+        utterance: str,
+        timestamp: Optional[str] = None,
+        previous_utterance: Optional[str] = None,
+        next_utterance: Optional[str] = None
+    ) -> str:
+        """통합 체크리스트 프롬프트 생성"""
+        answer_lines = ",\n".join(f'  "{key}": "Yes/No"' for key in self.expected_keys)
+
+        return FUSED_PROMPT_TEMPLATE.format(
+            utterance=utterance,
+            timestamp=timestamp or "N/A",
+            previous_utterance=previous_utterance or "N/A",
+            next_utterance=next_utterance or "N/A",
+            checklist_sections=self.checklist_sections,
+            total_keys=len(self.expected_keys),
+            answer_format="{\n" + answer_lines + "\n}"
+        )
+
+    def _split_voting_result(self, voting_result: Dict[str, Any]) -> Dict[str, Dict[str, Dict]]:
+        """
+        통합 다수결 결과를 체크리스트 그룹별 결과로 분리
+
+        Returns:
+            {"stage": {"introduction": {...}, ...}, "context": {...}, "level": {...}}
+            각 그룹 결과는 execute_checklist_with_majority_voting 형식 + yes_count
+        """
+        split = {"stage": {}, "context": {}, "level": {}}
+
+        for dimension, name, _, keys in self.groups:
+            group_runs = [
+                {key: run.get(key, "No") for key in keys}
+                for run in voting_result["raw_runs"]
+            ]
+            group_result = self.openai_service.aggregate_votes(group_runs, keys)
+            yes_count = self.openai_service.count_yes_responses(group_result["results"])
+            split[dimension][name] = {**group_result, "yes_count": yes_count}
+
+        return split
+
+    def _build_results(self, checklist_results: Dict[str, Dict[str, Dict]]) -> Dict[str, Dict[str, Any]]:
+        """각 분류기의 결정 로직을 적용하여 개별 분류기와 동일한 형식의 결과 생성"""
+        stage_decision = self.stage_classifier._make_classification_decision(checklist_results["stage"])
+        context_decision = self.context_tagger._make_tagging_decision(checklist_results["context"])
+        level_decision = self.level_classifier._make_classification_decision(checklist_results["level"])
+
+        return {
+            "stage": {
+                "stage": stage_decision["stage"],
+                "confidence": stage_decision["confidence"],
+                "checklist_results": checklist_results["stage"],
+                "decision_reason": stage_decision["reason"],
+                "decision_source": DECISION_SOURCE_LLM
+            },
+            "context": {
+                "contexts": context_decision["contexts"],
+                "context_scores": context_decision["scores"],
+                "checklist_results": checklist_results["context"],
+                "primary_context": context_decision["primary_context"],
+                "decision_source": DECISION_SOURCE_LLM
+            },
+            "level": {
+                "level": level_decision["level"],
+                "confidence": level_decision["confidence"],
+                "checklist_results": checklist_results["level"],
+                "decision_reason": level_decision["reason"],
+                "decision_source": DECISION_SOURCE_LLM
+            }
+        }
+
+    CLASSIFIER_TYPES = ["stage", "context", "level"]
+
+    def _apply_fast_rules(self, utterance: str, results: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        단계/맥락 분류기의 fast_rules 적용 (캐시에는 통합 호출 결과만 저장하고, 규칙은 조회 후 적용)
+
+        on 모드에서 규칙으로 결정되는 차원은 규칙 결과로 교체, shadow 모드에서는 LLM 결과에 규칙 결정 기록
+        """
+        results = dict(results)
+        for classifier_type, classifier in (("stage", self.stage_classifier), ("context", self.context_tagger)):
+            rule_result = classifier._apply_fast_rules(utterance)
+            if rule_result is not None:
+                results[classifier_type] = rule_result
+            else:
+                classifier._record_fast_rule_shadow(utterance, results[classifier_type])
+        return results
+
+    def _get_cached(self, utterance: str, context: Dict[str, Any]) -> Optional[Dict[str, Dict[str, Any]]]:
+        """세 분류기 결과가 모두 캐시에 있으면 반환"""
+        return self._get_cached_many([(utterance, context)])[0]
+
+    def _get_cached_many(
+        self,
+        lookups: List[Tuple[str, Dict[str, Any]]],
+        cache_types: Optional[Dict[str, str]] = None
+    ) -> List[Optional[Dict[str, Dict[str, Any]]]]:
+        """
+        여러 발화의 세 분류기 결과를 MGET 1회로 조회
+
+        Args:
+            lookups: [(utterance_text, context), ...]
+            cache_types: 분류기별 캐시 타입 (기본값: self.cache_types, 배치 결과는 self.batch_cache_types)
+
+        Returns:
+            발화별로 세 결과가 모두 캐시에 있으면 {"stage": ..., "context": ..., "level": ...}, 아니면 None
+        """
+        if not self.semantic_cache:
+            return [None] * len(lookups)
+
+        cache_types = cache_types or self.cache_types
+        cached = self.semantic_cache.get_many([
+            (utterance, cache_types[classifier_type], context)
+            for utterance, context in lookups
+            for classifier_type in self.CLASSIFIER_TYPES
+        ])
+
+        results = []
+        for index in range(len(lookups)):
+            group = cached[index * 3:index * 3 + 3]
+            if any(result is None for result in group):
+                results.append(None)
+            else:
+                results.append(dict(zip(self.CLASSIFIER_TYPES, group)))
+
+        return results
+
+    def _set_cached(self, utterance: str, context: Dict[str, Any], results: Dict[str, Dict[str, Any]]):
+        """통합 분류 결과 저장 ({type}_fused 타입)"""
+        self._set_cached_many([(utterance, context, results)])
+
+    def _set_cached_many(
+        self,
+        entries: List[Tuple[str, Dict[str, Any], Dict[str, Dict[str, Any]]]],
+        cache_types: Optional[Dict[str, str]] = None
+    ):
+        """여러 발화의 결과를 파이프라인 1회로 저장 (cache_types: _get_cached_many와 동일)"""
+        if not self.semantic_cache:
+            return
+
+        cache_types = cache_types or self.cache_types
+        self.semantic_cache.set_many([
+            (utterance, cache_types[classifier_type], result, context)
+            for utterance, context, results in entries
+            for classifier_type, result in results.items()
+        ])
+
+    async def classify_single_utterance(
+        self,
+        utterance: str,
+        timestamp: Optional[str] = None,
+        previous_utterance: Optional[str] = None,
+        next_utterance: Optional[str] = None,
+        apply_fast_rules: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        단일 발화의 단계/맥락/수준 통합 분류
+
+        Args:
+            apply_fast_rules: 단계/맥락 fast_rules 적용 (호출자가 직접 적용하면 False)
+
+        Returns:
+            {
+                "stage": StageClassifier.classify_single_utterance 형식,
+                "context": ContextTagger.tag_single_utterance 형식,
+                "level": LevelClassifier.classify_single_utterance 형식
+            }
+        """
+        logger.info(f"Fused classification: {utterance[:50]}...")
+
+        context = {
+            "timestamp": timestamp,
+            "has_previous": previous_utterance is not None,
+            "has_next": next_utterance is not None
+        }
+
+        results = self._get_cached(utterance, context)
+        if results:
+            logger.info("✓ Using cached stage/context/level classification")
+        else:
+            prompt = self._build_prompt(utterance, timestamp, previous_utterance, next_utterance)
+            voting_result = await self.openai_service.execute_checklist_with_majority_voting(
+                prompt=prompt,
+                expected_keys=self.expected_keys
+            )
+
+            results = self._build_results(self._split_voting_result(voting_result))
+            self._set_cached(utterance, context, results)
+
+        if apply_fast_rules:
+            results = self._apply_fast_rules(utterance, results)
+        return results
+
+    async def classify_multiple_utterances(
+        self,
+        utterances: List[Dict[str, Any]],
+        progress: Optional[ClassificationProgress] = None
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        여러 발화를 통합 분류
+
+        Args:
+            utterances: [{"text": "...", "timestamp": "...", "id": "..."}, ...]
+            progress: 발화별 분류 checkpoint (이전 실행에서 완료된 발화는 건너뛰고, 완료되는 발화를 기록)
+
+        Returns:
+            (stage_results, context_results, level_results)
+            각각 classify_multiple_utterances / tag_multiple_utterances와 동일한 형식
+        """
+        logger.info(f"Fused classification of {len(utterances)} utterances")
+
+        # 캐시 일괄 조회 (MGET 1회), miss인 발화만 LLM으로 전송
+        cache_types = self.batch_cache_types if self.openai_service.batch_size > 1 else self.cache_types
+        cached_results = self._get_cached_many([
+            (utterance["text"], utterance_cache_context(utterances, i))
+            for i, utterance in enumerate(utterances)
+        ], cache_types)
+
+        # 이전 실행(재시도)에서 이미 분류된 발화 (fast_rules 적용 완료)
+        resumed = set()
+        if progress:
+            for i, results in progress.completed(PASS_FUSED).items():
+                cached_results[i] = results
+                resumed.add(i)
+
+        # 배치 모드: 여러 발화의 통합 프롬프트를 한 번에 묶어서 실행
+        batched_results = None
+        if self.openai_service.batch_size > 1:
+            batched_results = await self._classify_utterances_batched(utterances, cached_results)
+
+        async def classify_one(i: int, utterance: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+            if batched_results is not None:
+                results = batched_results[i]
+            elif cached_results[i] is not None:
+                results = cached_results[i]
+            else:
+                prev_text = utterances[i-1]["text"] if i > 0 else None
+                next_text = utterances[i+1]["text"] if i < len(utterances)-1 else None
+
+                results = await self.classify_single_utterance(
+                    utterance=utterance["text"],
+                    timestamp=utterance.get("timestamp"),
+                    previous_utterance=prev_text,
+                    next_utterance=next_text,
+                    apply_fast_rules=False
+                )
+
+            if i not in resumed:
+                results = self._apply_fast_rules(utterance["text"], results)
+
+            for result in results.values():
+                result["utterance_id"] = utterance.get("id")
+                result["utterance_text"] = utterance["text"]
+
+            logger.info(
+                f"[{i+1}/{len(utterances)}] {utterance.get('id')}: "
+                f"{results['stage']['stage']} × {', '.join(results['context']['contexts'])} × "
+                f"{results['level']['level']}"
+            )
+
+            if progress:
+                progress.record(PASS_FUSED, i, results)
+            return results
+
+        # 동시 실행 수는 StageClassifier 설정을 따름 (결과 순서 유지)
+        all_results = await gather_bounded(utterances, classify_one, self.stage_classifier.max_concurrency)
+
+        stage_results = [results["stage"] for results in all_results]
+        context_results = [results["context"] for results in all_results]
+        level_results = [results["level"] for results in all_results]
+
+        return stage_results, context_results, level_results
+
+    async def _classify_utterances_batched(
+        self,
+        utterances: List[Dict[str, Any]],
+        cached_results: Optional[List[Optional[Dict[str, Dict[str, Any]]]]] = None
+    ) -> List[Dict[str, Dict[str, Any]]]:
+        """배치 모드 통합 분류 (openai_service.batch_size > 1), 입력 순서 유지"""
+        if cached_results is None:
+            cached_results = self._get_cached_many([
+                (utterance["text"], utterance_cache_context(utterances, i))
+                for i, utterance in enumerate(utterances)
+            ], self.batch_cache_types)
+
+        results: List[Optional[Dict[str, Dict[str, Any]]]] = [None] * len(utterances)
+        pending = []
+        items = []
+
+        for i, utterance in enumerate(utterances):
+            prev_text = utterances[i-1]["text"] if i > 0 else None
+            next_text = utterances[i+1]["text"] if i < len(utterances)-1 else None
+            context = {
+                "timestamp": utterance.get("timestamp"),
+                "has_previous": prev_text is not None,
+                "has_next": next_text is not None
+            }
+
+            if cached_results[i] is not None:
+                results[i] = cached_results[i]
+                continue
+
+            pending.append((i, context))
+            items.append({
+                "prompt": self._build_prompt(utterance["text"], utterance.get("timestamp"), prev_text, next_text),
+                "expected_keys": self.expected_keys
+            })
+
+        if not items:
+            return results
+
+        voting_results = await self.openai_service.batch_execute_checklists(items)
+
+        for (i, context), voting_result in zip(pending, voting_results):
+            results[i] = self._build_results(self._split_voting_result(voting_result))
+
+        # 새 결과를 파이프라인 1회로 저장
+        self._set_cached_many([
+            (utterances[i]["text"], context, results[i])
+            for i, context in pending
+        ], self.batch_cache_types)
+
+        return results
@@ -10,7 +10,9 @@ from typing import Dict, List, Any, Optional
 from pathlib import Path
 
 from services.openai_service import OpenAIService
-from utils.semantic_cache import SemanticCache
+from utils.semantic_cache import SemanticCache, compute_fingerprint
+from utils.concurrency import gather_bounded, get_default_concurrency
+from utils.checkpoint_store import ClassificationProgress, PASS_LEVEL
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +24,8 @@ class LevelClassifier:
         self,
         checklist_path: Optional[str] = None,
         openai_service: Optional[OpenAIService] = None,
-        semantic_cache: Optional[SemanticCache] = None
+        semantic_cache: Optional[SemanticCache] = None,
+        max_concurrency: Optional[int] = None
     ):
         if checklist_path is None:
             current_dir = Path(__file__).parent.parent
@@ -37,6 +40,20 @@ class LevelClassifier:
         self.openai_service = openai_service or OpenAIService()
         self.semantic_cache = semantic_cache
 
+        # 체크리스트(프롬프트/결정 규칙 포함)나 모델이 바뀌면 캐시 키도 바뀜 (이전 결과 재사용 방지)
+        self.cache_fingerprint = compute_fingerprint(self.config, self.openai_service.model)
+        # 배치 모드 결과는 묶음 프롬프트로 만들어지므로 별도 타입(level_batch)과 fingerprint로 저장
+        self.batch_cache_type = "level_batch"
+        if self.semantic_cache:
+            self.semantic_cache.register_fingerprint("level", self.cache_fingerprint)
+            if self.openai_service.batch_size > 1:
+                self.semantic_cache.register_fingerprint(
+                    self.batch_cache_type,
+                    compute_fingerprint(self.cache_fingerprint, self.openai_service.batch_prompt_fingerprint())
+                )
+
+        self.max_concurrency = max_concurrency or get_default_concurrency()
+
         logger.info("Level Classifier initialized (caching: %s)", "enabled" if semantic_cache else "disabled")
 
     def _build_checklist_items(self, level_name: str) -> str:
@@ -188,27 +205,125 @@ class LevelClassifier:
 
     async def classify_multiple_utterances(
         self,
-        utterances: List[Dict[str, Any]]
+        utterances: List[Dict[str, Any]],
+        progress: Optional[ClassificationProgress] = None
     ) -> List[Dict[str, Any]]:
         logger.info(f"Classifying {len(utterances)} utterances for cognitive level")
 
-        results = []
-        for i, utterance in enumerate(utterances):
-            prev_text = utterances[i-1]["text"] if i > 0 else None
-            next_text = utterances[i+1]["text"] if i < len(utterances)-1 else None
+        # 캐시 일괄 조회 (MGET 1회), miss인 발화만 LLM으로 전송
+        cache_type = self.batch_cache_type if self.openai_service.batch_size > 1 else "level"
+        cached_results = (
+            self.semantic_cache.prefetch(utterances, cache_type)
+            if self.semantic_cache else [None] * len(utterances)
+        )
 
-            result = await self.classify_single_utterance(
-                utterance["text"],
-                utterance.get("timestamp"),
-                prev_text,
-                next_text
-            )
+        # 이전 실행(재시도)에서 이미 분류된 발화
+        if progress:
+            for i, result in progress.completed(PASS_LEVEL).items():
+                cached_results[i] = result
+
+        batched_results = None
+        if self.openai_service.batch_size > 1:
+            batched_results = await self._classify_utterances_batched(utterances, cached_results)
+
+        async def classify_one(i: int, utterance: Dict[str, Any]) -> Dict[str, Any]:
+            if batched_results is not None:
+                result = batched_results[i]
+            elif cached_results[i] is not None:
+                result = cached_results[i]
+            else:
+                prev_text = utterances[i-1]["text"] if i > 0 else None
+                next_text = utterances[i+1]["text"] if i < len(utterances)-1 else None
+
+                result = await self.classify_single_utterance(
+                    utterance["text"],
+                    utterance.get("timestamp"),
+                    prev_text,
+                    next_text
+                )
 
             result["utterance_id"] = utterance.get("id")
             result["utterance_text"] = utterance["text"]
-            results.append(result)
 
             logger.info(f"[{i+1}/{len(utterances)}] {result['utterance_id']}: {result['level']} (conf={result['confidence']})")
+            if progress:
+                progress.record(PASS_LEVEL, i, result)
+            return result
+
+        return await gather_bounded(utterances, classify_one, self.max_concurrency)
+
+    async def _classify_utterances_batched(
+        self,
+        utterances: List[Dict[str, Any]],
+        cached_results: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> List[Dict[str, Any]]:
+        """배치 모드 분류 (openai_service.batch_size > 1), 입력 순서 유지"""
+        if cached_results is None:
+            cached_results = (
+                self.semantic_cache.prefetch(utterances, self.batch_cache_type)
+                if self.semantic_cache else [None] * len(utterances)
+            )
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(utterances)
+        pending = []
+
+        for i, utterance in enumerate(utterances):
+            prev_text = utterances[i-1]["text"] if i > 0 else None
+            next_text = utterances[i+1]["text"] if i < len(utterances)-1 else None
+            context = {
+                "timestamp": utterance.get("timestamp"),
+                "has_previous": prev_text is not None,
+                "has_next": next_text is not None
+            }
+
+            if cached_results[i] is not None:
+                results[i] = cached_results[i]
+                continue
+
+            pending.append((i, prev_text, next_text, context))
+
+        if not pending:
+            return results
+
+        checklist_results = {i: {} for i, _, _, _ in pending}
+
+        for level_name in ["L1", "L2", "L3"]:
+            expected_keys = self._get_expected_keys(level_name)
+            items = [
+                {
+                    "prompt": self._build_prompt(
+                        utterances[i]["text"], level_name, utterances[i].get("timestamp"),
+                        prev_text, next_text
+                    ),
+                    "expected_keys": expected_keys
+                }
+                for i, prev_text, next_text, _ in pending
+            ]
+
+            level_results = await self.openai_service.batch_execute_checklists(items)
+
+            for (i, _, _, _), result in zip(pending, level_results):
+                yes_count = self.openai_service.count_yes_responses(result["results"])
+                checklist_results[i][level_name] = {**result, "yes_count": yes_count}
+
+        for i, _, _, context in pending:
+            decision = self._make_classification_decision(checklist_results[i])
+
+            result = {
+                "level": decision["level"],
+                "confidence": decision["confidence"],
+                "checklist_results": checklist_results[i],
+                "decision_reason": decision["reason"]
+            }
+
+            results[i] = result
+
+        # 새 결과를 파이프라인 1회로 저장
+        if self.semantic_cache:
+            self.semantic_cache.set_many([
+                (utterances[i]["text"], self.batch_cache_type, results[i], context)
+                for i, _, _, context in pending
+            ])
 
         return results
 
@@ -3,6 +3,9 @@
 시간(Stage) × 맥락(Context) × 수준(Level) 3차원 매트릭스 생성
 """
 
+import os
+import time
+import asyncio
 import logging
 from typing import Dict, List, Any, Optional
 import numpy as np
@@ -10,8 +13,12 @@ import numpy as np
 from core.stage_classifier import StageClassifier
 from core.context_tagger import ContextTagger
 from core.level_classifier import LevelClassifier
+from core.fused_classifier import FusedClassifier
 from services.openai_service import OpenAIService
 from utils.semantic_cache import SemanticCache
+from utils.checkpoint_store import (
+    StageCheckpointStore, PASS_STAGE, PASS_CONTEXT, PASS_LEVEL, PASS_FUSED
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +32,9 @@ class MatrixBuilder:
         context_tagger: Optional[ContextTagger] = None,
         level_classifier: Optional[LevelClassifier] = None,
         openai_service: Optional[OpenAIService] = None,
-        semantic_cache: Optional[SemanticCache] = None
+        semantic_cache: Optional[SemanticCache] = None,
+        fused_classification: Optional[bool] = None,
+        concurrent_passes: Optional[bool] = None
     ):
         """
         Args:
@@ -34,6 +43,11 @@ class MatrixBuilder:
             level_classifier: Optional LevelClassifier instance
             openai_service: Optional OpenAIService instance
             semantic_cache: Optional SemanticCache for consistency guarantee
+            fused_classification: Stage/Context/Level 체크리스트를 발화당 1회 호출로 통합 실행
+                                  (기본값: 환경변수 MATRIX_FUSED_CLASSIFICATION, false)
+            concurrent_passes: Stage/Context/Level 분류 패스를 동시에 실행
+                               (기본값: 환경변수 MATRIX_CONCURRENT_PASSES, true)
+                               세 패스는 openai_service의 동시 요청 예산(max_concurrent_requests)을 공유
         """
         self.openai_service = openai_service or OpenAIService()
         self.semantic_cache = semantic_cache
@@ -52,15 +66,35 @@ class MatrixBuilder:
             semantic_cache=self.semantic_cache
         )
 
+        if fused_classification is None:
+            fused_classification = os.getenv("MATRIX_FUSED_CLASSIFICATION", "false").lower() == "true"
+
+        if concurrent_passes is None:
+            concurrent_passes = os.getenv("MATRIX_CONCURRENT_PASSES", "true").lower() == "true"
+        self.concurrent_passes = concurrent_passes
+
+        self.fused_classifier = None
+        if fused_classification:
+            self.fused_classifier = FusedClassifier(
+                stage_classifier=self.stage_classifier,
+                context_tagger=self.context_tagger,
+                level_classifier=self.level_classifier,
+                openai_service=self.openai_service,
+                semantic_cache=self.semantic_cache
+            )
+
         logger.info(
-            "3D Matrix Builder initialized (caching: %s)",
-            "enabled" if semantic_cache else "disabled"
+            "3D Matrix Builder initialized (caching: %s, fused: %s, concurrent passes: %s)",
+            "enabled" if semantic_cache else "disabled",
+            "enabled" if self.fused_classifier else "disabled",
+            "enabled" if self.concurrent_passes else "disabled"
         )
 
     async def build_3d_matrix(
         self,
         utterances: List[Dict[str, Any]],
-        include_raw_data: bool = False
+        include_raw_data: bool = False,
+        checkpoints: Optional[StageCheckpointStore] = None
     ) -> Dict[str, Any]:
         """
         발화 리스트로부터 3D 매트릭스 구축
@@ -68,6 +102,8 @@ class MatrixBuilder:
         Args:
             utterances: [{"text": "...", "timestamp": "...", "id": "..."}, ...]
             include_raw_data: 원본 분류 결과 포함 여부
+            checkpoints: 작업 checkpoint (발화별 분류 결과를 완료 즉시 기록하고, 재시도 시 완료된 발화는
+                         건너뜀, 진행률은 checkpoints.on_progress로 보고)
 
         Returns:
             {
@@ -110,7 +146,17 @@ class MatrixBuilder:
                     "total_utterances": 100,
                     "stage_stats": {...},
                     "context_stats": {...},
-                    "level_stats": {...}
+                    "level_stats": {...},
+                    "timing": {
+                        "mode": "concurrent" | "sequential" | "fused",
+                        "passes": {"stage": 12.3, "context": 15.1, "level": 11.8},  # 초
+                        "classification_seconds": 15.1  # 분류 단계 wall-clock
+                    },
+                    "llm": {
+                        # 사용 가능한 provider가 없어 체크리스트 답을 "No"로 대체한 호출 수
+                        # (0이 아니면 일부 분류는 실제 LLM 판단이 아님)
+                        "degraded_calls": 0
+                    }
                 },
                 "raw_classifications": {  # include_raw_data=True인 경우에만
                     "stage_results": [...],
@@ -122,14 +168,68 @@ class MatrixBuilder:
         logger.info(f"Building 3D matrix from {len(utterances)} utterances")
 
         # 1. 모든 분류기 실행
-        logger.info("Step 1/4: Classifying stages...")
-        stage_results = await self.stage_classifier.classify_multiple_utterances(utterances)
-
-        logger.info("Step 2/4: Tagging contexts...")
-        context_results = await self.context_tagger.tag_multiple_utterances(utterances)
-
-        logger.info("Step 3/4: Classifying cognitive levels...")
-        level_results = await self.level_classifier.classify_multiple_utterances(utterances)
+        classification_start = time.perf_counter()
+        pass_timings: Dict[str, float] = {}
+        degraded_before = self.openai_service.degraded_calls
+
+        passes = [PASS_FUSED] if self.fused_classifier else [PASS_STAGE, PASS_CONTEXT, PASS_LEVEL]
+        progress = checkpoints.classification_progress(passes, len(utterances)) if checkpoints else None
+
+        async def timed_pass(name: str, coro):
+            pass_start = time.perf_counter()
+            pass_result = await coro
+            pass_timings[name] = round(time.perf_counter() - pass_start, 2)
+            logger.info(f"{name} pass completed in {pass_timings[name]:.2f}s")
+            if progress:
+                progress.finish_pass(name)
+            return pass_result
+
+        if self.fused_classifier:
+            timing_mode = "fused"
+            logger.info("Step 1-3/4: Classifying stages, contexts and levels (fused)...")
+            stage_results, context_results, level_results = await timed_pass(
+                PASS_FUSED, self.fused_classifier.classify_multiple_utterances(utterances, progress)
+            )
+        elif self.concurrent_passes:
+            # 세 패스는 서로 독립적이므로 동시에 실행 (동시 요청 수는 openai_service 예산으로 제한)
+            timing_mode = "concurrent"
+            logger.info("Step 1-3/4: Classifying stages, contexts and levels concurrently...")
+            pass_tasks = [
+                asyncio.ensure_future(timed_pass(
+                    PASS_STAGE, self.stage_classifier.classify_multiple_utterances(utterances, progress)
+                )),
+                asyncio.ensure_future(timed_pass(
+                    PASS_CONTEXT, self.context_tagger.tag_multiple_utterances(utterances, progress)
+                )),
+                asyncio.ensure_future(timed_pass(
+                    PASS_LEVEL, self.level_classifier.classify_multiple_utterances(utterances, progress)
+                ))
+            ]
+            try:
+                stage_results, context_results, level_results = await asyncio.gather(*pass_tasks)
+            except BaseException:
+                # 한 패스가 실패하면 나머지 패스도 중단 (LLM 호출 낭비 방지, 완료된 발화는 checkpoint로 재사용)
+                for task in pass_tasks:
+                    task.cancel()
+                raise
+        else:
+            timing_mode = "sequential"
+            logger.info("Step 1/4: Classifying stages...")
+            stage_results = await timed_pass(
+                PASS_STAGE, self.stage_classifier.classify_multiple_utterances(utterances, progress)
+            )
+
+            logger.info("Step 2/4: Tagging contexts...")
+            context_results = await timed_pass(
+                PASS_CONTEXT, self.context_tagger.tag_multiple_utterances(utterances, progress)
+            )
+
+            logger.info("Step 3/4: Classifying cognitive levels...")
+            level_results = await timed_pass(
+                PASS_LEVEL, self.level_classifier.classify_multiple_utterances(utterances, progress)
+            )
+
+        classification_seconds = round(time.perf_counter() - classification_start, 2)
 
         # 2. 3D 데이터 구축
         logger.info("Step 4/4: Building matrix...")
@@ -147,6 +247,15 @@ class MatrixBuilder:
             level_results,
             matrix_data
         )
+        statistics["timing"] = {
+            "mode": timing_mode,
+            "passes": pass_timings,
+            "classification_seconds": classification_seconds
+        }
+        degraded_calls = self.openai_service.degraded_calls - degraded_before
+        statistics["llm"] = {"degraded_calls": degraded_calls}
+        if degraded_calls:
+            logger.warning(f"{degraded_calls} checklist calls degraded to 'No' answers (no healthy LLM provider)")
 
         result = {
             "matrix": matrix_data,
@@ -423,5 +532,4 @@ async def test_matrix_builder():
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(test_matrix_builder())
@@ -10,7 +10,14 @@ from typing import Dict, List, Any, Optional
 from pathlib import Path
 
 from services.openai_service import OpenAIService
-from utils.semantic_cache import SemanticCache
+from utils.semantic_cache import SemanticCache, compute_fingerprint
+from utils.concurrency import gather_bounded, get_default_concurrency
+from core.stage_smoother import StageSmoother, DECISION_SOURCE_HMM
+from utils.checkpoint_store import ClassificationProgress, PASS_STAGE
+from utils.fast_rules import (
+    FastRuleEngine, get_fast_rules_mode,
+    MODE_ON, MODE_SHADOW, MODE_OFF, DECISION_SOURCE_RULE, DECISION_SOURCE_LLM
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,13 +29,18 @@ class StageClassifier:
         self,
         checklist_path: Optional[str] = None,
         openai_service: Optional[OpenAIService] = None,
-        semantic_cache: Optional[SemanticCache] = None
+        semantic_cache: Optional[SemanticCache] = None,
+        max_concurrency: Optional[int] = None,
+        sequence_smoothing: Optional[bool] = None
     ):
         """
         Args:
             checklist_path: 체크리스트 YAML 파일 경로
             openai_service: OpenAI 서비스 인스턴스
             semantic_cache: Semantic cache 인스턴스 (일관성 보장용)
+            max_concurrency: 동시에 분류할 최대 발화 수 (기본값: 환경변수 CLASSIFIER_CONCURRENCY 또는 1)
+            sequence_smoothing: 여러 발화 분류 시 anchor 발화만 체크리스트로 분류하고 나머지는 HMM으로 추론
+                                (기본값: 환경변수 STAGE_SEQUENCE_SMOOTHING, false)
         """
         # 체크리스트 로드
         if checklist_path is None:
@@ -48,6 +60,37 @@ class StageClassifier:
         # Semantic cache (일관성 보장)
         self.semantic_cache = semantic_cache
 
+        # 체크리스트(프롬프트/결정 규칙 포함)나 모델이 바뀌면 캐시 키도 바뀜 (이전 결과 재사용 방지)
+        # fast_rules/sequence_smoothing은 LLM 응답에 영향이 없으므로 제외 (설정 수정으로 캐시가 만료되지 않도록)
+        self.cache_fingerprint = compute_fingerprint(
+            {k: v for k, v in self.config.items() if k not in ("fast_rules", "sequence_smoothing")},
+            self.openai_service.model
+        )
+        # 배치 모드 결과는 묶음 프롬프트로 만들어지므로 별도 타입(stage_batch)과 fingerprint로 저장
+        self.batch_cache_type = "stage_batch"
+        if self.semantic_cache:
+            self.semantic_cache.register_fingerprint("stage", self.cache_fingerprint)
+            if self.openai_service.batch_size > 1:
+                self.semantic_cache.register_fingerprint(
+                    self.batch_cache_type,
+                    compute_fingerprint(self.cache_fingerprint, self.openai_service.batch_prompt_fingerprint())
+                )
+
+        # 규칙 기반 사전 분류 (YAML에 fast_rules가 있을 때만, FAST_RULES_MODE로 on/shadow/off)
+        self.fast_rules_mode = get_fast_rules_mode()
+        self.fast_rules = (
+            FastRuleEngine.from_config(self.config, name="stage")
+            if self.fast_rules_mode != MODE_OFF else None
+        )
+
+        # 발화 단위 동시 실행 수
+        self.max_concurrency = max_concurrency or get_default_concurrency()
+
+        # 단계 시퀀스 스무딩 (anchor 분류 + HMM)
+        if sequence_smoothing is None:
+            sequence_smoothing = os.getenv("STAGE_SEQUENCE_SMOOTHING", "false").lower() == "true"
+        self.smoother = StageSmoother.from_config(self.config) if sequence_smoothing else None
+
         logger.info("Stage Classifier initialized (caching: %s)", "enabled" if semantic_cache else "disabled")
 
     def _build_checklist_items(self, stage_name: str) -> str:
@@ -112,12 +155,44 @@ class StageClassifier:
         stage = self.stages[stage_name]
         return [item["id"] for item in stage["checklist"]]
 
+    def _apply_fast_rules(self, utterance: str) -> Optional[Dict[str, Any]]:
+        """
+        fast_rules로 결정 가능한 발화면 classify_single_utterance와 같은 형식의 결과 반환 (on 모드),
+        애매하거나 규칙이 없으면 None
+        """
+        if self.fast_rules is None or self.fast_rules_mode != MODE_ON:
+            return None
+
+        decision = self.fast_rules.match(utterance)
+        if decision is None:
+            return None
+
+        return {
+            "stage": decision["label"],
+            "confidence": decision["confidence"],
+            "checklist_results": {},
+            "decision_reason": f"Fast rule {decision['rule_id']}",
+            "decision_source": DECISION_SOURCE_RULE,
+            "rule_id": decision["rule_id"]
+        }
+
+    def _record_fast_rule_shadow(self, utterance: str, result: Dict[str, Any]):
+        """shadow 모드: LLM 결과에 규칙 결정을 기록하고 일치율 집계"""
+        if self.fast_rules is None or self.fast_rules_mode != MODE_SHADOW:
+            return
+
+        decision = self.fast_rules.match(utterance)
+        if decision is not None:
+            self.fast_rules.record_shadow(decision, [result["stage"]])
+            result["fast_rule_decision"] = decision
+
     async def classify_single_utterance(
         self,
         utterance: str,
         timestamp: Optional[str] = None,
         previous_utterance: Optional[str] = None,
-        next_utterance: Optional[str] = None
+        next_utterance: Optional[str] = None,
+        apply_fast_rules: bool = True
     ) -> Dict[str, Any]:
         """
         단일 발화의 수업 단계 분류
@@ -127,6 +202,7 @@ class StageClassifier:
             timestamp: 발화 시간
             previous_utterance: 이전 발화
             next_utterance: 다음 발화
+            apply_fast_rules: fast_rules로 먼저 결정 시도 (호출자가 이미 확인했으면 False)
 
         Returns:
             {
@@ -142,6 +218,12 @@ class StageClassifier:
         """
         logger.info(f"Classifying utterance: {utterance[:50]}...")
 
+        # ✅ 명백한 발화는 규칙으로 결정 (캐시/LLM 생략)
+        if apply_fast_rules:
+            rule_result = self._apply_fast_rules(utterance)
+            if rule_result is not None:
+                return rule_result
+
         # ✅ Semantic Cache 확인 (일관성 보장)
         if self.semantic_cache:
             # 캐시 키에 포함할 컨텍스트
@@ -197,8 +279,10 @@ class StageClassifier:
             "stage": decision["stage"],
             "confidence": decision["confidence"],
             "checklist_results": checklist_results,
-            "decision_reason": decision["reason"]
+            "decision_reason": decision["reason"],
+            "decision_source": DECISION_SOURCE_LLM
         }
+        self._record_fast_rule_shadow(utterance, result)
 
         # ✅ Semantic Cache에 결과 저장 (일관성 보장)
         if self.semantic_cache:
@@ -305,7 +389,8 @@ class StageClassifier:
 
     async def classify_multiple_utterances(
         self,
-        utterances: List[Dict[str, Any]]
+        utterances: List[Dict[str, Any]],
+        progress: Optional[ClassificationProgress] = None
     ) -> List[Dict[str, Any]]:
         """
         여러 발화를 배치로 분류
@@ -319,36 +404,252 @@ class StageClassifier:
                 },
                 ...
             ]
+            progress: 발화별 분류 checkpoint (이전 실행에서 완료된 발화는 건너뛰고, 완료되는 발화를 기록)
 
         Returns:
             각 발화의 분류 결과 리스트
         """
         logger.info(f"Classifying {len(utterances)} utterances")
 
-        results = []
-        for i, utterance in enumerate(utterances):
-            # 이전/다음 발화 컨텍스트
-            prev_text = utterances[i-1]["text"] if i > 0 else None
-            next_text = utterances[i+1]["text"] if i < len(utterances)-1 else None
+        if self.smoother is not None:
+            return await self._classify_with_smoothing(utterances, progress)
 
-            result = await self.classify_single_utterance(
-                utterance=utterance["text"],
-                timestamp=utterance.get("timestamp"),
-                previous_utterance=prev_text,
-                next_utterance=next_text
-            )
+        # 캐시 일괄 조회 (MGET 1회), miss인 발화만 LLM으로 전송
+        cache_type = self.batch_cache_type if self.openai_service.batch_size > 1 else "stage"
+        cached_results = (
+            self.semantic_cache.prefetch(utterances, cache_type)
+            if self.semantic_cache else [None] * len(utterances)
+        )
+
+        # 규칙으로 결정되는 발화는 LLM으로 보내지 않음 (캐시된 결과보다 우선)
+        for i, utterance in enumerate(utterances):
+            rule_result = self._apply_fast_rules(utterance["text"])
+            if rule_result is not None:
+                cached_results[i] = rule_result
+
+        # 이전 실행(재시도)에서 이미 분류된 발화
+        if progress:
+            for i, result in progress.completed(PASS_STAGE).items():
+                cached_results[i] = result
+
+        # 배치 모드: 여러 발화의 체크리스트를 한 프롬프트로 묶어서 실행
+        batched_results = None
+        if self.openai_service.batch_size > 1:
+            batched_results = await self._classify_utterances_batched(utterances, cached_results)
+
+        async def classify_one(i: int, utterance: Dict[str, Any]) -> Dict[str, Any]:
+            if batched_results is not None:
+                result = batched_results[i]
+            elif cached_results[i] is not None:
+                result = cached_results[i]
+            else:
+                # 이전/다음 발화 컨텍스트
+                prev_text = utterances[i-1]["text"] if i > 0 else None
+                next_text = utterances[i+1]["text"] if i < len(utterances)-1 else None
+
+                result = await self.classify_single_utterance(
+                    utterance=utterance["text"],
+                    timestamp=utterance.get("timestamp"),
+                    previous_utterance=prev_text,
+                    next_utterance=next_text,
+                    apply_fast_rules=False
+                )
 
             # 메타데이터 추가
             result["utterance_id"] = utterance.get("id")
             result["utterance_text"] = utterance["text"]
 
-            results.append(result)
-
             logger.info(
                 f"[{i+1}/{len(utterances)}] {utterance.get('id')}: "
                 f"{result['stage']} (conf={result['confidence']})"
             )
 
+            if progress:
+                progress.record(PASS_STAGE, i, result)
+            return result
+
+        # 발화 간 독립적이므로 max_concurrency개씩 동시 실행 (결과 순서 유지)
+        return await gather_bounded(utterances, classify_one, self.max_concurrency)
+
+    async def _classify_with_smoothing(
+        self,
+        utterances: List[Dict[str, Any]],
+        progress: Optional[ClassificationProgress] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        시퀀스 스무딩 모드 분류
+
+        1. fast_rules로 결정되는 발화 + 균등 간격 anchor 발화만 체크리스트로 분류 (캐시 사용)
+        2. HMM(Viterbi)으로 전체 단계 시퀀스 추론
+        3. 인접 anchor 사이에서 단계가 바뀌면 중간 발화를 추가로 분류하여 경계 보정
+
+        progress에는 스무딩 전 관측(체크리스트 분류) 결과가 기록되어, 재시도 시 anchor로 재사용된다.
+
+        Returns:
+            classify_multiple_utterances와 같은 형식의 결과 리스트
+            (추론된 발화는 decision_source="hmm", checklist_results 없음)
+        """
+        count = len(utterances)
+        observations: Dict[int, Dict[str, Any]] = progress.completed(PASS_STAGE) if progress else {}
+
+        # 규칙으로 결정되는 발화는 비용 없는 anchor
+        for i, utterance in enumerate(utterances):
+            rule_result = self._apply_fast_rules(utterance["text"])
+            if rule_result is not None and i not in observations:
+                observations[i] = rule_result
+        rule_anchors = sum(
+            1 for result in observations.values() if result.get("decision_source") == DECISION_SOURCE_RULE
+        )
+
+        async def classify_index(_, i: int) -> Dict[str, Any]:
+            result = await self.classify_single_utterance(
+                utterance=utterances[i]["text"],
+                timestamp=utterances[i].get("timestamp"),
+                previous_utterance=utterances[i-1]["text"] if i > 0 else None,
+                next_utterance=utterances[i+1]["text"] if i < count - 1 else None,
+                apply_fast_rules=False
+            )
+            if progress:
+                progress.record(PASS_STAGE, i, result)
+            return result
+
+        async def observe(indices: List[int]):
+            pending = [i for i in indices if i not in observations]
+            results = await gather_bounded(pending, classify_index, self.max_concurrency)
+            observations.update(zip(pending, results))
+
+        await observe(self.smoother.select_anchors(count))
+        path, confidences = self.smoother.smooth(count, observations)
+
+        for _ in range(self.smoother.max_refinement_rounds):
+            midpoints = self.smoother.boundary_midpoints(path, sorted(observations))
+            if not midpoints:
+                break
+            await observe(midpoints)
+            path, confidences = self.smoother.smooth(count, observations)
+
+        results = []
+        for i, utterance in enumerate(utterances):
+            observed = observations.get(i)
+            if observed is None:
+                result = {
+                    "stage": path[i],
+                    "confidence": confidences[i],
+                    "checklist_results": {},
+                    "decision_reason": "Inferred by sequence smoothing",
+                    "decision_source": DECISION_SOURCE_HMM
+                }
+            else:
+                result = dict(observed)
+                if result["stage"] != path[i]:
+                    # 단조 시퀀스와 맞지 않는 anchor 결정 (노이즈) 교정
+                    result["anchor_stage"] = result["stage"]
+                    result["stage"] = path[i]
+                    result["confidence"] = confidences[i]
+                    result["decision_reason"] = "Anchor decision overridden by sequence smoothing"
+                    result["decision_source"] = DECISION_SOURCE_HMM
+
+            result["utterance_id"] = utterance.get("id")
+            result["utterance_text"] = utterance["text"]
+            results.append(result)
+
+        logger.info(
+            f"Stage smoothing: classified {len(observations) - rule_anchors}/{count} utterances "
+            f"({rule_anchors} decided by rules), "
+            f"{sum(1 for r in results if r.get('anchor_stage'))} anchor decisions corrected"
+        )
+        return results
+
+    async def _classify_utterances_batched(
+        self,
+        utterances: List[Dict[str, Any]],
+        cached_results: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        배치 모드 분류 (openai_service.batch_size > 1)
+
+        캐시에 없는 발화들의 같은 단계 체크리스트를 batch_execute_checklists로 묶어 실행하고,
+        각 발화별로 _make_classification_decision을 적용한다.
+
+        Returns:
+            classify_single_utterance와 같은 형식의 결과 리스트 (입력 순서 유지)
+        """
+        if cached_results is None:
+            cached_results = (
+                self.semantic_cache.prefetch(utterances, self.batch_cache_type)
+                if self.semantic_cache else [None] * len(utterances)
+            )
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(utterances)
+        pending = []
+
+        for i, utterance in enumerate(utterances):
+            prev_text = utterances[i-1]["text"] if i > 0 else None
+            next_text = utterances[i+1]["text"] if i < len(utterances)-1 else None
+            context = {
+                "timestamp": utterance.get("timestamp"),
+                "has_previous": prev_text is not None,
+                "has_next": next_text is not None
+            }
+
+            if cached_results[i] is not None:
+                results[i] = cached_results[i]
+                continue
+
+            pending.append((i, prev_text, next_text, context))
+
+        if not pending:
+            return results
+
+        stage_names = ["introduction", "development", "closing"]
+        checklist_results = {i: {} for i, _, _, _ in pending}
+
+        for stage_name in stage_names:
+            expected_keys = self._get_expected_keys(stage_name)
+            items = [
+                {
+                    "prompt": self._build_prompt(
+                        utterance=utterances[i]["text"],
+                        stage_name=stage_name,
+                        timestamp=utterances[i].get("timestamp"),
+                        previous_utterance=prev_text,
+                        next_utterance=next_text
+                    ),
+                    "expected_keys": expected_keys
+                }
+                for i, prev_text, next_text, _ in pending
+            ]
+
+            stage_results = await self.openai_service.batch_execute_checklists(items)
+
+            for (i, _, _, _), result in zip(pending, stage_results):
+                yes_count = self.openai_service.count_yes_responses(result["results"])
+                checklist_results[i][stage_name] = {
+                    **result,
+                    "yes_count": yes_count
+                }
+
+        for i, _, _, context in pending:
+            decision = self._make_classification_decision(checklist_results[i])
+
+            result = {
+                "stage": decision["stage"],
+                "confidence": decision["confidence"],
+                "checklist_results": checklist_results[i],
+                "decision_reason": decision["reason"],
+                "decision_source": DECISION_SOURCE_LLM
+            }
+            self._record_fast_rule_shadow(utterances[i]["text"], result)
+
+            results[i] = result
+
+        # 새 결과를 파이프라인 1회로 저장
+        if self.semantic_cache:
+            self.semantic_cache.set_many([
+                (utterances[i]["text"], self.batch_cache_type, results[i], context)
+                for i, _, _, context in pending
+            ])
+
         return results
 
     def get_stage_statistics(
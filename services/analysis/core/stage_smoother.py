@@ -0,0 +1,209 @@
+"""
+Stage Smoother
+수업 단계(도입 → 전개 → 정리) 시퀀스 HMM 스무딩
+
+수업 단계는 실제로 거의 단조 증가하므로, 모든 발화를 독립적으로 분류하는 대신
+일부 anchor 발화만 체크리스트로 분류하고 나머지는 left-to-right HMM(Viterbi)으로 추론한다.
+anchor의 관측 확률은 기존 결정 규칙(rules.threshold, tie_breaking)으로 정해진 단계를 기반으로 하며,
+어떤 단계도 threshold를 넘지 못한 anchor(fallback 결정)는 정보가 없는 관측으로 취급한다.
+
+- 상태 전이: 현재 단계 유지 또는 다음 단계로만 이동 (backward_probability > 0이면 역행도 소량 허용)
+- 경계 보정: 인접 anchor 사이에서 단계가 바뀌면 중간 발화를 추가로 분류 (이분 탐색)
+- 신뢰도: forward-backward 사후 확률
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+STAGES = ["introduction", "development", "closing"]
+
+# 스무딩으로 결정(추론 또는 교정)된 결과의 decision_source
+DECISION_SOURCE_HMM = "hmm"
+
+
+class StageSmoother:
+    """left-to-right 3상태 HMM"""
+
+    def __init__(
+        self,
+        thresholds: Dict[str, int],
+        anchor_every: int = 15,
+        anchor_accuracy: float = 0.8,
+        initial_probabilities: Optional[Dict[str, float]] = None,
+        backward_probability: float = 0.0,
+        max_refinement_rounds: int = 8
+    ):
+        """
+        Args:
+            thresholds: 단계별 Yes 개수 임계값 (classification_rules.threshold)
+            anchor_every: anchor 간격 (발화 수), 첫/마지막 발화는 항상 anchor
+            anchor_accuracy: 체크리스트 결정이 실제 단계와 일치할 확률 (관측 확률)
+            initial_probabilities: 첫 발화의 단계 사전 확률
+            backward_probability: 이전 단계로 돌아갈 전이 확률 (0 = 엄격한 단조)
+            max_refinement_rounds: 경계 보정 최대 반복 횟수
+        """
+        self.thresholds = thresholds
+        self.anchor_every = max(1, anchor_every)
+        self.anchor_accuracy = min(max(anchor_accuracy, 1.0 / len(STAGES)), 0.999)
+        self.initial_probabilities = initial_probabilities or {
+            "introduction": 0.8, "development": 0.15, "closing": 0.05
+        }
+        self.backward_probability = max(0.0, backward_probability)
+        self.max_refinement_rounds = max(0, max_refinement_rounds)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "StageSmoother":
+        """stage_checklists.yaml 전체 설정에서 생성 (sequence_smoothing 섹션은 선택 사항)"""
+        smoothing = config.get("sequence_smoothing") or {}
+        return cls(
+            thresholds=config["classification_rules"]["threshold"],
+            anchor_every=int(smoothing.get("anchor_every", 15)),
+            anchor_accuracy=float(smoothing.get("anchor_accuracy", 0.8)),
+            initial_probabilities=smoothing.get("initial_probabilities"),
+            backward_probability=float(smoothing.get("backward_probability", 0.0)),
+            max_refinement_rounds=int(smoothing.get("max_refinement_rounds", 8))
+        )
+
+    # ============================================================
+    # anchor 선택
+    # ============================================================
+
+    def select_anchors(self, count: int) -> List[int]:
+        """균등 간격 anchor (첫/마지막 발화 포함)"""
+        if count <= 0:
+            return []
+        anchors = set(range(0, count, self.anchor_every))
+        anchors.add(count - 1)
+        return sorted(anchors)
+
+    @staticmethod
+    def boundary_midpoints(path: Sequence[str], observed: Sequence[int]) -> List[int]:
+        """
+        스무딩 결과 단계가 바뀌는 인접 anchor 쌍 사이의 중간 발화
+
+        Args:
+            path: 발화별 스무딩 단계
+            observed: 관측(분류)된 발화 인덱스 (오름차순)
+        """
+        midpoints = []
+        for left, right in zip(observed, observed[1:]):
+            if right - left > 1 and path[left] != path[right]:
+                midpoints.append((left + right) // 2)
+        return midpoints
+
+    # ============================================================
+    # HMM
+    # ============================================================
+
+    def emission(self, result: Dict[str, Any]) -> Optional[np.ndarray]:
+        """
+        anchor 분류 결과의 관측 확률 P(결정 | 실제 단계)
+
+        체크리스트 결과가 있으면 threshold를 넘은 단계가 있을 때만 결정(tie_breaking 적용)을 신뢰하고,
+        규칙/기타 결과는 결정 단계와 confidence를 사용한다.
+
+        Returns:
+            단계별 관측 확률 (정보 없음이면 None)
+        """
+        stage = result.get("stage")
+        if stage not in STAGES:
+            return None
+
+        checklist_results = result.get("checklist_results") or {}
+        if checklist_results:
+            qualified = [
+                name for name in STAGES
+                if checklist_results.get(name, {}).get("yes_count", 0) >= self.thresholds.get(name, 0)
+            ]
+            if not qualified:
+                # fallback 결정은 관측 정보로 쓰지 않음
+                return None
+            accuracy = self.anchor_accuracy
+        else:
+            accuracy = min(max(float(result.get("confidence") or self.anchor_accuracy), 1.0 / len(STAGES)), 0.999)
+
+        probabilities = np.full(len(STAGES), (1.0 - accuracy) / (len(STAGES) - 1))
+        probabilities[STAGES.index(stage)] = accuracy
+        return probabilities
+
+    def _transition_matrix(self, count: int) -> np.ndarray:
+        # 단계당 평균 길이 ≈ count / 3 이 되도록 다음 단계 전이 확률 설정
+        advance = min(0.5, len(STAGES) / max(count, 1))
+        transition = np.zeros((len(STAGES), len(STAGES)))
+        for i in range(len(STAGES)):
+            if i + 1 < len(STAGES):
+                transition[i, i + 1] = advance
+            if i > 0:
+                transition[i, i - 1] = self.backward_probability
+            transition[i, i] = 1.0 - transition[i].sum()
+        return transition
+
+    def smooth(
+        self,
+        count: int,
+        observations: Dict[int, Dict[str, Any]]
+    ) -> Tuple[List[str], List[float]]:
+        """
+        전체 발화의 단계 시퀀스 추론
+
+        Args:
+            count: 전체 발화 수
+            observations: {발화 인덱스: 분류 결과}
+
+        Returns:
+            (발화별 단계 (Viterbi), 해당 단계의 사후 확률 (forward-backward))
+        """
+        if count == 0:
+            return [], []
+
+        emissions = np.ones((count, len(STAGES)))
+        for index, result in observations.items():
+            probabilities = self.emission(result)
+            if probabilities is not None:
+                emissions[index] = probabilities
+
+        transition = self._transition_matrix(count)
+        initial = np.array([self.initial_probabilities.get(name, 0.0) for name in STAGES]) + 1e-12
+        initial /= initial.sum()
+
+        with np.errstate(divide="ignore"):
+            log_transition = np.log(transition)
+            log_emissions = np.log(emissions)
+            log_initial = np.log(initial)
+
+        # Viterbi
+        scores = log_initial + log_emissions[0]
+        backpointers = np.zeros((count, len(STAGES)), dtype=int)
+        for t in range(1, count):
+            candidates = scores[:, None] + log_transition
+            backpointers[t] = candidates.argmax(axis=0)
+            scores = candidates.max(axis=0) + log_emissions[t]
+
+        states = [int(scores.argmax())]
+        for t in range(count - 1, 0, -1):
+            states.append(int(backpointers[t, states[-1]]))
+        states.reverse()
+
+        # forward-backward (정규화된 확률 공간)
+        forward = np.zeros((count, len(STAGES)))
+        forward[0] = initial * emissions[0]
+        forward[0] /= forward[0].sum()
+        for t in range(1, count):
+            forward[t] = (forward[t - 1] @ transition) * emissions[t]
+            forward[t] /= forward[t].sum()
+
+        backward = np.ones((count, len(STAGES)))
+        for t in range(count - 2, -1, -1):
+            backward[t] = transition @ (emissions[t + 1] * backward[t + 1])
+            backward[t] /= backward[t].sum()
+
+        posterior = forward * backward
+        posterior /= posterior.sum(axis=1, keepdims=True)
+
+        path = [STAGES[state] for state in states]
+        confidences = [round(float(posterior[t, state]), 2) for t, state in enumerate(states)]
+        return path, confidences
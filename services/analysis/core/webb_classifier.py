@@ -10,7 +10,8 @@ from typing import Dict, List, Any, Optional
 from pathlib import Path
 
 from services.openai_service import OpenAIService
-from utils.semantic_cache import SemanticCache
+from utils.semantic_cache import SemanticCache, compute_fingerprint
+from utils.concurrency import gather_bounded, get_default_concurrency
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +23,8 @@ class WebbClassifier:
         self,
         checklist_path: Optional[str] = None,
         openai_service: Optional[OpenAIService] = None,
-        semantic_cache: Optional[SemanticCache] = None
+        semantic_cache: Optional[SemanticCache] = None,
+        max_concurrency: Optional[int] = None
     ):
         if checklist_path is None:
             current_dir = Path(__file__).parent.parent
@@ -37,6 +39,13 @@ class WebbClassifier:
         self.openai_service = openai_service or OpenAIService()
         self.semantic_cache = semantic_cache
 
+        # 체크리스트(프롬프트/결정 규칙 포함)나 모델이 바뀌면 캐시 키도 바뀜 (이전 결과 재사용 방지)
+        self.cache_fingerprint = compute_fingerprint(self.config, self.openai_service.model)
+        if self.semantic_cache:
+            self.semantic_cache.register_fingerprint("webb", self.cache_fingerprint)
+
+        self.max_concurrency = max_concurrency or get_default_concurrency()
+
         logger.info("Webb DOK Classifier initialized (caching: %s)", "enabled" if semantic_cache else "disabled")
 
     def _build_checklist_items(self, level_name: str) -> str:
@@ -192,25 +201,33 @@ class WebbClassifier:
     ) -> List[Dict[str, Any]]:
         logger.info(f"Classifying {len(utterances)} utterances for Webb DOK level")
 
-        results = []
-        for i, utterance in enumerate(utterances):
-            prev_text = utterances[i-1]["text"] if i > 0 else None
-            next_text = utterances[i+1]["text"] if i < len(utterances)-1 else None
+        # 캐시 일괄 조회 (MGET 1회), miss인 발화만 LLM으로 전송
+        cached_results = (
+            self.semantic_cache.prefetch(utterances, "webb")
+            if self.semantic_cache else [None] * len(utterances)
+        )
 
-            result = await self.classify_single_utterance(
-                utterance["text"],
-                utterance.get("timestamp"),
-                prev_text,
-                next_text
-            )
+        async def classify_one(i: int, utterance: Dict[str, Any]) -> Dict[str, Any]:
+            if cached_results[i] is not None:
+                result = cached_results[i]
+            else:
+                prev_text = utterances[i-1]["text"] if i > 0 else None
+                next_text = utterances[i+1]["text"] if i < len(utterances)-1 else None
+
+                result = await self.classify_single_utterance(
+                    utterance["text"],
+                    utterance.get("timestamp"),
+                    prev_text,
+                    next_text
+                )
 
             result["utterance_id"] = utterance.get("id")
             result["utterance_text"] = utterance["text"]
-            results.append(result)
 
             logger.info(f"[{i+1}/{len(utterances)}] {result['utterance_id']}: {result['level']} (conf={result['confidence']})")
+            return result
 
-        return results
+        return await gather_bounded(utterances, classify_one, self.max_concurrency)
 
     def get_level_statistics(self, classification_results: List[Dict[str, Any]]) -> Dict[str, Any]:
         total = len(classification_results)
@@ -6,16 +6,19 @@ Multiple framework analysis using OpenAI GPT-4o-mini API
 
 import os
 import uuid
+import time
+import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, Response
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, validator
 import redis
+import redis.asyncio as aioredis
 import json
 import requests
 
@@ -42,6 +45,9 @@ from core.cbil_integration import CBILIntegration
 
 # Import semantic cache for consistency guarantee
 from utils.semantic_cache import SemanticCache
+from utils.checkpoint_store import StageCheckpointStore, compute_input_hash
+from utils.job_events import job_event_channel, publish_job_status, stream_job_events
+from utils.job_store import AnalysisJobStore
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -78,6 +84,73 @@ redis_client = redis.Redis(
     decode_responses=True
 )
 
+# Job status (small hash) / result (compressed sections) store - binary connection for compressed results
+job_store = AnalysisJobStore(redis.Redis(
+    host=os.getenv('REDIS_HOST', 'redis'),
+    port=int(os.getenv('REDIS_PORT', 6379)),
+    password=os.getenv('REDIS_PASSWORD')
+))
+
+# Async Redis connection for job status event streams (SSE)
+async_redis_client = aioredis.Redis(
+    host=os.getenv('REDIS_HOST', 'redis'),
+    port=int(os.getenv('REDIS_PORT', 6379)),
+    password=os.getenv('REDIS_PASSWORD'),
+    decode_responses=True
+)
+
+# 작업 상태 이벤트 채널 (analysis_job_events:{job_id}) 및 스트림 종료 상태
+JOB_EVENTS_CHANNEL_PREFIX = "analysis_job_events"
+JOB_TERMINAL_STATUSES = ("completed", "failed")
+
+
+# 리포트 엔드포인트별로 읽는 결과 섹션 (None이면 전체)
+REPORT_DATA_SECTIONS = [
+    "framework", "framework_name", "analysis", "cbil_analysis_text", "coaching_feedback",
+    "character_count", "word_count", "created_at"
+]
+MATRIX_VISUALIZATION_SECTIONS = ["framework", "module2_result"]
+
+
+def save_job_status(job_id: str, job_data: Dict[str, Any], ttl: int):
+    """작업 상태 저장 (analysis_job_status:{job_id}, 결과 제외) + 상태 이벤트 발행"""
+    job_store.save_status(job_id, job_data, ttl)
+    publish_job_status(redis_client, job_event_channel(JOB_EVENTS_CHANNEL_PREFIX, job_id), job_data)
+
+
+def save_job_result(job_id: str, job_data: Dict[str, Any], result: Dict[str, Any], ttl: int):
+    """완료된 작업의 결과 저장 (analysis_job_result:{job_id}, 한 번만) 후 completed 상태 기록"""
+    job_store.save_result(job_id, result, ttl)
+    job_data.update({
+        "status": "completed",
+        "has_result": True,
+        "updated_at": datetime.now().isoformat()
+    })
+    save_job_status(job_id, job_data, ttl)
+
+
+def load_completed_result(job_id: str, sections: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    완료된 작업의 결과 (리포트 엔드포인트용)
+
+    Args:
+        sections: 필요한 최상위 섹션만 읽음 (None이면 전체)
+
+    Raises:
+        HTTPException: 작업 없음(404), 미완료/결과 없음(400)
+    """
+    job = job_store.load_status(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Analysis job not found")
+
+    if job.get("status") != "completed":
+        raise HTTPException(status_code=400, detail="Analysis not completed yet")
+
+    result = job_store.load_result(job_id, sections)
+    if result is None:
+        raise HTTPException(status_code=400, detail="No analysis result found")
+    return result
+
 # Initialize Semantic Cache for consistency guarantee
 # Caches first LLM classification result to ensure 100% reproducibility
 semantic_cache = SemanticCache(redis_client)
@@ -97,9 +170,35 @@ API_KEY = UPSTAGE_API_KEY if UPSTAGE_API_KEY else OPENAI_API_KEY
 if not API_KEY:
     logger.warning("No API Key (UPSTAGE_API_KEY or OPENAI_API_KEY) found in environment variables")
 
-# Import OpenAI
-from openai import OpenAI
-openai_client = OpenAI(api_key=API_KEY, base_url=UPSTAGE_BASE_URL) if API_KEY else None
+# 프레임워크 분석(최대 4000 토큰 생성)은 체크리스트 분류(LLM_REQUEST_TIMEOUT)보다 오래 걸리므로 별도 timeout
+# 스트리밍 시 SDK timeout은 청크 간 대기 시간에, FRAMEWORK_ANALYSIS_TIMEOUT은 전체 생성 시간에 적용
+FRAMEWORK_ANALYSIS_TIMEOUT = float(os.getenv('FRAMEWORK_ANALYSIS_TIMEOUT', '180'))
+FRAMEWORK_ANALYSIS_STREAM = os.getenv('FRAMEWORK_ANALYSIS_STREAM', 'true').lower() == 'true'
+
+# Import OpenAI (async client: 생성 중에도 이벤트 루프가 /health, 상태 조회를 처리)
+from openai import AsyncOpenAI
+openai_client = AsyncOpenAI(
+    api_key=API_KEY,
+    base_url=UPSTAGE_BASE_URL,
+    timeout=min(FRAMEWORK_ANALYSIS_TIMEOUT, 60.0),
+    max_retries=1
+) if API_KEY else None
+
+# 분석 작업 실행 위치: Celery worker (celery_app.py) 또는 웹 프로세스의 BackgroundTasks
+ANALYSIS_USE_CELERY = os.getenv('ANALYSIS_USE_CELERY', 'false').lower() == 'true'
+celery_app = None
+if ANALYSIS_USE_CELERY:
+    try:
+        from celery_app import celery_app
+        logger.info("✓ Analysis jobs dispatched to Celery workers")
+    except ImportError as e:
+        logger.warning(f"⚠️  Celery not available, falling back to BackgroundTasks: {e}")
+        ANALYSIS_USE_CELERY = False
+
+
+class AnalysisInputError(ValueError):
+    """입력 문제로 실패한 분석 작업 (재시도해도 같은 결과이므로 worker가 재시도하지 않음)"""
+
 
 class AnalysisRequest(BaseModel):
     text: str
@@ -478,11 +577,23 @@ VIDEO_TRANSCRIPT:<<<{text}>>>
     }
 }
 
-def call_openai_api(prompt: str) -> str:
+async def call_openai_api(
+    prompt: str,
+    stream: Optional[bool] = None,
+    on_progress: Optional[Callable[[int], None]] = None
+) -> str:
     """
     Call OpenAI GPT-5-mini API
     ⚠️ MODEL: Upstage Solar Pro 2 (Changed 2025-01-11) - DO NOT REVERT TO gpt-4o-mini
 
+    Args:
+        prompt: 프레임워크 분석 프롬프트
+        stream: 스트리밍 응답 사용 여부 (기본값: 환경변수 FRAMEWORK_ANALYSIS_STREAM)
+        on_progress: 스트리밍 중 지금까지 생성된 글자 수를 받는 콜백
+
+    Raises:
+        TimeoutError: 전체 생성 시간이 FRAMEWORK_ANALYSIS_TIMEOUT을 넘은 경우
+
     Note:
         GPT-5 uses default temperature=1.0 (cannot be customized)
         Consistency guaranteed by majority voting and structured prompts
@@ -490,26 +601,122 @@ def call_openai_api(prompt: str) -> str:
     if not openai_client:
         raise ValueError("OpenAI client not initialized. Please set OPENAI_API_KEY environment variable.")
 
-    try:
-        response = openai_client.chat.completions.create(
-            model=GPT_MODEL,  # ⚠️ CRITICAL: Upstage Solar Pro 2
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            max_completion_tokens=4000  # Upstage Solar Pro 2 temperature=0=1.0
-        )
+    if stream is None:
+        stream = FRAMEWORK_ANALYSIS_STREAM
 
-        return response.choices[0].message.content
+    request = {
+        "model": GPT_MODEL,  # ⚠️ CRITICAL: Upstage Solar Pro 2
+        "messages": [
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+        "max_completion_tokens": 4000  # Upstage Solar Pro 2 temperature=0=1.0
+    }
 
+    async def _complete() -> str:
+        if not stream:
+            response = await openai_client.chat.completions.create(**request)
+            return response.choices[0].message.content
+
+        chunks = []
+        generated = 0
+        response_stream = await openai_client.chat.completions.create(**request, stream=True)
+        async for chunk in response_stream:
+            if not chunk.choices:
+                continue
+            content = chunk.choices[0].delta.content
+            if content:
+                chunks.append(content)
+                generated += len(content)
+                if on_progress:
+                    on_progress(generated)
+        return "".join(chunks)
+
+    try:
+        return await asyncio.wait_for(_complete(), timeout=FRAMEWORK_ANALYSIS_TIMEOUT)
+
+    except asyncio.TimeoutError:
+        logger.error(f"OpenAI API call timed out after {FRAMEWORK_ANALYSIS_TIMEOUT:.0f}s")
+        raise TimeoutError(f"Framework analysis timed out after {FRAMEWORK_ANALYSIS_TIMEOUT:.0f}s")
     except Exception as e:
         logger.error(f"OpenAI API call failed: {str(e)}")
         raise
 
-def process_analysis_job(job_id: str, text: str, framework: str, metadata: Dict[str, Any]):
-    """Background task for processing analysis"""
+
+def job_progress_reporter(job_data: Dict[str, Any], ttl: int, interval: float = 2.0) -> Callable[[int], None]:
+    """
+    스트리밍 생성량을 작업 상태 메시지에 반영하는 on_progress 콜백 (interval초마다 최대 1회 기록)
+
+    Args:
+        job_data: 갱신할 작업 상태 (message에 생성 글자 수를 덧붙임)
+        ttl: Redis TTL
+        interval: 최소 기록 간격 (초)
+    """
+    base_message = job_data["message"]
+    last_written = [0.0]
+
+    def report(generated: int):
+        now = time.monotonic()
+        if now - last_written[0] < interval:
+            return
+        last_written[0] = now
+        job_data["message"] = f"{base_message} ({generated}자 생성)"
+        job_data["updated_at"] = datetime.now().isoformat()
+        save_job_status(job_data['job_id'], job_data, ttl)
+
+    return report
+
+
+def job_classification_reporter(job_data: Dict[str, Any], ttl: int, interval: float = 2.0) -> Callable[[int, int], None]:
+    """
+    3D matrix 발화 분류 진행률을 작업 상태에 기록하는 콜백 (StageCheckpointStore.on_progress)
+
+    job_data에 progress (0~1), progress_done/progress_total (분류 패스 × 발화 수),
+    eta_seconds (이번 실행의 처리 속도 기준)를 기록한다. interval초마다 최대 1회, 완료 시 항상 기록.
+    """
+    first_sample = []
+    last_written = [0.0]
+
+    def report(done: int, total: int):
+        now = time.monotonic()
+        if not first_sample:
+            first_sample.extend([now, done])
+        if done < total and now - last_written[0] < interval:
+            return
+        last_written[0] = now
+
+        started_at, started_done = first_sample
+        eta_seconds = None
+        if done > started_done:
+            eta_seconds = round((now - started_at) / (done - started_done) * (total - done))
+
+        job_data.update({
+            "progress": round(done / total, 3) if total else 1.0,
+            "progress_done": done,
+            "progress_total": total,
+            "eta_seconds": eta_seconds,
+            "updated_at": datetime.now().isoformat()
+        })
+        save_job_status(job_data['job_id'], job_data, ttl)
+
+    return report
+
+async def process_analysis_job(
+    job_id: str,
+    text: str,
+    framework: str,
+    metadata: Dict[str, Any],
+    raise_errors: bool = False
+):
+    """
+    Background task for processing analysis
+
+    Args:
+        raise_errors: 예외를 다시 발생 (Celery worker의 재시도 판단용). 입력 오류(AnalysisInputError)만
+            failed를 기록하고, 그 외 오류는 상태를 기록하지 않음 (재시도/최종 실패 기록은 task가 담당)
+    """
     try:
         # Update job status
         job_data = {
@@ -519,18 +726,20 @@ def process_analysis_job(job_id: str, text: str, framework: str, metadata: Dict[
             "created_at": datetime.now().isoformat(),
             "updated_at": datetime.now().isoformat()
         }
-        redis_client.setex(f"analysis_job:{job_id}", 3600, json.dumps(job_data))
+        save_job_status(job_id, job_data, 3600)
         
         # Get framework configuration
         if framework not in ANALYSIS_FRAMEWORKS:
-            raise ValueError(f"Unknown framework: {framework}")
+            raise AnalysisInputError(f"Unknown framework: {framework}")
         
         framework_config = ANALYSIS_FRAMEWORKS[framework]
         prompt = framework_config["prompt"].format(text=text)
         
         # Call OpenAI API (Upstage Solar Pro 2 temperature=0=1.0)
         start_time = datetime.now()
-        analysis_result = call_openai_api(prompt)
+        analysis_result = await call_openai_api(
+            prompt, on_progress=job_progress_reporter(job_data, 3600)
+        )
         processing_time = (datetime.now() - start_time).total_seconds()
         
         # Prepare result
@@ -586,71 +795,62 @@ def process_analysis_job(job_id: str, text: str, framework: str, metadata: Dict[
             # Don't fail the job if database storage fails
         
         # Success
-        job_data.update({
-            "status": "completed",
-            "message": "Analysis completed successfully",
-            "result": result,
-            "updated_at": datetime.now().isoformat()
-        })
-        
-        redis_client.setex(f"analysis_job:{job_id}", 3600, json.dumps(job_data))
+        job_data["message"] = "Analysis completed successfully"
+        save_job_result(job_id, job_data, result, 3600)
         
     except Exception as e:
         logger.error(f"Analysis job {job_id} failed: {str(e)}")
+        if raise_errors and not isinstance(e, AnalysisInputError):
+            # 재시도될 수 있으므로 종료 상태(failed)를 기록/발행하지 않음
+            raise
         job_data.update({
             "status": "failed",
             "message": f"Analysis failed: {str(e)}",
             "updated_at": datetime.now().isoformat()
         })
-        redis_client.setex(f"analysis_job:{job_id}", 3600, json.dumps(job_data))
+        save_job_status(job_id, job_data, 3600)
+        if raise_errors:
+            raise
 
 async def process_comprehensive_cbil_analysis(
     job_id: str,
     text: str,
     metadata: Dict[str, Any],
-    segments: List[Dict[str, Any]] = None
+    segments: List[Dict[str, Any]] = None,
+    raise_errors: bool = False
 ):
     """
     Background task for comprehensive CBIL + Module 3 analysis
 
     Workflow:
-    1. Call OpenAI API for CBIL 7-stage analysis
-    2. Parse utterances from transcript (use segments if provided)
-    3. Call Module 3 evaluation with CBIL integration
-    4. Generate comprehensive coaching
+    1. Parse utterances from transcript (use segments if provided)
+    2. Call OpenAI API for CBIL 7-stage analysis
+       ∥ Module 3 evaluation (3D matrix → metrics → pattern → coaching)
+    3. CBIL integration (waits for both) and comprehensive coaching
 
     Args:
         job_id: Analysis job ID
         text: Full transcript text
         metadata: Analysis metadata
         segments: Optional list of segments from Module 1 with timestamps
+        raise_errors: Re-raise so the Celery worker can decide on retries. Only input errors
+            (AnalysisInputError) record the failed status here; the task records it for other
+            errors once retries are exhausted
     """
     try:
         # Update job status
         job_data = {
             "job_id": job_id,
             "status": "processing",
-            "message": "Step 1/3: Running CBIL 7-stage analysis...",
+            "message": "Step 1/2: Parsing utterances...",
             "created_at": datetime.now().isoformat(),
             "updated_at": datetime.now().isoformat()
         }
-        redis_client.setex(f"analysis_job:{job_id}", 7200, json.dumps(job_data))
-
-        # Step 1: Call OpenAI API for CBIL analysis
-        logger.info(f"Job {job_id}: Starting CBIL analysis")
-        framework_config = ANALYSIS_FRAMEWORKS["cbil"]
-        cbil_prompt = framework_config["prompt"].format(text=text)
+        save_job_status(job_id, job_data, 7200)
 
         start_time = datetime.now()
-        cbil_analysis_text = call_openai_api(cbil_prompt)  # Upstage Solar Pro 2 temperature=0=1.0
-        cbil_processing_time = (datetime.now() - start_time).total_seconds()
-
-        logger.info(f"Job {job_id}: CBIL analysis completed in {cbil_processing_time:.2f}s")
-
-        # Step 2: Parse utterances from transcript
-        job_data["message"] = "Step 2/3: Parsing utterances and building 3D matrix..."
-        redis_client.setex(f"analysis_job:{job_id}", 7200, json.dumps(job_data))
 
+        # Step 1: Parse utterances from transcript (CBIL 호출 전에 검증하여 세그먼트 부족 시 LLM 비용 없이 실패)
         # 세그먼트 검증 (엄격 모드 - 최소 10개 필요)
         segment_count = len(segments) if segments else 0
         if segment_count >= 10:
@@ -660,13 +860,26 @@ async def process_comprehensive_cbil_analysis(
         else:
             # 세그먼트 부족 시 에러 반환 (regex fallback 제거 - 엄격 모드)
             logger.error(f"Job {job_id}: Insufficient segments: {segment_count} (minimum 10 required)")
-            raise ValueError(f"분석을 위해 최소 10개 이상의 세그먼트가 필요합니다. 현재: {segment_count}개")
+            raise AnalysisInputError(f"분석을 위해 최소 10개 이상의 세그먼트가 필요합니다. 현재: {segment_count}개")
 
         logger.info(f"Job {job_id}: Parsed {len(utterances)} utterances")
 
-        # Step 3: Run Module 3 evaluation with CBIL integration
-        job_data["message"] = "Step 3/3: Running Module 3 evaluation with CBIL integration..."
-        redis_client.setex(f"analysis_job:{job_id}", 7200, json.dumps(job_data))
+        # Step 2: CBIL analysis and Module 3 evaluation in parallel
+        job_data["message"] = "Step 2/2: Running CBIL 7-stage analysis and Module 3 evaluation in parallel..."
+        save_job_status(job_id, job_data, 7200)
+
+        framework_config = ANALYSIS_FRAMEWORKS["cbil"]
+        cbil_prompt = framework_config["prompt"].format(text=text)
+
+        async def run_cbil_analysis() -> str:
+            logger.info(f"Job {job_id}: Starting CBIL analysis")
+            cbil_start_time = datetime.now()
+            analysis_text = await call_openai_api(  # Upstage Solar Pro 2 temperature=0=1.0
+                cbil_prompt, on_progress=job_progress_reporter(job_data, 7200)
+            )
+            cbil_processing_time = (datetime.now() - cbil_start_time).total_seconds()
+            logger.info(f"Job {job_id}: CBIL analysis completed in {cbil_processing_time:.2f}s")
+            return analysis_text
 
         # Initialize EvaluationService with semantic cache for consistency
         evaluation_service = EvaluationService(semantic_cache=semantic_cache)
@@ -678,16 +891,25 @@ async def process_comprehensive_cbil_analysis(
             "duration": metadata.get("duration", len(utterances))
         }
 
+        # 단계별 checkpoint: 재시도(같은 job_id, 같은 입력) 시 완료된 단계(CBIL, matrix, ...)를 건너뜀
+        checkpoints = StageCheckpointStore(
+            redis_client, job_id, compute_input_hash(text, segments, context),
+            on_progress=job_classification_reporter(job_data, 7200)
+        )
+
         # Call evaluate_with_cbil with error handling
         logger.info(f"Job {job_id}: Starting CBIL-integrated evaluation")
         try:
+            # CBIL 호출이 끝나기 전에 3D matrix/metrics가 진행되고, CBIL 통합 단계만 두 결과를 기다림
             evaluation_result = await evaluation_service.evaluate_with_cbil(
                 utterances=utterances,
-                cbil_analysis_text=cbil_analysis_text,
+                cbil_analysis_text=run_cbil_analysis(),
                 evaluation_id=job_id,
                 context=context,
-                include_raw_data=False
+                include_raw_data=False,
+                checkpoints=checkpoints
             )
+            cbil_analysis_text = evaluation_result.cbil_analysis_text
 
             total_processing_time = (datetime.now() - start_time).total_seconds()
             logger.info(f"Job {job_id}: Comprehensive evaluation completed in {total_processing_time:.2f}s")
@@ -711,15 +933,22 @@ async def process_comprehensive_cbil_analysis(
 
         # Success
         job_data.update({
-            "status": "completed",
             "message": "Comprehensive CBIL analysis completed successfully",
-            "result": result_dict,
-            "updated_at": datetime.now().isoformat(),
             "processing_time": total_processing_time
         })
 
-        redis_client.setex(f"analysis_job:{job_id}", 7200, json.dumps(job_data))
+        # LLM 장애로 "No"로 대체된 체크리스트 호출 (실제 답과 구분할 수 있도록 상태에 기록)
+        degraded_calls = (
+            result_dict.get("matrix_analysis", {}).get("statistics", {}).get("llm", {}).get("degraded_calls", 0)
+        )
+        if degraded_calls:
+            logger.warning(f"Job {job_id}: {degraded_calls} checklist calls degraded to default 'No' answers")
+            job_data["degraded_calls"] = degraded_calls
+            job_data["message"] += f" ({degraded_calls} checklist calls degraded during an LLM outage)"
+
+        save_job_result(job_id, job_data, result_dict, 7200)
         logger.info(f"Job {job_id}: Results stored in Redis")
+        checkpoints.clear()
 
         # Store in database
         try:
@@ -760,22 +989,30 @@ async def process_comprehensive_cbil_analysis(
         logger.error(f"Job {job_id}: Comprehensive analysis failed: {str(e)}")
         import traceback
         logger.error(traceback.format_exc())
+        if raise_errors and not isinstance(e, AnalysisInputError):
+            # 재시도될 수 있으므로 종료 상태(failed)를 기록/발행하지 않음
+            raise
 
         job_data.update({
             "status": "failed",
             "message": f"Comprehensive analysis failed: {str(e)}",
             "updated_at": datetime.now().isoformat()
         })
-        redis_client.setex(f"analysis_job:{job_id}", 7200, json.dumps(job_data))
+        save_job_status(job_id, job_data, 7200)
+        if raise_errors:
+            raise
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
+    from services.openai_service import get_llm_health
+
     return {
         "status": "healthy", 
         "service": "analysis", 
         "timestamp": datetime.now().isoformat(),
-        "available_frameworks": list(ANALYSIS_FRAMEWORKS.keys())
+        "available_frameworks": list(ANALYSIS_FRAMEWORKS.keys()),
+        "llm_providers": get_llm_health()
     }
 
 @app.get("/api/analyze/frameworks")
@@ -811,10 +1048,22 @@ async def analyze_text(request: AnalysisRequest, background_tasks: BackgroundTas
         ttl = 7200 if request.framework == "cbil_comprehensive" else 3600
 
         # Store in Redis
-        redis_client.setex(f"analysis_job:{job_id}", ttl, json.dumps(job_data))
+        save_job_status(job_id, job_data, ttl)
 
         # Add appropriate background task based on framework
-        if request.framework == "cbil_comprehensive":
+        if ANALYSIS_USE_CELERY:
+            # Durable queue: separate worker processes (celery_tasks.py), acked after completion
+            if request.framework == "cbil_comprehensive":
+                celery_app.send_task(
+                    "analysis_service.process_comprehensive_cbil_analysis",
+                    args=[job_id, request.text, request.metadata or {}, request.segments or []]
+                )
+            else:
+                celery_app.send_task(
+                    "analysis_service.process_analysis_job",
+                    args=[job_id, request.text, request.framework, request.metadata or {}]
+                )
+        elif request.framework == "cbil_comprehensive":
             # Use comprehensive CBIL + Module 3 analysis with segments
             background_tasks.add_task(
                 process_comprehensive_cbil_analysis,
@@ -846,19 +1095,52 @@ async def analyze_text(request: AnalysisRequest, background_tasks: BackgroundTas
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/api/analyze/{job_id}")
-async def get_analysis_status(job_id: str):
-    """Get analysis job status"""
+async def get_analysis_status(job_id: str, include_result: bool = True):
+    """
+    Get analysis job status
+
+    The completed result is attached as "result" unless include_result=false
+    (status polls only need the status record).
+    """
     try:
-        job_data = redis_client.get(f"analysis_job:{job_id}")
-        if not job_data:
+        job = job_store.load_status(job_id)
+        if job is None:
             raise HTTPException(status_code=404, detail="Analysis job not found")
-        
-        return json.loads(job_data)
-    
+
+        if include_result and job.get("has_result"):
+            job["result"] = job_store.load_result(job_id)
+
+        return job
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting analysis status: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@app.get("/api/analyze/{job_id}/events")
+async def stream_analysis_status(job_id: str):
+    """
+    Stream analysis job status transitions (Server-Sent Events)
+
+    Sends the current status first, then every status change published by the job
+    (without the result payload), and closes after "completed" or "failed".
+    Fetch the result from GET /api/analyze/{job_id} once completed.
+    """
+    if job_store.load_status(job_id) is None:
+        raise HTTPException(status_code=404, detail="Analysis job not found")
+
+    return StreamingResponse(
+        stream_job_events(
+            async_redis_client,
+            job_event_channel(JOB_EVENTS_CHANNEL_PREFIX, job_id),
+            lambda: job_store.load_status(job_id),
+            JOB_TERMINAL_STATUSES
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.post("/api/analyze/transcript")
 async def analyze_transcript(
     transcription_result: Dict[str, Any],
@@ -991,19 +1273,7 @@ excel_exporter = ExcelReportExporter()
 async def get_html_report(job_id: str):
     """Generate HTML report for completed analysis"""
     try:
-        job_data = redis_client.get(f"analysis_job:{job_id}")
-        if not job_data:
-            raise HTTPException(status_code=404, detail="Analysis job not found")
-        
-        job = json.loads(job_data)
-        
-        if job.get("status") != "completed":
-            raise HTTPException(status_code=400, detail="Analysis not completed yet")
-        
-        if "result" not in job:
-            raise HTTPException(status_code=400, detail="No analysis result found")
-
-        result = job["result"]
+        result = load_completed_result(job_id)
 
         # Result should already be a dict from Redis
         # Check both framework and evaluation_type fields
@@ -1050,19 +1320,7 @@ async def get_diagnostic_report(job_id: str):
     Only works for comprehensive analysis (cbil_comprehensive framework)
     """
     try:
-        job_data = redis_client.get(f"analysis_job:{job_id}")
-        if not job_data:
-            raise HTTPException(status_code=404, detail="Analysis job not found")
-
-        job = json.loads(job_data)
-
-        if job.get("status") != "completed":
-            raise HTTPException(status_code=400, detail="Analysis not completed yet")
-
-        if "result" not in job:
-            raise HTTPException(status_code=400, detail="No analysis result found")
-
-        result = job["result"]
+        result = load_completed_result(job_id)
         framework = result.get("framework", "")
 
         # Diagnostic reports are only available for comprehensive analysis
@@ -1095,19 +1353,7 @@ async def get_diagnostic_report(job_id: str):
 async def get_report_data(job_id: str):
     """Get structured report data for frontend"""
     try:
-        job_data = redis_client.get(f"analysis_job:{job_id}")
-        if not job_data:
-            raise HTTPException(status_code=404, detail="Analysis job not found")
-        
-        job = json.loads(job_data)
-        
-        if job.get("status") != "completed":
-            raise HTTPException(status_code=400, detail="Analysis not completed yet")
-        
-        if "result" not in job:
-            raise HTTPException(status_code=400, detail="No analysis result found")
-        
-        result = job["result"]
+        result = load_completed_result(job_id, REPORT_DATA_SECTIONS)
         framework = result.get("framework", "generic")
 
         # Extract chart data and recommendations
@@ -1157,23 +1403,13 @@ async def get_pdf_report(job_id: str):
                 detail="PDF generation is not available. WeasyPrint is not installed."
             )
         
-        job_data = redis_client.get(f"analysis_job:{job_id}")
-        if not job_data:
-            raise HTTPException(status_code=404, detail="Analysis job not found")
-        
-        job = json.loads(job_data)
-        
-        if job.get("status") != "completed":
-            raise HTTPException(status_code=400, detail="Analysis not completed yet")
-        
-        if "result" not in job:
-            raise HTTPException(status_code=400, detail="No analysis result found")
-        
+        result = load_completed_result(job_id)
+
         # Generate PDF
-        pdf_bytes = pdf_generator.generate_pdf_report(job["result"])
+        pdf_bytes = pdf_generator.generate_pdf_report(result)
         
         # Generate filename
-        filename = pdf_generator.generate_pdf_filename(job["result"])
+        filename = pdf_generator.generate_pdf_filename(result)
         
         # Return PDF as download
         return Response(
@@ -1203,19 +1439,7 @@ async def get_enhanced_pdf_report(job_id: str, include_cover: bool = True):
                 detail="PDF generation is not available. WeasyPrint is not installed."
             )
 
-        job_data = redis_client.get(f"analysis_job:{job_id}")
-        if not job_data:
-            raise HTTPException(status_code=404, detail="Analysis job not found")
-
-        job = json.loads(job_data)
-
-        if job.get("status") != "completed":
-            raise HTTPException(status_code=400, detail="Analysis not completed yet")
-
-        if "result" not in job:
-            raise HTTPException(status_code=400, detail="No analysis result found")
-
-        result = job["result"]
+        result = load_completed_result(job_id)
         framework = result.get("framework", "generic")
 
         # Only generate enhanced PDFs for cbil_comprehensive framework
@@ -1260,19 +1484,7 @@ async def get_3d_matrix_visualization(job_id: str):
     Returns interactive Plotly 3D scatter plot showing Stage × Context × Level
     """
     try:
-        job_data = redis_client.get(f"analysis_job:{job_id}")
-        if not job_data:
-            raise HTTPException(status_code=404, detail="Analysis job not found")
-
-        job = json.loads(job_data)
-
-        if job.get("status") != "completed":
-            raise HTTPException(status_code=400, detail="Analysis not completed yet")
-
-        if "result" not in job:
-            raise HTTPException(status_code=400, detail="No analysis result found")
-
-        result = job["result"]
+        result = load_completed_result(job_id, MATRIX_VISUALIZATION_SECTIONS)
         framework = result.get("framework", "generic")
 
         # Only available for cbil_comprehensive framework
@@ -1320,19 +1532,7 @@ async def get_excel_report(job_id: str):
     - Coaching Feedback
     """
     try:
-        job_data = redis_client.get(f"analysis_job:{job_id}")
-        if not job_data:
-            raise HTTPException(status_code=404, detail="Analysis job not found")
-
-        job = json.loads(job_data)
-
-        if job.get("status") != "completed":
-            raise HTTPException(status_code=400, detail="Analysis not completed yet")
-
-        if "result" not in job:
-            raise HTTPException(status_code=400, detail="No analysis result found")
-
-        result = job["result"]
+        result = load_completed_result(job_id)
         framework = result.get("framework", "generic")
 
         # Generate Excel export
@@ -1368,19 +1568,7 @@ async def get_2d_heatmaps(job_id: str):
     Returns three 2D heatmaps showing Stage × Context for each Level (L1, L2, L3)
     """
     try:
-        job_data = redis_client.get(f"analysis_job:{job_id}")
-        if not job_data:
-            raise HTTPException(status_code=404, detail="Analysis job not found")
-
-        job = json.loads(job_data)
-
-        if job.get("status") != "completed":
-            raise HTTPException(status_code=400, detail="Analysis not completed yet")
-
-        if "result" not in job:
-            raise HTTPException(status_code=400, detail="No analysis result found")
-
-        result = job["result"]
+        result = load_completed_result(job_id, MATRIX_VISUALIZATION_SECTIONS)
         framework = result.get("framework", "generic")
 
         # Only available for cbil_comprehensive framework
@@ -1422,19 +1610,7 @@ async def get_distribution_charts(job_id: str):
     Returns three bar charts showing percentage distributions across each dimension
     """
     try:
-        job_data = redis_client.get(f"analysis_job:{job_id}")
-        if not job_data:
-            raise HTTPException(status_code=404, detail="Analysis job not found")
-
-        job = json.loads(job_data)
-
-        if job.get("status") != "completed":
-            raise HTTPException(status_code=400, detail="Analysis not completed yet")
-
-        if "result" not in job:
-            raise HTTPException(status_code=400, detail="No analysis result found")
-
-        result = job["result"]
+        result = load_completed_result(job_id, MATRIX_VISUALIZATION_SECTIONS)
         framework = result.get("framework", "generic")
 
         # Only available for cbil_comprehensive framework
@@ -1523,14 +1699,16 @@ async def generate_html_report(request: ReportGenerationRequest):
 
 @app.get("/api/reports/status/{job_id}")
 async def get_report_status(job_id: str):
-    """Get analysis job status for report generation"""
+    """Get analysis job status for report generation (status record only, see has_result)"""
     try:
-        job_data = redis_client.get(f"analysis_job:{job_id}")
-        if not job_data:
+        job = job_store.load_status(job_id)
+        if job is None:
             raise HTTPException(status_code=404, detail="Analysis job not found")
-        
-        return json.loads(job_data)
-    
+
+        return job
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting report status: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -1550,7 +1728,7 @@ async def get_stats():
     """Get service statistics"""
     try:
         # Get all job keys
-        job_keys = redis_client.keys("analysis_job:*")
+        job_keys = job_store.status_keys()
         
         stats = {
             "total_analyses": len(job_keys),
@@ -1565,9 +1743,11 @@ async def get_stats():
             framework_counts = {}
             
             for key in job_keys:
-                job_data = json.loads(redis_client.get(key))
-                status = job_data.get("status", "unknown")
-                framework = job_data.get("framework", "unknown")
+                job_data = job_store.load_status_fields(
+                    AnalysisJobStore.job_id_from_key(key), ["status", "framework"]
+                )
+                status = job_data["status"] or "unknown"
+                framework = job_data["framework"] or "unknown"
                 
                 status_counts[status] = status_counts.get(status, 0) + 1
                 framework_counts[framework] = framework_counts.get(framework, 0) + 1
@@ -1581,6 +1761,36 @@ async def get_stats():
         logger.error(f"Error getting stats: {str(e)}")
         return {"error": "Could not retrieve stats"}
 
+@app.post("/api/cache/warmup")
+async def start_cache_warmup(background_tasks: BackgroundTasks, limit: Optional[int] = None):
+    """Replay stored transcripts at batch priority to pre-populate the semantic cache (resumable)"""
+    from services.cache_warmup import CacheWarmupJob, get_warmup_state
+
+    state = get_warmup_state(redis_client)
+    if state.get("running"):
+        raise HTTPException(status_code=409, detail="Cache warm-up already running")
+
+    if ANALYSIS_USE_CELERY:
+        # 수 시간짜리 재생이 웹 프로세스의 요청 처리와 경쟁하거나 재시작과 함께 사라지지 않도록 worker에서 실행
+        celery_app.send_task("analysis_service.cache_warmup", args=[limit])
+    else:
+        job = CacheWarmupJob(semantic_cache)
+        background_tasks.add_task(job.run, limit)
+    return {"message": "Cache warm-up started", "limit": limit, "resume_cursor": state.get("cursor")}
+
+@app.get("/api/cache/warmup")
+async def get_cache_warmup_status():
+    """Cache warm-up progress"""
+    from services.cache_warmup import get_warmup_state
+    return get_warmup_state(redis_client)
+
+@app.post("/api/cache/warmup/stop")
+async def stop_cache_warmup():
+    """Stop the running cache warm-up after the current transcript (resume later)"""
+    from services.cache_warmup import request_warmup_stop
+    request_warmup_stop(redis_client)
+    return {"message": "Stop requested"}
+
 @app.post("/api/reports/generate/comprehensive", response_class=HTMLResponse)
 async def generate_comprehensive_report(request: ComprehensiveReportRequest):
     """Generate comprehensive HTML report combining multiple analysis results"""
@@ -1660,8 +1870,8 @@ async def get_comprehensive_report_status(job_ids: str):
         
         for job_id in job_id_list:
             try:
-                job_data = redis_client.get(f"analysis_job:{job_id}")
-                if not job_data:
+                job = job_store.load_status(job_id)
+                if job is None:
                     job_statuses.append({
                         "job_id": job_id,
                         "status": "missing",
@@ -1670,7 +1880,6 @@ async def get_comprehensive_report_status(job_ids: str):
                     summary["missing"] += 1
                     continue
                 
-                job = json.loads(job_data)
                 status = job.get("status", "unknown")
                 
                 job_status = {
@@ -1678,12 +1887,12 @@ async def get_comprehensive_report_status(job_ids: str):
                     "status": status,
                     "framework": job.get("framework"),
                     "message": job.get("message", ""),
-                    "has_result": "result" in job,
+                    "has_result": bool(job.get("has_result")),
                     "created_at": job.get("created_at"),
                     "updated_at": job.get("updated_at")
                 }
                 
-                if status == "completed" and "result" in job:
+                if status == "completed" and job.get("has_result"):
                     framework_name = report_generator.FRAMEWORK_NAMES.get(
                         job.get("framework"), 
                         job.get("framework", "Unknown")
@@ -1743,8 +1952,7 @@ async def get_research_stats():
         db.close()
         
         # Add Redis stats
-        redis_keys = redis_client.keys("analysis_job:*")
-        research_stats["redis_jobs"] = len(redis_keys)
+        research_stats["redis_jobs"] = len(job_store.status_keys())
         research_stats["timestamp"] = datetime.now().isoformat()
         
         return research_stats
@@ -0,0 +1,329 @@
+"""
+Semantic Cache Warm-up Job
+저장된 전사본(TranscriptDB.segments_json)을 분류기에 재실행하여 SemanticCache를 미리 채운다
+
+Redis flush나 체크리스트 변경(fingerprint 변경) 직후 첫 분석들이 LLM 비용/지연을 모두 떠안지 않도록,
+새 배포를 사용자 요청 전에 데워 두는 용도. 분석 파이프라인과 같은 MatrixBuilder를 사용하므로
+실제 분석과 같은 캐시 키가 채워지고, 이미 캐시된 발화는 LLM을 호출하지 않는다.
+
+- 우선순위: 전역 LLM 스케줄러의 "batch" 클래스로 실행하여 사용자 분석 요청에 항상 양보
+- rate limit: 동시 LLM 요청 상한 + 분당 전사본 수 제한
+- 재개: 진행 상태(cursor)를 Redis에 저장, 중단 후 다시 실행하면 이어서 처리 (최신 전사본부터)
+- 동시 실행 방지: Redis lock (실행 중에는 heartbeat로 TTL 갱신, 프로세스가 죽으면 TTL 후 해제)
+
+CLI:
+    python -m services.cache_warmup --limit 200 --transcripts-per-minute 6
+    python -m services.cache_warmup --status
+    python -m services.cache_warmup --reset
+
+환경변수:
+    CACHE_WARMUP_MAX_CONCURRENCY: 워밍 작업의 동시 LLM 요청 상한 (기본값: 4)
+    CACHE_WARMUP_TRANSCRIPTS_PER_MINUTE: 분당 처리할 전사본 수 (기본값: 0 = 제한 없음)
+"""
+
+import os
+import time
+import uuid
+import json
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from services.llm_scheduler import PRIORITY_BATCH
+from services.openai_service import OpenAIService
+from utils.semantic_cache import SemanticCache
+from utils.utterance_parser import segments_to_utterances
+
+logger = logging.getLogger(__name__)
+
+STATE_KEY = "cache_warmup:v1:state"
+LOCK_KEY = "cache_warmup:v1:lock"
+LOCK_TTL_SECONDS = 600
+# 전사본 하나가 오래 걸려도(batch 우선순위로 계속 양보) lock이 만료되지 않도록 주기적으로 갱신
+LOCK_HEARTBEAT_SECONDS = LOCK_TTL_SECONDS / 4
+
+# 분석 파이프라인과 같은 최소 세그먼트 수 (main.process_comprehensive_cbil_analysis)
+MIN_SEGMENTS = 10
+
+
+class CacheWarmupJob:
+    """전사본 재생 기반 SemanticCache 워밍 작업"""
+
+    def __init__(
+        self,
+        semantic_cache: SemanticCache,
+        session_factory=None,
+        matrix_builder=None,
+        max_concurrent_requests: Optional[int] = None,
+        transcripts_per_minute: Optional[float] = None,
+        page_size: int = 20
+    ):
+        """
+        Args:
+            semantic_cache: 채울 SemanticCache (진행 상태도 같은 Redis에 저장)
+            session_factory: DB 세션 팩토리 (기본값: database.SessionLocal)
+            matrix_builder: 분류에 사용할 MatrixBuilder (기본값: batch 우선순위 OpenAIService로 생성)
+            max_concurrent_requests: 동시 LLM 요청 상한 (기본값: 환경변수 CACHE_WARMUP_MAX_CONCURRENCY 또는 4)
+            transcripts_per_minute: 분당 처리할 전사본 수 (기본값: 환경변수 CACHE_WARMUP_TRANSCRIPTS_PER_MINUTE, 0 = 제한 없음)
+            page_size: DB에서 한 번에 읽을 전사본 수
+        """
+        self.semantic_cache = semantic_cache
+        self.redis = semantic_cache.redis
+
+        if session_factory is None:
+            from database import SessionLocal
+            session_factory = SessionLocal
+        self.session_factory = session_factory
+
+        if max_concurrent_requests is None:
+            max_concurrent_requests = int(os.getenv("CACHE_WARMUP_MAX_CONCURRENCY", "4"))
+        if transcripts_per_minute is None:
+            transcripts_per_minute = float(os.getenv("CACHE_WARMUP_TRANSCRIPTS_PER_MINUTE", "0"))
+        self.transcripts_per_minute = max(0.0, transcripts_per_minute)
+        self.page_size = max(1, page_size)
+
+        if matrix_builder is None:
+            from core.matrix_builder import MatrixBuilder
+            matrix_builder = MatrixBuilder(
+                openai_service=OpenAIService(
+                    max_concurrent_requests=max(1, max_concurrent_requests),
+                    priority=PRIORITY_BATCH
+                ),
+                semantic_cache=semantic_cache
+            )
+        self.matrix_builder = matrix_builder
+
+    # ============================================================
+    # 진행 상태 (Redis hash)
+    # ============================================================
+
+    def get_state(self) -> Dict[str, Any]:
+        """진행 상태 조회"""
+        return get_warmup_state(self.redis)
+
+    def reset(self):
+        """진행 상태 초기화 (다음 실행은 가장 최신 전사본부터)"""
+        self.redis.delete(STATE_KEY)
+
+    def _update_state(self, **fields):
+        fields["updated_at"] = datetime.now().isoformat()
+        self.redis.hset(STATE_KEY, mapping={k: str(v) for k, v in fields.items()})
+
+    def _increment(self, field: str, amount: int = 1):
+        self.redis.hincrby(STATE_KEY, field, amount)
+
+    # ============================================================
+    # 실행 lock
+    # ============================================================
+
+    def _owns_lock(self, token: str) -> bool:
+        value = self.redis.get(LOCK_KEY)
+        if isinstance(value, bytes):
+            value = value.decode("utf-8")
+        return value == token
+
+    async def _heartbeat(self, token: str):
+        """실행 중 lock TTL 갱신 (다른 실행이 lock을 가져갔으면 중단)"""
+        while True:
+            await asyncio.sleep(LOCK_HEARTBEAT_SECONDS)
+            try:
+                if not self._owns_lock(token):
+                    logger.warning("Cache warm-up lock lost, stopping heartbeat")
+                    return
+                self.redis.expire(LOCK_KEY, LOCK_TTL_SECONDS)
+            except Exception as e:
+                # 일시적 Redis 오류: 다음 주기에 다시 시도 (TTL이 heartbeat 주기보다 충분히 김)
+                logger.warning(f"Cache warm-up lock refresh failed: {e}")
+
+    def _release_lock(self, token: str):
+        if self._owns_lock(token):
+            self.redis.delete(LOCK_KEY)
+
+    # ============================================================
+    # 전사본 조회
+    # ============================================================
+
+    def _load_page(self, cursor: Optional[int]) -> List[Dict[str, Any]]:
+        """cursor(마지막으로 처리한 id)보다 오래된 전사본을 최신순으로 page_size개 조회"""
+        from database import TranscriptDB
+
+        db = self.session_factory()
+        try:
+            query = db.query(
+                TranscriptDB.id, TranscriptDB.transcript_id, TranscriptDB.segments_json
+            ).filter(TranscriptDB.segments_json.isnot(None))
+            if cursor is not None:
+                query = query.filter(TranscriptDB.id < cursor)
+            rows = query.order_by(TranscriptDB.id.desc()).limit(self.page_size).all()
+            return [
+                {"id": row.id, "transcript_id": row.transcript_id, "segments": row.segments_json}
+                for row in rows
+            ]
+        finally:
+            db.close()
+
+    # ============================================================
+    # 실행
+    # ============================================================
+
+    async def warm_transcript(self, segments: Any) -> int:
+        """
+        전사본 하나의 발화를 분류하여 캐시 채우기
+
+        Returns:
+            워밍한 발화 수 (세그먼트 부족으로 건너뛰면 0)
+        """
+        if isinstance(segments, str):
+            segments = json.loads(segments)
+        if not segments or len(segments) < MIN_SEGMENTS:
+            return 0
+
+        utterances = segments_to_utterances(segments)
+        if not utterances:
+            return 0
+
+        await self.matrix_builder.build_3d_matrix(utterances=utterances, include_raw_data=False)
+        return len(utterances)
+
+    async def run(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        워밍 실행 (이전 실행의 cursor부터 재개)
+
+        Args:
+            limit: 이번 실행에서 처리할 최대 전사본 수 (None = 끝까지)
+
+        Returns:
+            실행 후 진행 상태
+        """
+        token = uuid.uuid4().hex
+        if not self.redis.set(LOCK_KEY, token, nx=True, ex=LOCK_TTL_SECONDS):
+            logger.warning("Cache warm-up already running, skipping")
+            return self.get_state()
+        heartbeat = asyncio.create_task(self._heartbeat(token))
+
+        interval = 60.0 / self.transcripts_per_minute if self.transcripts_per_minute else 0.0
+        handled = 0
+
+        try:
+            state = self.get_state()
+            cursor = state.get("cursor")
+            self.redis.hdel(STATE_KEY, "stop_requested")
+            self._update_state(status="running", started_at=datetime.now().isoformat())
+            logger.info(f"Cache warm-up started (cursor={cursor}, limit={limit or 'none'})")
+
+            stopped = False
+            while not stopped and (limit is None or handled < limit):
+                page = self._load_page(cursor)
+                if not page:
+                    break
+
+                for transcript in page:
+                    if limit is not None and handled >= limit:
+                        break
+                    if self.redis.hget(STATE_KEY, "stop_requested"):
+                        stopped = True
+                        break
+
+                    started_at = time.monotonic()
+                    try:
+                        count = await self.warm_transcript(transcript["segments"])
+                        if count:
+                            self._increment("processed")
+                            self._increment("utterances", count)
+                        else:
+                            self._increment("skipped")
+                    except Exception as e:
+                        # 한 전사본의 실패로 전체 작업을 멈추지 않음
+                        logger.error(f"Cache warm-up failed for transcript {transcript['transcript_id']}: {e}")
+                        self._increment("failed")
+
+                    cursor = transcript["id"]
+                    handled += 1
+                    self._update_state(cursor=cursor, last_transcript_id=transcript["transcript_id"])
+
+                    # 분당 전사본 수 제한
+                    remaining = interval - (time.monotonic() - started_at)
+                    if remaining > 0:
+                        await asyncio.sleep(remaining)
+
+            if stopped:
+                status = "stopped"
+            elif limit is not None and handled >= limit:
+                status = "paused"
+            else:
+                status = "completed"
+            if status == "completed":
+                # 다음 실행은 다시 최신 전사본부터 (이미 캐시된 발화는 LLM 호출 없이 통과)
+                self.redis.hdel(STATE_KEY, "cursor")
+            self.semantic_cache.flush_stats()
+            self._update_state(status=status, finished_at=datetime.now().isoformat())
+            logger.info(f"Cache warm-up {status}: {handled} transcripts handled this run")
+
+        except Exception as e:
+            logger.error(f"Cache warm-up error: {e}")
+            self._update_state(status="failed", error=str(e))
+            raise
+
+        finally:
+            heartbeat.cancel()
+            self._release_lock(token)
+
+        return self.get_state()
+
+
+def get_warmup_state(redis_client) -> Dict[str, Any]:
+    """진행 상태 조회 (작업 인스턴스 없이, OpenAIService/DB 초기화 불필요)"""
+    state = redis_client.hgetall(STATE_KEY) or {}
+    for field in ("cursor", "processed", "skipped", "failed", "utterances"):
+        if field in state:
+            state[field] = int(state[field])
+    state["running"] = bool(redis_client.exists(LOCK_KEY))
+    return state
+
+
+def request_warmup_stop(redis_client):
+    """실행 중인 작업에 중단 요청 (현재 전사본을 끝낸 뒤 멈춤, 이후 재개 가능)"""
+    redis_client.hset(STATE_KEY, "stop_requested", "1")
+
+
+def main():
+    import argparse
+    import redis
+
+    parser = argparse.ArgumentParser(description="Pre-populate the semantic cache from stored transcripts")
+    parser.add_argument("--limit", type=int, default=None, help="최대 전사본 수 (기본값: 전체)")
+    parser.add_argument("--transcripts-per-minute", type=float, default=None, help="분당 전사본 수 (0 = 제한 없음)")
+    parser.add_argument("--max-concurrency", type=int, default=None, help="동시 LLM 요청 상한")
+    parser.add_argument("--status", action="store_true", help="진행 상태만 출력")
+    parser.add_argument("--reset", action="store_true", help="진행 상태 초기화 후 최신 전사본부터 다시 시작")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    redis_client = redis.Redis(
+        host=os.getenv('REDIS_HOST', 'redis'),
+        port=int(os.getenv('REDIS_PORT', 6379)),
+        password=os.getenv('REDIS_PASSWORD'),
+        decode_responses=True
+    )
+    semantic_cache = SemanticCache(redis_client)
+
+    if args.status:
+        print(json.dumps(get_warmup_state(redis_client), indent=2, ensure_ascii=False))
+        return
+
+    job = CacheWarmupJob(
+        semantic_cache,
+        max_concurrent_requests=args.max_concurrency,
+        transcripts_per_minute=args.transcripts_per_minute
+    )
+    if args.reset:
+        job.reset()
+
+    state = asyncio.run(job.run(limit=args.limit))
+    print(json.dumps(state, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
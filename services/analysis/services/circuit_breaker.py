@@ -0,0 +1,236 @@
+"""
+LLM Provider Circuit Breaker
+provider별 프로세스 전역 회로 차단기 (closed → open → half-open → closed)
+
+최근 window_seconds 동안의 호출 결과(실패율 + 지연 시간)를 추적하여,
+장애 중인 provider로는 요청을 보내지 않고 open_seconds 후 소수의 probe 요청으로 복구를 확인한다.
+timeout까지 기다리는 대신 즉시 건강한 provider로 라우팅하므로 장애 중에도 작업 지연 시간이 제한된다.
+
+환경변수 (provider = UPSTAGE | ANTHROPIC):
+    LLM_BREAKER_FAILURE_RATE: 회로를 여는 실패율 (기본값: 0.5)
+    LLM_BREAKER_MIN_REQUESTS: 실패율을 판단할 최소 호출 수 (기본값: 5)
+    LLM_BREAKER_WINDOW_SECONDS: 실패율/지연 시간 집계 구간 (기본값: 60)
+    LLM_BREAKER_OPEN_SECONDS: open 상태 유지 시간 (기본값: 30)
+    LLM_BREAKER_AUTH_OPEN_SECONDS: 401/크레딧 부족 시 open 유지 시간 (기본값: 600)
+    LLM_SLOW_CALL_SECONDS: 이 시간보다 느린 성공 호출은 실패로 집계 (기본값: 30, 0 = 비활성화)
+"""
+
+import os
+import time
+import logging
+import threading
+from collections import deque
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """provider 하나에 대한 회로 차단기"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        min_requests: int = 5,
+        window_seconds: float = 60.0,
+        open_seconds: float = 30.0,
+        auth_open_seconds: float = 600.0,
+        slow_call_seconds: float = 30.0,
+        half_open_max_probes: int = 1
+    ):
+        """
+        Args:
+            name: provider 이름 (로그용)
+            failure_rate_threshold: window 내 실패율이 이 값 이상이면 open
+            min_requests: 실패율을 판단하기 위한 window 내 최소 호출 수
+            window_seconds: 집계 구간 (초)
+            open_seconds: open 상태 유지 시간 (초), 이후 half-open으로 전환
+            auth_open_seconds: 인증/결제 오류로 open될 때의 유지 시간 (초)
+            slow_call_seconds: 이 시간보다 느린 호출은 실패로 집계 (0 = 비활성화)
+            half_open_max_probes: half-open 상태에서 동시에 허용할 probe 요청 수
+        """
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_requests = max(1, min_requests)
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.auth_open_seconds = auth_open_seconds
+        self.slow_call_seconds = slow_call_seconds
+        self.half_open_max_probes = max(1, half_open_max_probes)
+
+        self._lock = threading.Lock()
+        self._calls = deque()  # (timestamp, ok, latency)
+        self._state = STATE_CLOSED
+        self._opened_until = 0.0
+        self._probes_in_flight = 0
+
+        self.stats = {
+            "successes": 0,
+            "failures": 0,
+            "slow_calls": 0,
+            "rejected": 0,
+            "opened": 0,
+        }
+
+    def _prune(self, now: float):
+        while self._calls and now - self._calls[0][0] > self.window_seconds:
+            self._calls.popleft()
+
+    def _update_state(self, now: float):
+        if self._state == STATE_OPEN and now >= self._opened_until:
+            self._state = STATE_HALF_OPEN
+            self._probes_in_flight = 0
+            logger.info(f"🔌 {self.name} circuit half-open, probing recovery")
+
+    def _open(self, now: float, seconds: float, reason: str):
+        self._state = STATE_OPEN
+        self._opened_until = now + seconds
+        self._probes_in_flight = 0
+        self._calls.clear()
+        self.stats["opened"] += 1
+        logger.warning(f"⚠️  {self.name} circuit opened for {seconds:.0f}s ({reason})")
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._update_state(time.monotonic())
+            return self._state
+
+    def allow_request(self) -> bool:
+        """
+        요청을 보내도 되는지 확인 (half-open이면 probe 슬롯 확보)
+
+        True를 받은 호출자는 반드시 record_success / record_failure 중 하나를 호출해야 한다.
+        """
+        with self._lock:
+            self._update_state(time.monotonic())
+
+            if self._state == STATE_CLOSED:
+                return True
+
+            if self._state == STATE_HALF_OPEN and self._probes_in_flight < self.half_open_max_probes:
+                self._probes_in_flight += 1
+                return True
+
+            self.stats["rejected"] += 1
+            return False
+
+    def record_success(self, latency: float):
+        """성공 응답 기록 (slow_call_seconds보다 느리면 실패로 집계)"""
+        if self.slow_call_seconds and latency > self.slow_call_seconds:
+            with self._lock:
+                self.stats["slow_calls"] += 1
+            self.record_failure(latency, reason=f"slow call {latency:.1f}s")
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self.stats["successes"] += 1
+
+            if self._state == STATE_HALF_OPEN:
+                self._state = STATE_CLOSED
+                self._probes_in_flight = 0
+                self._calls.clear()
+                logger.info(f"✓ {self.name} circuit closed (probe succeeded)")
+
+            self._calls.append((now, True, latency))
+            self._prune(now)
+
+    def record_failure(self, latency: float, reason: str = "error", auth_error: bool = False):
+        """
+        실패 기록
+
+        Args:
+            latency: 호출 소요 시간 (초)
+            reason: 로그용 사유
+            auth_error: 401/크레딧 부족 등 재시도해도 회복되지 않는 오류면 즉시 장시간 open
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.stats["failures"] += 1
+
+            if auth_error:
+                self._open(now, self.auth_open_seconds, reason)
+                return
+
+            if self._state == STATE_HALF_OPEN:
+                self._open(now, self.open_seconds, f"probe failed: {reason}")
+                return
+
+            if self._state == STATE_OPEN:
+                # open 이전에 출발한 요청의 늦은 실패
+                return
+
+            self._calls.append((now, False, latency))
+            self._prune(now)
+
+            failures = sum(1 for _, ok, _ in self._calls if not ok)
+            if len(self._calls) >= self.min_requests and \
+                    failures / len(self._calls) >= self.failure_rate_threshold:
+                self._open(
+                    now, self.open_seconds,
+                    f"{failures}/{len(self._calls)} failures in {self.window_seconds:.0f}s, last: {reason}"
+                )
+
+    def release(self):
+        """결과를 기록하지 못하고 끝난 요청(취소 등)의 probe 슬롯 반환"""
+        with self._lock:
+            if self._state == STATE_HALF_OPEN and self._probes_in_flight > 0:
+                self._probes_in_flight -= 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            self._update_state(now)
+            self._prune(now)
+            latencies = sorted(latency for _, ok, latency in self._calls if ok)
+            failures = sum(1 for _, ok, _ in self._calls if not ok)
+            return {
+                **self.stats,
+                "state": self._state,
+                "window_requests": len(self._calls),
+                "window_failure_rate": round(failures / len(self._calls), 2) if self._calls else 0.0,
+                "window_p95_latency": (
+                    round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 2)
+                    if latencies else None
+                ),
+                "open_remaining_seconds": round(max(0.0, self._opened_until - now), 1) if self._state == STATE_OPEN else 0.0,
+            }
+
+
+def is_auth_error(error: Exception) -> bool:
+    """401 / 크레딧 부족 / API 키 오류인지 확인 (timeout 재시도로 회복되지 않는 오류)"""
+    if getattr(error, "status_code", None) in (401, 402, 403):
+        return True
+    error_str = str(error).lower()
+    return "401" in error_str or "insufficient credit" in error_str or "api_key" in error_str
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(provider: str) -> CircuitBreaker:
+    """
+    provider별 프로세스 전역 회로 차단기 반환 (최초 호출 시 환경변수로 생성)
+
+    Args:
+        provider: "upstage" | "anthropic"
+    """
+    with _breakers_lock:
+        if provider not in _breakers:
+            _breakers[provider] = CircuitBreaker(
+                name=provider,
+                failure_rate_threshold=float(os.getenv("LLM_BREAKER_FAILURE_RATE", "0.5")),
+                min_requests=int(os.getenv("LLM_BREAKER_MIN_REQUESTS", "5")),
+                window_seconds=float(os.getenv("LLM_BREAKER_WINDOW_SECONDS", "60")),
+                open_seconds=float(os.getenv("LLM_BREAKER_OPEN_SECONDS", "30")),
+                auth_open_seconds=float(os.getenv("LLM_BREAKER_AUTH_OPEN_SECONDS", "600")),
+                slow_call_seconds=float(os.getenv("LLM_SLOW_CALL_SECONDS", "30"))
+            )
+        return _breakers[provider]
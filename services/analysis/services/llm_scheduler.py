@@ -0,0 +1,303 @@
+"""
+LLM Request Scheduler
+프로세스 전역 RPM/TPM 토큰 버킷 + 우선순위 대기열 + 429 backoff
+
+모든 OpenAIService 인스턴스가 provider별 스케줄러 하나를 공유하므로,
+분류기마다 서비스를 따로 만들어도 전체 요청량이 provider quota를 넘지 않는다.
+
+환경변수 (provider = UPSTAGE | ANTHROPIC, 0 또는 미설정이면 제한 없음):
+    {PROVIDER}_RPM_LIMIT: 분당 요청 수
+    {PROVIDER}_TPM_LIMIT: 분당 토큰 수
+    LLM_RATE_LIMIT_MAX_RETRIES: 429 재시도 횟수 (기본값: 5)
+"""
+
+import os
+import time
+import heapq
+import random
+import asyncio
+import logging
+import itertools
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 우선순위 클래스 (숫자가 작을수록 먼저 처리)
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BATCH = "batch"
+PRIORITIES = {
+    PRIORITY_INTERACTIVE: 0,
+    PRIORITY_BATCH: 1,
+}
+
+
+class TokenBucket:
+    """
+    토큰 버킷 (분당 한도 → 초당 refill)
+
+    capacity가 0이면 제한 없음
+    """
+
+    def __init__(self, per_minute: int):
+        self.capacity = max(0, per_minute)
+        self.refill_rate = self.capacity / 60.0
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.capacity == 0
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated_at
+        self.updated_at = now
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount만큼 소비하기까지 남은 시간 (초)"""
+        if self.unlimited:
+            return 0.0
+        self._refill(now)
+        # 한 요청이 버킷 용량보다 크면 가득 찼을 때 통과시킨다
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.refill_rate
+
+    def consume(self, amount: float):
+        if not self.unlimited:
+            self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, delta: float):
+        """실제 사용량과 예측치의 차이를 반영 (음수 허용 → 다음 요청이 기다림)"""
+        if not self.unlimited:
+            self.tokens = min(self.capacity, self.tokens - delta)
+
+
+class LLMScheduler:
+    """provider 하나에 대한 프로세스 전역 요청 스케줄러"""
+
+    def __init__(
+        self,
+        name: str,
+        rpm_limit: int = 0,
+        tpm_limit: int = 0,
+        max_retries: int = 5,
+        base_backoff: float = 1.0,
+        max_backoff: float = 60.0
+    ):
+        """
+        Args:
+            name: provider 이름 (로그용)
+            rpm_limit: 분당 요청 수 (0 = 무제한)
+            tpm_limit: 분당 토큰 수 (0 = 무제한)
+            max_retries: 429 응답 시 재시도 횟수
+            base_backoff: 첫 재시도 대기 시간 (초, 지수 증가)
+            max_backoff: 최대 대기 시간 (초)
+        """
+        self.name = name
+        self.request_bucket = TokenBucket(rpm_limit)
+        self.token_bucket = TokenBucket(tpm_limit)
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        # 스레드/이벤트 루프에 독립적인 상태 (asyncio primitive 미사용)
+        self._lock = threading.Lock()
+        self._waiters = []  # heap of (priority, seq)
+        self._sequence = itertools.count()
+        self._paused_until = 0.0
+
+        self.stats = {
+            "requests": 0,
+            "rate_limited": 0,
+            "retries": 0,
+            "wait_seconds": 0.0,
+        }
+
+        logger.info(
+            f"LLM scheduler '{name}' initialized: "
+            f"rpm={rpm_limit or 'unlimited'}, tpm={tpm_limit or 'unlimited'}"
+        )
+
+    async def acquire(self, estimated_tokens: int, priority: str = PRIORITY_INTERACTIVE):
+        """
+        요청 1건 + estimated_tokens 토큰을 버킷에서 확보할 때까지 대기
+
+        우선순위가 높은(interactive) 요청이 대기열 앞에 서며, 같은 우선순위는 FIFO
+        """
+        entry = (PRIORITIES.get(priority, PRIORITIES[PRIORITY_BATCH]), next(self._sequence))
+        started_at = time.monotonic()
+
+        with self._lock:
+            heapq.heappush(self._waiters, entry)
+
+        try:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    wait = self._paused_until - now
+                    if wait <= 0:
+                        if self._waiters[0] != entry:
+                            # 앞선 대기자가 먼저 통과해야 함
+                            wait = 0.01
+                        else:
+                            wait = max(
+                                self.request_bucket.wait_time(1, now),
+                                self.token_bucket.wait_time(estimated_tokens, now)
+                            )
+                            if wait <= 0:
+                                self.request_bucket.consume(1)
+                                self.token_bucket.consume(estimated_tokens)
+                                heapq.heappop(self._waiters)
+                                self.stats["requests"] += 1
+                                self.stats["wait_seconds"] += now - started_at
+                                return
+
+                await asyncio.sleep(min(max(wait, 0.01), 1.0))
+        except BaseException:
+            # 취소 등으로 대기를 포기하면 대기열에서 제거
+            with self._lock:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+            raise
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: Optional[int]):
+        """응답의 실제 토큰 사용량으로 TPM 버킷 보정"""
+        if actual_tokens is None:
+            return
+        with self._lock:
+            self.token_bucket.adjust(actual_tokens - estimated_tokens)
+
+    def _pause(self, seconds: float):
+        """429 이후 모든 요청을 잠시 멈춤 (provider 전체 backoff)"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _backoff_seconds(self, attempt: int, error: Exception) -> float:
+        retry_after = _get_retry_after(error)
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        backoff = min(self.base_backoff * (2 ** attempt), self.max_backoff)
+        return backoff * (0.5 + random.random() / 2)  # jitter
+
+    async def execute(
+        self,
+        request_fn: Callable[[], Awaitable[Any]],
+        estimated_tokens: int,
+        priority: str = PRIORITY_INTERACTIVE
+    ) -> Any:
+        """
+        rate limit 안에서 요청 실행, 429 응답이면 backoff 후 재시도
+
+        Args:
+            request_fn: 호출할 때마다 새 요청을 만드는 함수
+            estimated_tokens: 입력+출력 예상 토큰 수
+            priority: "interactive" | "batch"
+
+        Returns:
+            request_fn의 응답
+
+        Raises:
+            재시도 횟수를 넘긴 429 오류, 또는 그 외 모든 API 오류
+        """
+        attempt = 0
+        while True:
+            await self.acquire(estimated_tokens, priority)
+            try:
+                response = await request_fn()
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt >= self.max_retries:
+                    raise
+
+                backoff = self._backoff_seconds(attempt, e)
+                self.stats["rate_limited"] += 1
+                self.stats["retries"] += 1
+                logger.warning(
+                    f"⚠️  {self.name} rate limited (attempt {attempt + 1}/{self.max_retries}), "
+                    f"backing off {backoff:.1f}s"
+                )
+                self._pause(backoff)
+                attempt += 1
+                continue
+
+            self.record_usage(estimated_tokens, _get_total_tokens(response))
+            return response
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "wait_seconds": round(self.stats["wait_seconds"], 2),
+                "queued": len(self._waiters),
+                "rpm_limit": self.request_bucket.capacity,
+                "tpm_limit": self.token_bucket.capacity,
+            }
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """openai/anthropic RateLimitError 또는 429 응답인지 확인"""
+    if getattr(error, "status_code", None) == 429:
+        return True
+    error_str = str(error).lower()
+    return "429" in error_str or "rate limit" in error_str or "rate_limit" in error_str
+
+
+def _get_retry_after(error: Exception) -> Optional[float]:
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        value = headers.get("retry-after")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _get_total_tokens(response: Any) -> Optional[int]:
+    """OpenAI(total_tokens) / Anthropic(input_tokens + output_tokens) 사용량 추출"""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return None
+    total = getattr(usage, "total_tokens", None)
+    if isinstance(total, int):
+        return total
+    input_tokens = getattr(usage, "input_tokens", None)
+    output_tokens = getattr(usage, "output_tokens", None)
+    if isinstance(input_tokens, int) and isinstance(output_tokens, int):
+        return input_tokens + output_tokens
+    return None
+
+
+def estimate_tokens(*texts: Optional[str], max_output_tokens: int = 0) -> int:
+    """
+    요청 토큰 수 대략 추정 (한국어 기준 약 2자당 1토큰 + 최대 출력 토큰)
+    """
+    input_chars = sum(len(text) for text in texts if text)
+    return input_chars // 2 + max_output_tokens
+
+
+_schedulers: Dict[str, LLMScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_llm_scheduler(provider: str) -> LLMScheduler:
+    """
+    provider별 프로세스 전역 스케줄러 반환 (최초 호출 시 환경변수로 생성)
+
+    Args:
+        provider: "upstage" | "anthropic"
+    """
+    with _schedulers_lock:
+        if provider not in _schedulers:
+            prefix = provider.upper()
+            _schedulers[provider] = LLMScheduler(
+                name=provider,
+                rpm_limit=int(os.getenv(f"{prefix}_RPM_LIMIT", "0")),
+                tpm_limit=int(os.getenv(f"{prefix}_TPM_LIMIT", "0")),
+                max_retries=int(os.getenv("LLM_RATE_LIMIT_MAX_RETRIES", "5"))
+            )
+        return _schedulers[provider]
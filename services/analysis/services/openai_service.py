@@ -7,15 +7,28 @@ Fallback Strategy: Upstage Solar Pro 2 → Anthropic Claude Sonnet
 
 import os
 import json
+import time
 import logging
 from typing import Dict, List, Any, Optional
 from collections import Counter
+from contextlib import asynccontextmanager
 import asyncio
 
 from openai import AsyncOpenAI
 
+from services.llm_scheduler import (
+    get_llm_scheduler, estimate_tokens, PRIORITY_INTERACTIVE
+)
+from services.circuit_breaker import get_circuit_breaker, is_auth_error, STATE_CLOSED
+from services.response_cache import ResponseCache, get_response_cache
+from utils.semantic_cache import compute_fingerprint
+
 logger = logging.getLogger(__name__)
 
+CHECKLIST_SYSTEM_PROMPT = "You are an expert in educational analysis. Answer each checklist question with only 'Yes' or 'No'. Provide your answer in JSON format only, without any additional explanation."
+
+BATCH_CHECKLIST_SYSTEM_PROMPT = "You are an expert in educational analysis. You will receive several independent checklist items, each identified by an item id. Evaluate every item separately and answer each checklist question with only 'Yes' or 'No'. Provide your answer in JSON format only, without any additional explanation."
+
 try:
     from anthropic import AsyncAnthropic
     ANTHROPIC_AVAILABLE = True
@@ -24,6 +37,29 @@ except ImportError:
     logger.warning("Anthropic library not available - fallback disabled")
 
 
+class ProviderUnavailableError(Exception):
+    """회로가 닫혀 있는(건강한) LLM provider가 없거나 모든 provider 호출이 실패함"""
+
+
+# 프로세스 전체에서 기본값("No"/빈 텍스트)으로 대체된 호출 수 (/health 노출용)
+_degraded_calls_total = 0
+
+
+def get_llm_health() -> Dict[str, Any]:
+    """프로세스 전체 provider 회로/스케줄러 상태와 기본값 대체 호출 수 (모니터링용)"""
+    return {
+        "upstage": {
+            "circuit": get_circuit_breaker("upstage").get_stats(),
+            "scheduler": get_llm_scheduler("upstage").get_stats()
+        },
+        "anthropic": {
+            "circuit": get_circuit_breaker("anthropic").get_stats(),
+            "scheduler": get_llm_scheduler("anthropic").get_stats()
+        },
+        "degraded_calls": _degraded_calls_total
+    }
+
+
 class OpenAIService:
     """OpenAI API를 사용한 체크리스트 실행 서비스"""
 
@@ -31,20 +67,37 @@ class OpenAIService:
         self,
         api_key: Optional[str] = None,
         model: str = None,  # ⚠️ CHANGED: Now reads from GPT_MODEL env var
-        num_runs: int = 3
+        num_runs: int = 3,
+        batch_size: Optional[int] = None,
+        max_concurrent_requests: Optional[int] = None,
+        adaptive_voting: Optional[bool] = None,
+        priority: str = PRIORITY_INTERACTIVE,
+        response_cache: Optional[ResponseCache] = None
     ):
         """
         Args:
             api_key: OpenAI API key (기본값: 환경변수 OPENAI_API_KEY)
             model: 사용할 모델 (기본값: 환경변수 GPT_MODEL 또는 solar-pro2)
             num_runs: 실행 횟수 (기본값: 3) - majority voting으로 일관성 보장
+            batch_size: 한 프롬프트에 묶을 체크리스트 수 (기본값: 환경변수 CHECKLIST_BATCH_SIZE 또는 1)
+                        1이면 배치 모드 비활성화 (체크리스트당 1회 호출)
+            max_concurrent_requests: 이 인스턴스를 공유하는 모든 분류기의 동시 LLM 요청 상한
+                        (기본값: 환경변수 LLM_MAX_CONCURRENT_REQUESTS 또는 16, 0이면 무제한)
+            adaptive_voting: 과반수(num_runs=3이면 2회)만 먼저 실행하고, 어떤 키라도 불일치할 때만
+                        나머지 실행을 추가 (기본값: 환경변수 LLM_ADAPTIVE_VOTING, false)
+            priority: 전역 스케줄러 우선순위 ("interactive" | "batch")
+                        배치 작업(캐시 워밍 등)은 "batch"로 만들어 사용자 요청에 양보
+            response_cache: 완전히 같은 요청의 응답 캐시 (기본값: 환경변수 LLM_RESPONSE_CACHE로 구성한
+                        프로세스 전역 캐시, off면 비활성화)
 
         Note:
             Upstage Solar Pro 2 uses temperature=0 (configurable)
             일관성은 majority voting (num_runs=3) + structured output으로 보장
 
         Fallback:
-            If Upstage API fails (401/billing), automatically fallback to Anthropic Claude
+            provider별 회로 차단기(services.circuit_breaker)가 Upstage 장애(오류율/지연/401)를 감지하면
+            Claude로 라우팅하고, open_seconds 후 probe 요청으로 Upstage 복구를 확인한다.
+            요청 timeout: 환경변수 LLM_REQUEST_TIMEOUT (기본값: 60초)
         """
         # Determine API Key (Upstage priority)
         upstage_key = os.getenv("UPSTAGE_API_KEY")
@@ -58,14 +111,26 @@ class OpenAIService:
         # Read base_url from environment for Upstage compatibility
         base_url = os.getenv("UPSTAGE_BASE_URL", "https://api.upstage.ai/v1")
 
+        # 요청 timeout (SDK 기본값 600초 대신 짧게, 재시도는 스케줄러/회로 차단기가 담당)
+        self.request_timeout = float(os.getenv("LLM_REQUEST_TIMEOUT", "60"))
+
         # Initialize Upstage client
-        self.client = AsyncOpenAI(api_key=self.api_key, base_url=base_url)
+        self.client = AsyncOpenAI(
+            api_key=self.api_key,
+            base_url=base_url,
+            timeout=self.request_timeout,
+            max_retries=0
+        )
 
         # Initialize Claude fallback client
         self.anthropic_key = os.getenv("ANTHROPIC_API_KEY")
         self.anthropic_client = None
         if self.anthropic_key and ANTHROPIC_AVAILABLE:
-            self.anthropic_client = AsyncAnthropic(api_key=self.anthropic_key)
+            self.anthropic_client = AsyncAnthropic(
+                api_key=self.anthropic_key,
+                timeout=self.request_timeout,
+                max_retries=0
+            )
             logger.info("Claude fallback enabled")
         else:
             logger.warning("Claude fallback not available (missing API key or library)")
@@ -74,72 +139,312 @@ class OpenAIService:
         self.model = model or os.getenv("GPT_MODEL", "solar-pro2")
         self.claude_model = "claude-sonnet-4-20250514"
         self.num_runs = num_runs
-        self.use_fallback = False  # Track if we're using fallback
 
-        logger.info(f"OpenAI Service initialized: model={self.model}, base_url={base_url}, runs={num_runs}")
+        # Multi-utterance batching (batch_size=1 → disabled)
+        self.batch_size = max(1, batch_size or int(os.getenv("CHECKLIST_BATCH_SIZE", "1")))
+
+        # Shared LLM concurrency budget (semaphore is created per event loop)
+        if max_concurrent_requests is None:
+            max_concurrent_requests = int(os.getenv("LLM_MAX_CONCURRENT_REQUESTS", "16"))
+        self.max_concurrent_requests = max(0, max_concurrent_requests)
+        self._request_semaphore: Optional[asyncio.Semaphore] = None
+        self._request_semaphore_loop = None
+
+        # Adaptive early-stop voting
+        if adaptive_voting is None:
+            adaptive_voting = os.getenv("LLM_ADAPTIVE_VOTING", "false").lower() == "true"
+        self.adaptive_voting = adaptive_voting
+
+        # Process-wide RPM/TPM scheduler shared by every OpenAIService instance
+        self.priority = priority
+        self.upstage_scheduler = get_llm_scheduler("upstage")
+        self.anthropic_scheduler = get_llm_scheduler("anthropic")
+
+        # Process-wide circuit breakers (health-aware provider routing)
+        self.upstage_breaker = get_circuit_breaker("upstage")
+        self.anthropic_breaker = get_circuit_breaker("anthropic")
+        self.degraded_calls = 0  # 사용 가능한 provider가 없어 기본값으로 대체된 호출 수
+
+        # Exact-prompt response cache (다수결 결과/텍스트 단위)
+        self.response_cache = response_cache or get_response_cache()
+
+        logger.info(
+            f"OpenAI Service initialized: model={self.model}, base_url={base_url}, "
+            f"runs={num_runs}, batch_size={self.batch_size}, "
+            f"max_concurrent_requests={self.max_concurrent_requests or 'unlimited'}, "
+            f"adaptive_voting={self.adaptive_voting}"
+        )
+
+    @asynccontextmanager
+    async def _request_slot(self):
+        """
+        LLM 요청 1건의 동시 실행 슬롯 확보 (max_concurrent_requests 예산 공유)
+
+        MatrixBuilder처럼 여러 분류기가 같은 인스턴스를 공유하면
+        모든 분류기의 요청이 하나의 예산 안에서 실행된다.
+        """
+        if not self.max_concurrent_requests:
+            yield
+            return
+
+        loop = asyncio.get_running_loop()
+        if self._request_semaphore is None or self._request_semaphore_loop is not loop:
+            self._request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+            self._request_semaphore_loop = loop
+
+        async with self._request_semaphore:
+            yield
 
-    async def _execute_with_claude(
+    @staticmethod
+    def _timed(request_fn, timing: Optional[Dict[str, float]]):
+        """
+        provider 호출 시간만 timing["latency"]에 기록하는 request_fn
+
+        슬롯/rate limit 대기와 429 backoff는 provider 지연이 아니므로 회로 차단기에 넣지 않는다
+        (재시도되면 마지막 시도의 시간).
+        """
+        if timing is None:
+            return request_fn
+
+        async def timed_request():
+            started_at = time.monotonic()
+            try:
+                return await request_fn()
+            finally:
+                timing["latency"] = time.monotonic() - started_at
+
+        return timed_request
+
+    async def _call_upstage(self, timing: Optional[Dict[str, float]] = None, **request_kwargs):
+        """
+        Upstage chat completion 호출 (동시성 예산 + 전역 RPM/TPM 스케줄러 + 429 backoff)
+
+        Args:
+            timing: 전달하면 provider 응답 시간(대기 제외)을 timing["latency"]에 기록
+        """
+        estimated = estimate_tokens(
+            *(message["content"] for message in request_kwargs["messages"]),
+            max_output_tokens=request_kwargs.get("max_completion_tokens", 512)
+        )
+        async with self._request_slot():
+            return await self.upstage_scheduler.execute(
+                self._timed(lambda: self.client.chat.completions.create(**request_kwargs), timing),
+                estimated_tokens=estimated,
+                priority=self.priority
+            )
+
+    async def _call_claude(self, timing: Optional[Dict[str, float]] = None, **request_kwargs):
+        """
+        Claude messages 호출 (동시성 예산 + 전역 RPM/TPM 스케줄러 + 429 backoff)
+
+        Args:
+            timing: _call_upstage와 동일
+        """
+        estimated = estimate_tokens(
+            request_kwargs.get("system"),
+            *(message["content"] for message in request_kwargs["messages"]),
+            max_output_tokens=request_kwargs.get("max_tokens", 1024)
+        )
+        async with self._request_slot():
+            return await self.anthropic_scheduler.execute(
+                self._timed(lambda: self.anthropic_client.messages.create(**request_kwargs), timing),
+                estimated_tokens=estimated,
+                priority=self.priority
+            )
+
+    def _validate_checklist_response(
         self,
-        prompt: str,
+        result: Dict[str, Any],
         expected_keys: List[str]
     ) -> Dict[str, str]:
         """
-        Claude fallback 실행
+        LLM 응답을 Yes/No 딕셔너리로 정규화
 
         Args:
-            prompt: 체크리스트 프롬프트
+            result: 파싱된 JSON 응답
             expected_keys: 예상되는 응답 키 목록
 
         Returns:
-            {"exp_01": "Yes", "exp_02": "No", ...}
+            {"exp_01": "Yes", "exp_02": "No", ...} (누락/잘못된 값은 "No")
         """
-        if not self.anthropic_client:
-            logger.error("Claude fallback requested but not available")
-            return {key: "No" for key in expected_keys}
+        validated_result = {}
+        for key in expected_keys:
+            value = result.get(key, "No")
+            if isinstance(value, str):
+                value = value.strip().capitalize()
+                if value not in ["Yes", "No"]:
+                    logger.warning(f"Invalid value for {key}: {value}, defaulting to 'No'")
+                    value = "No"
+            else:
+                value = "No"
+            validated_result[key] = value
 
-        try:
-            response = await self.anthropic_client.messages.create(
-                model=self.claude_model,
-                max_tokens=1024,
-                temperature=0,
-                system="You are an expert in educational analysis. Answer each checklist question with only 'Yes' or 'No'. Provide your answer in JSON format only, without any additional explanation.",
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            )
+        return validated_result
 
-            # Extract JSON from response
-            content = response.content[0].text
+    @property
+    def use_fallback(self) -> bool:
+        """Upstage 회로가 닫혀 있지 않아 Claude로 라우팅 중인지 (하위 호환용)"""
+        return self.anthropic_client is not None and self.upstage_breaker.state != STATE_CLOSED
 
-            # Parse JSON
-            result = json.loads(content)
+    def _providers(self) -> List[tuple]:
+        """라우팅 순서대로 (provider 이름, 회로 차단기) 목록"""
+        providers = [("upstage", self.upstage_breaker)]
+        if self.anthropic_client:
+            providers.append(("anthropic", self.anthropic_breaker))
+        return providers
+
+    async def _complete_with_upstage(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_tokens: Optional[int],
+        json_mode: bool,
+        timing: Optional[Dict[str, float]] = None
+    ) -> str:
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        request_kwargs = {"model": self.model, "messages": messages}
+        if max_tokens:
+            request_kwargs["max_completion_tokens"] = max_tokens
+        if json_mode:
+            request_kwargs["response_format"] = {"type": "json_object"}
+
+        response = await self._call_upstage(timing=timing, **request_kwargs)
+        return response.choices[0].message.content or ""
+
+    async def _complete_with_claude(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_tokens: Optional[int],
+        timing: Optional[Dict[str, float]] = None
+    ) -> str:
+        response = await self._call_claude(
+            timing=timing,
+            model=self.claude_model,
+            max_tokens=max_tokens or 1024,
+            temperature=0,
+            system=system_prompt or "You are a helpful assistant",
+            messages=[
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+        )
+        return response.content[0].text
+
+    async def _complete(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        json_mode: bool = False
+    ) -> str:
+        """
+        회로가 닫혀 있는 provider로 라우팅하여 응답 텍스트 생성 (Upstage → Claude)
+
+        회로가 열린 provider는 호출하지 않고 건너뛰며, 호출 실패/지연은 해당 provider의
+        회로 차단기에 기록된 뒤 다음 provider로 넘어간다. 지연은 provider 호출 자체의 시간만
+        측정한다 (동시성 슬롯/rate limit 대기, 429 backoff 제외). JSON 파싱은 호출자 몫이다
+        (잘못된 JSON은 provider 장애가 아니므로 회로에 영향을 주지 않는다).
+
+        Args:
+            prompt: 사용자 프롬프트
+            system_prompt: 시스템 프롬프트 (선택)
+            max_tokens: 최대 출력 토큰 수 (None이면 Upstage 제한 없음, Claude 1024)
+            json_mode: Upstage JSON 응답 형식 사용 여부
+
+        Returns:
+            응답 텍스트
 
-            # Validate response
-            validated_result = {}
-            for key in expected_keys:
-                value = result.get(key, "No")
-                if isinstance(value, str):
-                    value = value.strip().capitalize()
-                    if value not in ["Yes", "No"]:
-                        logger.warning(f"Invalid value for {key}: {value}, defaulting to 'No'")
-                        value = "No"
+        Raises:
+            ProviderUnavailableError: 호출 가능한 provider가 없거나 모두 실패
+        """
+        last_error = None
+
+        for provider, breaker in self._providers():
+            if not breaker.allow_request():
+                continue
+
+            timing = {"latency": 0.0}
+            try:
+                if provider == "upstage":
+                    text = await self._complete_with_upstage(prompt, system_prompt, max_tokens, json_mode, timing)
                 else:
-                    value = "No"
-                validated_result[key] = value
+                    text = await self._complete_with_claude(prompt, system_prompt, max_tokens, timing)
+            except Exception as e:
+                breaker.record_failure(
+                    timing["latency"],
+                    reason=str(e)[:200],
+                    auth_error=is_auth_error(e)
+                )
+                logger.warning(f"⚠️  {provider} request failed: {e}")
+                last_error = e
+                continue
+            except BaseException:
+                # 취소 등: 결과를 기록하지 못하므로 half-open probe 슬롯만 반환
+                breaker.release()
+                raise
+
+            breaker.record_success(timing["latency"])
+            if provider != "upstage":
+                logger.info(f"✓ Routed to {provider} fallback")
+            return text
+
+        raise ProviderUnavailableError(
+            f"No healthy LLM provider available "
+            f"(states: {', '.join(f'{name}={breaker.state}' for name, breaker in self._providers())}, "
+            f"last error: {last_error})"
+        )
+
+    def _record_degraded(self):
+        """사용 가능한 provider가 없어 기본값으로 대체된 호출 기록 (인스턴스 = 작업 단위, 프로세스 전체)"""
+        global _degraded_calls_total
+        self.degraded_calls += 1
+        _degraded_calls_total += 1
+
+    def get_provider_stats(self) -> Dict[str, Any]:
+        """provider별 회로 차단기/스케줄러 상태 (모니터링용)"""
+        stats = {
+            "upstage": {
+                "circuit": self.upstage_breaker.get_stats(),
+                "scheduler": self.upstage_scheduler.get_stats()
+            },
+            "degraded_calls": self.degraded_calls,
+            "response_cache": self.response_cache.get_stats() if self.response_cache else None
+        }
+        if self.anthropic_client:
+            stats["anthropic"] = {
+                "circuit": self.anthropic_breaker.get_stats(),
+                "scheduler": self.anthropic_scheduler.get_stats()
+            }
+        return stats
 
-            logger.info("✓ Claude fallback successful")
-            return validated_result
+    async def _run_checklist(
+        self,
+        prompt: str,
+        expected_keys: List[str]
+    ) -> Optional[Dict[str, str]]:
+        """체크리스트 1회 실행, JSON 오류 또는 사용 가능한 provider가 없으면 None"""
+        try:
+            content = await self._complete(prompt, CHECKLIST_SYSTEM_PROMPT, json_mode=True)
+            result = json.loads(content)
 
         except json.JSONDecodeError as e:
-            logger.error(f"Claude JSON decode error: {e}")
-            return {key: "No" for key in expected_keys}
+            logger.error(f"JSON decode error: {e}")
+            return None
 
-        except Exception as e:
-            logger.error(f"Claude API error: {e}")
-            return {key: "No" for key in expected_keys}
+        except ProviderUnavailableError as e:
+            self._record_degraded()
+            logger.error(f"Checklist degraded to 'No' answers: {e}")
+            return None
+
+        # 응답 검증
+        return self._validate_checklist_response(result, expected_keys)
 
     async def execute_checklist_once(
         self,
@@ -147,7 +452,7 @@ class OpenAIService:
         expected_keys: List[str]
     ) -> Dict[str, str]:
         """
-        체크리스트를 1회 실행 (Upstage → Claude fallback)
+        체크리스트를 1회 실행 (건강한 provider로 라우팅: Upstage → Claude)
 
         Args:
             prompt: 체크리스트 프롬프트
@@ -155,66 +460,45 @@ class OpenAIService:
 
         Returns:
             {"exp_01": "Yes", "exp_02": "No", ...}
+            (JSON 오류 또는 사용 가능한 provider가 없으면 모두 "No")
         """
-        # Try Upstage first (unless already using fallback)
-        if not self.use_fallback:
-            try:
-                response = await self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are an expert in educational analysis. Answer each checklist question with only 'Yes' or 'No'. Provide your answer in JSON format only, without any additional explanation."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    response_format={"type": "json_object"}
-                )
-
-                # JSON 파싱
-                content = response.choices[0].message.content
-                result = json.loads(content)
-
-                # 응답 검증
-                validated_result = {}
-                for key in expected_keys:
-                    value = result.get(key, "No")
-                    if isinstance(value, str):
-                        value = value.strip().capitalize()
-                        if value not in ["Yes", "No"]:
-                            logger.warning(f"Invalid value for {key}: {value}, defaulting to 'No'")
-                            value = "No"
-                    else:
-                        value = "No"
-                    validated_result[key] = value
-
-                return validated_result
-
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON decode error: {e}")
-                return {key: "No" for key in expected_keys}
-
-            except Exception as e:
-                error_str = str(e).lower()
-
-                # Check if it's a 401/billing error
-                if "401" in error_str or "insufficient credit" in error_str or "api_key" in error_str:
-                    logger.warning(f"⚠️  Upstage API billing issue detected: {e}")
-                    logger.warning("→ Switching to Claude fallback for all subsequent requests")
-                    self.use_fallback = True
-
-                    # Try Claude fallback
-                    return await self._execute_with_claude(prompt, expected_keys)
-                else:
-                    logger.error(f"Upstage API error: {e}")
-                    return {key: "No" for key in expected_keys}
+        result = await self._run_checklist(prompt, expected_keys)
+        if result is None:
+            return {key: "No" for key in expected_keys}
+        return result
+
+    def _voting_cache_key(self, prompt: str) -> Optional[str]:
+        """체크리스트 다수결 결과의 응답 캐시 키 (캐시 비활성화 시 None)"""
+        if not self.response_cache:
+            return None
+        return self.response_cache.make_key(
+            self.model, CHECKLIST_SYSTEM_PROMPT, prompt,
+            response_format={"type": "json_object"},
+            variant=f"votes:{self.num_runs}"
+        )
 
-        # If already using fallback, go straight to Claude
-        else:
-            return await self._execute_with_claude(prompt, expected_keys)
+    def _get_cached_runs(self, prompt: str) -> Optional[List[Dict[str, str]]]:
+        key = self._voting_cache_key(prompt)
+        if key is None:
+            return None
+        return self.response_cache.get(key)
+
+    def _set_cached_runs(self, prompt: str, raw_runs: List[Optional[Dict[str, str]]]):
+        """모든 실행이 성공한 경우에만 raw_runs 저장 (기본값 "No"로 대체된 결과는 캐시하지 않음)"""
+        key = self._voting_cache_key(prompt)
+        if key is None or any(run is None for run in raw_runs):
+            return
+        self.response_cache.set(key, raw_runs)
+
+    @staticmethod
+    def _fill_failed_runs(
+        raw_runs: List[Optional[Dict[str, str]]],
+        expected_keys: List[str]
+    ) -> List[Dict[str, str]]:
+        return [
+            run if run is not None else {key: "No" for key in expected_keys}
+            for run in raw_runs
+        ]
 
     async def execute_checklist_with_majority_voting(
         self,
@@ -224,6 +508,9 @@ class OpenAIService:
         """
         체크리스트를 3회 실행하고 다수결로 최종 결과 결정
 
+        adaptive_voting이면 2회만 먼저 실행하고, 어떤 키라도 불일치할 때만 3회차를 실행한다.
+        (2회가 만장일치면 3회차 결과와 무관하게 다수결이 확정되므로 결과는 동일)
+
         Args:
             prompt: 체크리스트 프롬프트
             expected_keys: 예상되는 응답 키 목록
@@ -241,15 +528,67 @@ class OpenAIService:
                 }
             }
         """
-        logger.info(f"Executing checklist {self.num_runs} times for majority voting")
+        cached_runs = self._get_cached_runs(prompt)
+        if cached_runs:
+            logger.info("✓ Response cache HIT (checklist voting)")
+            return self.aggregate_votes(cached_runs, expected_keys)
+
+        initial_runs = self._initial_run_count()
+        logger.info(f"Executing checklist {initial_runs}/{self.num_runs} times for majority voting")
 
         # 병렬 실행
         tasks = [
-            self.execute_checklist_once(prompt, expected_keys)
-            for _ in range(self.num_runs)
+            self._run_checklist(prompt, expected_keys)
+            for _ in range(initial_runs)
         ]
-        raw_runs = await asyncio.gather(*tasks)
+        raw_runs = list(await asyncio.gather(*tasks))
+
+        # Adaptive voting: 초기 실행이 모든 키에서 일치하면 나머지 실행으로 다수결이 바뀔 수 없음
+        if initial_runs < self.num_runs and \
+                not self._runs_agree(self._fill_failed_runs(raw_runs, expected_keys), expected_keys):
+            logger.info(f"Disagreement detected, executing {self.num_runs - initial_runs} more run(s)")
+            extra_runs = await asyncio.gather(*[
+                self._run_checklist(prompt, expected_keys)
+                for _ in range(self.num_runs - initial_runs)
+            ])
+            raw_runs.extend(extra_runs)
+
+        self._set_cached_runs(prompt, raw_runs)
+        return self.aggregate_votes(self._fill_failed_runs(raw_runs, expected_keys), expected_keys)
+
+    def _initial_run_count(self) -> int:
+        """
+        첫 라운드 실행 횟수
+
+        adaptive_voting이면 과반수(num_runs // 2 + 1), 아니면 num_runs
+        """
+        if not self.adaptive_voting:
+            return self.num_runs
+        return min(self.num_runs, self.num_runs // 2 + 1)
+
+    @staticmethod
+    def _runs_agree(raw_runs: List[Dict[str, str]], expected_keys: List[str]) -> bool:
+        """모든 실행이 모든 키에서 같은 답을 냈는지 확인"""
+        return all(
+            len({run.get(key, "No") for run in raw_runs}) == 1
+            for key in expected_keys
+        )
 
+    def aggregate_votes(
+        self,
+        raw_runs: List[Dict[str, str]],
+        expected_keys: List[str]
+    ) -> Dict[str, Any]:
+        """
+        여러 실행 결과를 다수결로 집계
+
+        Args:
+            raw_runs: 각 실행의 Yes/No 결과 리스트
+            expected_keys: 예상되는 응답 키 목록
+
+        Returns:
+            execute_checklist_with_majority_voting과 동일한 형식
+        """
         # 다수결 투표
         final_results = {}
         confidence_scores = {}
@@ -265,7 +604,7 @@ class OpenAIService:
             vote_count = most_common[1]
 
             # 신뢰도 계산 (득표 비율)
-            confidence = vote_count / self.num_runs
+            confidence = vote_count / len(raw_runs)
 
             final_results[key] = final_result
             confidence_scores[key] = round(confidence, 2)
@@ -294,6 +633,171 @@ class OpenAIService:
             "stats": stats
         }
 
+    def _build_batch_prompt(self, items: List[Dict[str, Any]]) -> str:
+        """
+        여러 체크리스트 프롬프트를 하나의 JSON-schema 프롬프트로 묶기
+
+        각 항목은 item_0, item_1, ... 으로 식별되며, 응답 JSON도 같은 키로 분리된다.
+
+        Args:
+            items: [{"prompt": "...", "expected_keys": [...]}, ...]
+
+        Returns:
+            배치 프롬프트 문자열
+        """
+        sections = []
+        schema_properties = {}
+
+        for idx, item in enumerate(items):
+            item_id = f"item_{idx}"
+            sections.append(f"### {item_id}\n{item['prompt'].strip()}")
+            schema_properties[item_id] = {
+                "type": "object",
+                "properties": {
+                    key: {"type": "string", "enum": ["Yes", "No"]}
+                    for key in item["expected_keys"]
+                },
+                "required": list(item["expected_keys"])
+            }
+
+        schema = {
+            "type": "object",
+            "properties": schema_properties,
+            "required": list(schema_properties.keys())
+        }
+
+        return (
+            f"다음은 서로 독립적인 {len(items)}개의 체크리스트 항목입니다. "
+            "각 항목을 다른 항목과 섞지 말고 개별적으로 평가하세요.\n\n"
+            + "\n\n".join(sections)
+            + "\n\n각 항목의 개별 응답 형식 안내는 무시하고, "
+            "모든 항목에 대한 답변을 아래 JSON Schema를 따르는 하나의 JSON 객체로만 제공하세요:\n"
+            + json.dumps(schema, ensure_ascii=False, indent=2)
+        )
+
+    def batch_prompt_fingerprint(self) -> str:
+        """
+        배치 프롬프트 형식(시스템 프롬프트 + 묶음 안내문/스키마)의 fingerprint
+
+        배치 결과의 semantic cache 키에 포함되어, 묶음 프롬프트를 수정하면 이전 배치 결과를 재사용하지 않는다.
+        """
+        sample = self._build_batch_prompt([{"prompt": "{prompt}", "expected_keys": ["{key}"]}])
+        return compute_fingerprint(BATCH_CHECKLIST_SYSTEM_PROMPT, sample)
+
+    async def execute_checklist_batch_once(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> List[Dict[str, str]]:
+        """
+        여러 체크리스트를 하나의 프롬프트로 1회 실행 (건강한 provider로 라우팅: Upstage → Claude)
+
+        응답에서 누락된 항목은 단일 프롬프트로 재실행한다.
+
+        Args:
+            items: [{"prompt": "...", "expected_keys": [...]}, ...]
+
+        Returns:
+            항목 순서대로 [{"exp_01": "Yes", ...}, ...]
+        """
+        runs = await self._run_checklist_batch(items)
+        return [
+            run if run is not None else {key: "No" for key in item["expected_keys"]}
+            for item, run in zip(items, runs)
+        ]
+
+    async def _run_checklist_batch(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, str]]]:
+        """배치 1회 실행, 실패한 항목은 None"""
+        batch_prompt = self._build_batch_prompt(items)
+        response_json: Dict[str, Any] = {}
+
+        try:
+            response_json = json.loads(await self._complete(
+                batch_prompt,
+                BATCH_CHECKLIST_SYSTEM_PROMPT,
+                max_tokens=1024 + 16 * sum(len(item["expected_keys"]) for item in items),
+                json_mode=True
+            ))
+            if not isinstance(response_json, dict):
+                response_json = {}
+
+        except json.JSONDecodeError as e:
+            logger.error(f"Batch JSON decode error: {e}")
+
+        except ProviderUnavailableError as e:
+            # 개별 재실행도 같은 상태이므로 바로 실패 처리
+            self._record_degraded()
+            logger.error(f"Batch checklist degraded to 'No' answers: {e}")
+            return [None] * len(items)
+
+        # 항목별 응답 분리 (demultiplex)
+        runs: List[Optional[Dict[str, str]]] = []
+        missing = []
+        for idx, item in enumerate(items):
+            item_result = response_json.get(f"item_{idx}")
+            if isinstance(item_result, dict):
+                runs.append(self._validate_checklist_response(item_result, item["expected_keys"]))
+            else:
+                runs.append(None)
+                missing.append(idx)
+
+        if missing:
+            logger.warning(f"Batch response missing {len(missing)}/{len(items)} items, retrying individually")
+            retried = await asyncio.gather(*[
+                self._run_checklist(items[idx]["prompt"], items[idx]["expected_keys"])
+                for idx in missing
+            ])
+            for idx, result in zip(missing, retried):
+                runs[idx] = result
+
+        return runs
+
+    async def _execute_batch_with_majority_voting(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """하나의 배치(최대 batch_size개)를 num_runs회 실행하고 항목별로 다수결 집계"""
+        initial_runs = self._initial_run_count()
+        logger.info(f"Executing batch of {len(items)} checklists {initial_runs} times for majority voting")
+
+        batch_runs = await asyncio.gather(*[
+            self._run_checklist_batch(items)
+            for _ in range(initial_runs)
+        ])
+        item_runs = [
+            [run[idx] for run in batch_runs]
+            for idx in range(len(items))
+        ]
+
+        # Adaptive voting: 불일치 항목만 다시 묶어서 나머지 실행
+        if initial_runs < self.num_runs:
+            disagreeing = [
+                idx for idx, item in enumerate(items)
+                if not self._runs_agree(
+                    self._fill_failed_runs(item_runs[idx], item["expected_keys"]),
+                    item["expected_keys"]
+                )
+            ]
+            if disagreeing:
+                logger.info(f"Disagreement in {len(disagreeing)}/{len(items)} items, executing extra runs")
+                extra_batch_runs = await asyncio.gather(*[
+                    self._run_checklist_batch([items[idx] for idx in disagreeing])
+                    for _ in range(self.num_runs - initial_runs)
+                ])
+                for run in extra_batch_runs:
+                    for position, idx in enumerate(disagreeing):
+                        item_runs[idx].append(run[position])
+
+        for idx, item in enumerate(items):
+            self._set_cached_runs(item["prompt"], item_runs[idx])
+
+        return [
+            self.aggregate_votes(self._fill_failed_runs(item_runs[idx], item["expected_keys"]), item["expected_keys"])
+            for idx, item in enumerate(items)
+        ]
+
     async def batch_execute_checklists(
         self,
         prompts: List[Dict[str, Any]]
@@ -301,6 +805,9 @@ class OpenAIService:
         """
         여러 체크리스트를 병렬로 실행
 
+        batch_size > 1이면 batch_size개의 체크리스트를 하나의 프롬프트로 묶어
+        LLM 호출 수를 1/batch_size로 줄인다 (결과 형식은 동일).
+
         Args:
             prompts: [
                 {
@@ -314,17 +821,44 @@ class OpenAIService:
         Returns:
             각 체크리스트의 실행 결과 리스트
         """
-        logger.info(f"Batch executing {len(prompts)} checklists")
+        logger.info(f"Batch executing {len(prompts)} checklists (batch_size={self.batch_size})")
+
+        if self.batch_size > 1:
+            # 응답 캐시에 있는 항목은 제외하고 나머지만 배치로 묶음
+            results: List[Optional[Dict[str, Any]]] = [None] * len(prompts)
+            pending = []
+            for i, item in enumerate(prompts):
+                cached_runs = self._get_cached_runs(item["prompt"])
+                if cached_runs:
+                    results[i] = self.aggregate_votes(cached_runs, item["expected_keys"])
+                else:
+                    pending.append(i)
 
-        tasks = []
-        for item in prompts:
-            task = self.execute_checklist_with_majority_voting(
-                item["prompt"],
-                item["expected_keys"]
-            )
-            tasks.append(task)
+            if len(pending) < len(prompts):
+                logger.info(f"✓ Response cache HIT for {len(prompts) - len(pending)}/{len(prompts)} checklists")
 
-        results = await asyncio.gather(*tasks)
+            # 배치 모드: batch_size개씩 하나의 프롬프트로 묶어서 실행
+            chunks = [
+                pending[i:i + self.batch_size]
+                for i in range(0, len(pending), self.batch_size)
+            ]
+            chunk_results = await asyncio.gather(*[
+                self._execute_batch_with_majority_voting([prompts[i] for i in chunk])
+                for chunk in chunks
+            ])
+            for chunk, chunk_result in zip(chunks, chunk_results):
+                for i, result in zip(chunk, chunk_result):
+                    results[i] = result
+        else:
+            tasks = []
+            for item in prompts:
+                task = self.execute_checklist_with_majority_voting(
+                    item["prompt"],
+                    item["expected_keys"]
+                )
+                tasks.append(task)
+
+            results = await asyncio.gather(*tasks)
 
         # 메타데이터 추가
         for i, result in enumerate(results):
@@ -362,7 +896,7 @@ class OpenAIService:
         system_prompt: str = None
     ) -> str:
         """
-        일반 텍스트 생성 (코칭, 요약 등) with Claude fallback
+        일반 텍스트 생성 (코칭, 요약 등), 건강한 provider로 라우팅 (Upstage → Claude)
 
         Args:
             prompt: 생성 프롬프트
@@ -372,85 +906,28 @@ class OpenAIService:
         Returns:
             생성된 텍스트
         """
-        # Try Upstage first (unless already using fallback)
-        if not self.use_fallback:
-            try:
-                messages = []
-                if system_prompt:
-                    messages.append({"role": "system", "content": system_prompt})
-                messages.append({"role": "user", "content": prompt})
-
-                response = await self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    max_completion_tokens=max_completion_tokens
-                )
-
-                return response.choices[0].message.content.strip()
-
-            except Exception as e:
-                error_str = str(e).lower()
-
-                # Check if it's a 401/billing error
-                if "401" in error_str or "insufficient credit" in error_str or "api_key" in error_str:
-                    logger.warning(f"⚠️  Upstage API billing issue in text generation: {e}")
-                    logger.warning("→ Switching to Claude fallback")
-                    self.use_fallback = True
-
-                    # Try Claude fallback
-                    return await self._generate_text_with_claude(prompt, max_completion_tokens, system_prompt)
-                else:
-                    logger.error(f"Text generation error: {e}")
-                    return ""
-
-        # If already using fallback, go straight to Claude
-        else:
-            return await self._generate_text_with_claude(prompt, max_completion_tokens, system_prompt)
-
-    async def _generate_text_with_claude(
-        self,
-        prompt: str,
-        max_tokens: int = 500,
-        system_prompt: str = None
-    ) -> str:
-        """
-        Claude fallback for text generation
-
-        Args:
-            prompt: 생성 프롬프트
-            max_tokens: 최대 토큰 수
-            system_prompt: 시스템 프롬프트
-
-        Returns:
-            생성된 텍스트
-        """
-        if not self.anthropic_client:
-            logger.error("Claude fallback requested but not available")
-            return ""
-
-        try:
-            system_text = system_prompt or "You are a helpful assistant"
-
-            response = await self.anthropic_client.messages.create(
-                model=self.claude_model,
-                max_tokens=max_tokens,
-                temperature=0,
-                system=system_text,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
+        cache_key = None
+        if self.response_cache:
+            cache_key = self.response_cache.make_key(
+                self.model, system_prompt, prompt, variant=f"text:{max_completion_tokens}"
             )
+            cached_text = self.response_cache.get(cache_key)
+            if cached_text is not None:
+                logger.info("✓ Response cache HIT (text generation)")
+                return cached_text
 
-            logger.info("✓ Claude text generation successful")
-            return response.content[0].text.strip()
+        try:
+            text = (await self._complete(prompt, system_prompt, max_tokens=max_completion_tokens)).strip()
 
-        except Exception as e:
-            logger.error(f"Claude text generation error: {e}")
+        except ProviderUnavailableError as e:
+            self._record_degraded()
+            logger.error(f"Text generation error: {e}")
             return ""
 
+        if cache_key and text:
+            self.response_cache.set(cache_key, text)
+        return text
+
 
 # 유틸리티 함수들
 
@@ -0,0 +1,217 @@
+"""
+LLM Response Cache
+(model, system prompt, prompt, response_format) 기준 content-addressed 응답 캐시
+
+semantic cache가 비활성화되었거나(main_3d_matrix.py 등) miss가 나도 완전히 같은 프롬프트는
+LLM을 다시 호출하지 않는다. 같은 전사본을 다른 프레임워크로 재분석할 때 주로 효과가 있다.
+
+저장 단위는 OpenAIService가 결정한다 (체크리스트는 다수결 raw_runs 전체, 텍스트 생성은 응답 텍스트).
+단일 실행 결과를 캐시하면 다수결의 독립 실행이 같은 응답으로 붕괴하므로 호출 단위로는 캐시하지 않는다.
+
+환경변수:
+    LLM_RESPONSE_CACHE: 사용할 tier 목록 ("memory", "redis", "memory,redis", "off"; 기본값: memory)
+    LLM_RESPONSE_CACHE_SIZE: memory tier 최대 항목 수 (기본값: 10000)
+    LLM_RESPONSE_CACHE_MAX_MB: memory tier 최대 메모리 (MB, 기본값: 256, 0 = 무제한)
+    LLM_RESPONSE_CACHE_TTL: 만료 시간 (초, 기본값: 604800 = 7일)
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from utils.lru_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = "v1"
+
+
+class MemoryResponseTier:
+    """프로세스 내 LRU tier"""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 0, ttl_seconds: int = 0):
+        self.cache = LRUCache(max_entries=max_entries, max_bytes=max_bytes, ttl_seconds=ttl_seconds)
+
+    def get(self, key: str) -> Optional[str]:
+        return self.cache.get(key)
+
+    def set(self, key: str, value: str, ttl_seconds: int):
+        self.cache.set(key, value, ttl_seconds=ttl_seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return self.cache.get_stats()
+
+
+class RedisResponseTier:
+    """Redis tier (서비스 재시작/여러 worker 간 공유), 오류는 miss로 처리"""
+
+    name = "redis"
+
+    def __init__(self, redis_client):
+        self.redis = redis_client
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            return self.redis.get(key)
+        except Exception as e:
+            logger.warning(f"Response cache redis get error: {e}")
+            return None
+
+    def set(self, key: str, value: str, ttl_seconds: int):
+        try:
+            self.redis.setex(key, ttl_seconds, value)
+        except Exception as e:
+            logger.warning(f"Response cache redis set error: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class ResponseCache:
+    """
+    여러 tier를 순서대로 조회하는 응답 캐시
+
+    조회는 앞 tier부터 하며, 뒤 tier에서 hit하면 앞 tier를 채운다. 저장은 모든 tier에 한다.
+
+    Cache Key Format: llm_response:{version}:{sha256}
+    """
+
+    def __init__(self, tiers: List[Any], ttl_seconds: int = 604800):
+        """
+        Args:
+            tiers: get(key) / set(key, value, ttl_seconds)를 제공하는 tier 목록 (빠른 순서)
+            ttl_seconds: 항목 만료 시간 (초)
+        """
+        self.tiers = tiers
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "sets": 0}
+        self.tier_hits = {tier.name: 0 for tier in tiers}
+
+    @staticmethod
+    def make_key(
+        model: str,
+        system_prompt: Optional[str],
+        prompt: str,
+        response_format: Optional[Dict[str, Any]] = None,
+        variant: str = ""
+    ) -> str:
+        """
+        요청 내용으로 캐시 키 생성
+
+        Args:
+            model: 모델 이름
+            system_prompt: 시스템 프롬프트
+            prompt: 사용자 프롬프트
+            response_format: 응답 형식 (예: {"type": "json_object"})
+            variant: 같은 요청이라도 결과 형태가 다른 경우 구분값 (예: "votes:3")
+        """
+        content = json.dumps(
+            [model, system_prompt or "", prompt, response_format or {}, variant],
+            ensure_ascii=False,
+            sort_keys=True
+        )
+        hash_key = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return f"llm_response:{CACHE_VERSION}:{hash_key}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시된 값(JSON 디코딩) 반환, miss면 None"""
+        for index, tier in enumerate(self.tiers):
+            raw = tier.get(key)
+            if raw is None:
+                continue
+
+            try:
+                value = json.loads(raw)
+            except (TypeError, ValueError):
+                continue
+
+            # 앞 tier 채우기
+            for upper in self.tiers[:index]:
+                upper.set(key, raw, self.ttl_seconds)
+
+            with self._lock:
+                self.stats["hits"] += 1
+                self.tier_hits[tier.name] += 1
+            return value
+
+        with self._lock:
+            self.stats["misses"] += 1
+        return None
+
+    def set(self, key: str, value: Any):
+        """값을 JSON으로 직렬화하여 모든 tier에 저장"""
+        raw = json.dumps(value, ensure_ascii=False)
+        for tier in self.tiers:
+            tier.set(key, raw, self.ttl_seconds)
+        with self._lock:
+            self.stats["sets"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                **self.stats,
+                "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+                "tier_hits": dict(self.tier_hits),
+                "tiers": {tier.name: tier.get_stats() for tier in self.tiers},
+            }
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_initialized = False
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    환경변수로 구성한 프로세스 전역 응답 캐시 반환 (LLM_RESPONSE_CACHE=off면 None)
+    """
+    global _response_cache, _response_cache_initialized
+
+    with _response_cache_lock:
+        if _response_cache_initialized:
+            return _response_cache
+        _response_cache_initialized = True
+
+        tier_names = [
+            name.strip()
+            for name in os.getenv("LLM_RESPONSE_CACHE", "memory").lower().split(",")
+            if name.strip() and name.strip() != "off"
+        ]
+        ttl_seconds = int(os.getenv("LLM_RESPONSE_CACHE_TTL", "604800"))
+
+        tiers = []
+        for name in tier_names:
+            if name == "memory":
+                tiers.append(MemoryResponseTier(
+                    max_entries=int(os.getenv("LLM_RESPONSE_CACHE_SIZE", "10000")),
+                    max_bytes=int(float(os.getenv("LLM_RESPONSE_CACHE_MAX_MB", "256")) * 1024 * 1024),
+                    ttl_seconds=ttl_seconds
+                ))
+            elif name == "redis":
+                try:
+                    import redis
+                    tiers.append(RedisResponseTier(redis.Redis(
+                        host=os.getenv("REDIS_HOST", "redis"),
+                        port=int(os.getenv("REDIS_PORT", 6379)),
+                        password=os.getenv("REDIS_PASSWORD"),
+                        decode_responses=True
+                    )))
+                except ImportError:
+                    logger.warning("redis library not available - response cache redis tier disabled")
+            else:
+                logger.warning(f"Unknown LLM_RESPONSE_CACHE tier: {name}")
+
+        if tiers:
+            _response_cache = ResponseCache(tiers, ttl_seconds=ttl_seconds)
+            logger.info(
+                f"LLM response cache initialized: tiers={[tier.name for tier in tiers]}, ttl={ttl_seconds}s"
+            )
+
+        return _response_cache
@@ -0,0 +1,16 @@
+#!/bin/bash
+# Celery worker startup script for the analysis service
+# Scale horizontally with: docker compose up --scale analysis-worker=N
+
+# Wait for Redis to be ready
+echo "Waiting for Redis..."
+until python -c "import os, redis; redis.Redis(host=os.getenv('REDIS_HOST', 'redis'), port=int(os.getenv('REDIS_PORT', 6379)), password=os.getenv('REDIS_PASSWORD') or None).ping()" > /dev/null 2>&1; do
+    sleep 1
+done
+echo "Redis is ready"
+
+exec celery -A celery_app worker \
+    --loglevel=info \
+    --concurrency=${ANALYSIS_WORKER_CONCURRENCY:-2} \
+    -Q analysis \
+    -n analysis@%h
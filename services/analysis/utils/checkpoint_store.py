@@ -0,0 +1,219 @@
+"""
+Stage Checkpoint Store
+종합 평가 파이프라인의 단계별 결과를 Redis에 저장하여 재시도 시 완료된 단계를 건너뛴다
+
+CBIL 분석 → 3D matrix → metrics → pattern → coaching 중 coaching에서 실패해도
+재시도(Celery retry, 같은 job_id로 재제출)가 앞 단계의 LLM 호출을 다시 하지 않도록,
+각 단계 결과를 job id + 입력 해시로 구분된 Redis hash에 JSON으로 기록한다.
+입력(전사본/세그먼트/컨텍스트)이 바뀌면 해시가 달라지므로 이전 checkpoint는 사용되지 않는다.
+
+3D matrix 단계 안에서는 발화별 분류 결과를 완료되는 즉시 append-only 리스트에 기록하여
+(ClassificationProgress), 300개 중 280번째 발화에서 실패해도 재시도는 남은 발화만 분류하고
+진행률(done/total)을 작업 상태에 노출한다.
+
+환경변수:
+    ANALYSIS_CHECKPOINT_TTL: checkpoint 보존 시간 (초, 기본값: 86400)
+"""
+
+import os
+import json
+import hashlib
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "analysis_checkpoint:v1"
+
+# evaluate_with_cbil 단계 이름
+STAGE_CBIL_ANALYSIS = "cbil_analysis"
+STAGE_MATRIX = "matrix"
+STAGE_METRICS = "metrics"
+STAGE_PATTERN = "pattern"
+STAGE_COACHING = "coaching"
+
+# 3D matrix 분류 패스 이름 (MatrixBuilder)
+PASS_STAGE = "stage"
+PASS_CONTEXT = "context"
+PASS_LEVEL = "level"
+PASS_FUSED = "fused"
+
+
+def compute_input_hash(*parts: Any) -> str:
+    """
+    작업 입력의 해시 (JSON 직렬화 후 SHA-256 앞 16자리)
+
+    Args:
+        parts: 단계 결과에 영향을 주는 입력 (텍스트, 세그먼트, 컨텍스트 등)
+    """
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class StageCheckpointStore:
+    """작업 하나의 단계별 checkpoint (Redis hash: 단계 이름 → JSON)"""
+
+    def __init__(
+        self,
+        redis_client,
+        job_id: str,
+        input_hash: str,
+        ttl: Optional[int] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ):
+        """
+        Args:
+            redis_client: Redis 클라이언트 (decode_responses=True)
+            job_id: 분석 작업 ID
+            input_hash: compute_input_hash() 결과
+            ttl: 보존 시간 (기본값: 환경변수 ANALYSIS_CHECKPOINT_TTL 또는 86400초)
+            on_progress: 발화 분류 진행 콜백 (done, total), classification_progress()에 전달
+        """
+        self.redis = redis_client
+        self.job_id = job_id
+        self.key = f"{KEY_PREFIX}:{job_id}:{input_hash}"
+        self.utterances_key = f"{self.key}:utterances"
+        self.ttl = ttl if ttl is not None else int(os.getenv("ANALYSIS_CHECKPOINT_TTL", "86400"))
+        self.on_progress = on_progress
+
+    def load(self, stage: str) -> Optional[Any]:
+        """저장된 단계 결과 (없거나 읽기 실패 시 None → 단계 재실행)"""
+        try:
+            raw = self.redis.hget(self.key, stage)
+            if raw is None:
+                return None
+            logger.info(f"Job {self.job_id}: resuming from '{stage}' checkpoint")
+            return json.loads(raw)
+        except Exception as e:
+            logger.warning(f"Job {self.job_id}: failed to load '{stage}' checkpoint: {e}")
+            return None
+
+    def save(self, stage: str, data: Any):
+        """단계 결과 저장 (실패해도 파이프라인은 계속 진행)"""
+        try:
+            pipeline = self.redis.pipeline(transaction=False)
+            pipeline.hset(self.key, stage, json.dumps(data, ensure_ascii=False, default=str))
+            pipeline.expire(self.key, self.ttl)
+            pipeline.execute()
+        except Exception as e:
+            logger.warning(f"Job {self.job_id}: failed to save '{stage}' checkpoint: {e}")
+
+    def completed_stages(self):
+        """checkpoint가 있는 단계 이름 목록"""
+        try:
+            return list(self.redis.hkeys(self.key))
+        except Exception:
+            return []
+
+    def classification_progress(self, passes: List[str], utterance_count: int) -> "ClassificationProgress":
+        """3D matrix 단계의 발화별 분류 checkpoint (이전 실행의 결과를 불러옴)"""
+        return ClassificationProgress(
+            self.redis, self.utterances_key, passes, utterance_count,
+            ttl=self.ttl, on_progress=self.on_progress, job_id=self.job_id
+        )
+
+    def clear(self):
+        """작업 완료 후 checkpoint 삭제"""
+        try:
+            self.redis.delete(self.key, self.utterances_key)
+        except Exception as e:
+            logger.warning(f"Job {self.job_id}: failed to clear checkpoints: {e}")
+
+
+class ClassificationProgress:
+    """
+    분류 패스별 발화 결과 checkpoint + 진행률
+
+    Redis 리스트에 {"pass", "index", "result"}를 완료 순서대로 append하고,
+    생성 시 리스트 전체를 읽어 패스별 완료 결과를 복원한다.
+    """
+
+    def __init__(
+        self,
+        redis_client,
+        key: str,
+        passes: List[str],
+        utterance_count: int,
+        ttl: int = 86400,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        job_id: str = ""
+    ):
+        """
+        Args:
+            redis_client: Redis 클라이언트
+            key: append-only 리스트 키
+            passes: 이번 matrix 빌드에서 실행할 패스 이름 (PASS_*)
+            utterance_count: 발화 수 (패스당 total)
+            ttl: 보존 시간 (초)
+            on_progress: (done, total) 콜백 (발화 결과 기록/패스 완료 시 호출)
+            job_id: 로그용 작업 ID
+        """
+        self.redis = redis_client
+        self.key = key
+        self.passes = list(passes)
+        self.utterance_count = utterance_count
+        self.ttl = ttl
+        self.on_progress = on_progress
+        self.job_id = job_id
+
+        self._results: Dict[str, Dict[int, Any]] = {name: {} for name in self.passes}
+        self._finished_passes = set()
+
+        try:
+            for raw in self.redis.lrange(self.key, 0, -1):
+                entry = json.loads(raw)
+                if entry["pass"] in self._results:
+                    self._results[entry["pass"]][int(entry["index"])] = entry["result"]
+        except Exception as e:
+            logger.warning(f"Job {job_id}: failed to load utterance checkpoints: {e}")
+            self._results = {name: {} for name in self.passes}
+
+        self.resumed = self.done
+        if self.resumed:
+            logger.info(f"Job {job_id}: resuming matrix build with {self.resumed}/{self.total} classifications done")
+
+    @property
+    def total(self) -> int:
+        return self.utterance_count * len(self.passes)
+
+    @property
+    def done(self) -> int:
+        return sum(
+            self.utterance_count if name in self._finished_passes else len(results)
+            for name, results in self._results.items()
+        )
+
+    def completed(self, pass_name: str) -> Dict[int, Any]:
+        """이전 실행에서 완료된 발화 결과 {발화 인덱스: 결과}"""
+        return dict(self._results.get(pass_name, {}))
+
+    def record(self, pass_name: str, index: int, result: Any):
+        """발화 하나의 분류 결과 기록 (이미 기록된 발화는 무시)"""
+        results = self._results.setdefault(pass_name, {})
+        if index in results:
+            return
+        results[index] = result
+
+        try:
+            pipeline = self.redis.pipeline(transaction=False)
+            pipeline.rpush(self.key, json.dumps(
+                {"pass": pass_name, "index": index, "result": result}, ensure_ascii=False, default=str
+            ))
+            pipeline.expire(self.key, self.ttl)
+            pipeline.execute()
+        except Exception as e:
+            logger.warning(f"Job {self.job_id}: failed to save utterance checkpoint: {e}")
+
+        self._report()
+
+    def finish_pass(self, pass_name: str):
+        """패스 완료 (스무딩처럼 일부 발화만 분류하는 패스도 진행률을 채움)"""
+        self._finished_passes.add(pass_name)
+        self._report()
+
+    def _report(self):
+        if self.on_progress:
+            try:
+                self.on_progress(self.done, self.total)
+            except Exception as e:
+                logger.warning(f"Job {self.job_id}: progress callback failed: {e}")
@@ -0,0 +1,59 @@
+"""
+Concurrency Utilities
+Semaphore-bounded asyncio fan-out for independent per-utterance work
+"""
+
+import os
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def get_default_concurrency() -> int:
+    """
+    발화 단위 동시 실행 수 기본값
+
+    Returns:
+        환경변수 CLASSIFIER_CONCURRENCY (기본값: 1 = 순차 실행)
+    """
+    try:
+        return max(1, int(os.getenv("CLASSIFIER_CONCURRENCY", "1")))
+    except ValueError:
+        logger.warning("Invalid CLASSIFIER_CONCURRENCY, falling back to sequential execution")
+        return 1
+
+
+async def gather_bounded(
+    items: Sequence[T],
+    worker: Callable[[int, T], Awaitable[R]],
+    concurrency: Optional[int] = None
+) -> List[R]:
+    """
+    items를 최대 concurrency개씩 동시에 처리하고 입력 순서대로 결과 반환
+
+    Args:
+        items: 처리할 항목 리스트
+        worker: (index, item) -> awaitable 결과
+        concurrency: 최대 동시 실행 수 (기본값: get_default_concurrency())
+
+    Returns:
+        items와 같은 순서의 결과 리스트
+    """
+    concurrency = concurrency or get_default_concurrency()
+
+    if concurrency <= 1:
+        # 순차 실행 (기존 동작)
+        return [await worker(i, item) for i, item in enumerate(items)]
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(i: int, item: T) -> R:
+        async with semaphore:
+            return await worker(i, item)
+
+    return list(await asyncio.gather(*[run(i, item) for i, item in enumerate(items)]))
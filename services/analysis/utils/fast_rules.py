@@ -0,0 +1,212 @@
+"""
+Fast Rule Pre-Classifier
+체크리스트 YAML의 fast_rules 섹션으로 명백한 발화를 LLM 없이 분류
+
+"조용히 하세요", "교과서 펴세요" 같은 짧은 관리 발화까지 매번 체크리스트 15회 이상의 LLM 호출을
+거치지 않도록, 키워드(Aho-Corasick)/정규식 규칙이 한 레이블만 가리키는 짧은 발화는 로컬에서 결정하고
+애매한 발화(규칙 불일치, 여러 레이블 충돌, 긴 발화)만 LLM으로 보낸다.
+
+YAML 형식 (선택 사항, 없으면 비활성화):
+
+    fast_rules:
+      max_length: 20            # 공백 제외 글자 수가 이보다 긴 발화는 항상 LLM으로
+      rules:
+        - id: "mgmt_attention"
+          label: "management"
+          confidence: 0.95
+          keywords: ["조용히", "집중해"]       # 공백을 무시하고 부분 일치
+          patterns: ["^자[,.!\\s]*$"]           # 정규식 (원문에 적용)
+          exclude: ["?", "잘"]                  # 하나라도 포함되면 이 규칙은 불일치
+
+환경변수:
+    FAST_RULES_MODE: "on" (규칙 결과 사용, 기본값) | "shadow" (LLM 결과 사용, 규칙 결과는 비교용으로만 기록) | "off"
+"""
+
+import os
+import re
+import logging
+import threading
+import unicodedata
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MODE_ON = "on"
+MODE_SHADOW = "shadow"
+MODE_OFF = "off"
+
+DECISION_SOURCE_RULE = "rule"
+DECISION_SOURCE_LLM = "llm"
+
+
+def get_fast_rules_mode() -> str:
+    """환경변수 FAST_RULES_MODE (알 수 없는 값은 on)"""
+    mode = os.getenv("FAST_RULES_MODE", MODE_ON).lower()
+    return mode if mode in (MODE_ON, MODE_SHADOW, MODE_OFF) else MODE_ON
+
+
+def _compact(text: str) -> str:
+    """NFC 정규화 + 공백 제거 (STT 띄어쓰기 편차 무시)"""
+    return re.sub(r"\s+", "", unicodedata.normalize("NFC", text))
+
+
+class AhoCorasick:
+    """
+    다중 키워드 부분 문자열 검색 (Aho-Corasick 오토마톤)
+
+    키워드 수와 관계없이 텍스트 길이에 비례하는 시간에 모든 일치를 찾는다.
+    """
+
+    def __init__(self, keywords: List[Tuple[str, Any]]):
+        """
+        Args:
+            keywords: [(keyword, payload), ...] (같은 키워드에 여러 payload 가능)
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Any]] = [[]]
+
+        for keyword, payload in keywords:
+            if not keyword:
+                continue
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(payload)
+
+        # BFS로 failure link 구성
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+    def find_all(self, text: str) -> List[Any]:
+        """text에 포함된 모든 키워드의 payload (중복 포함)"""
+        matches = []
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            if self._output[state]:
+                matches.extend(self._output[state])
+        return matches
+
+
+class FastRuleEngine:
+    """fast_rules 설정 하나(분류기 하나)에 대한 규칙 엔진"""
+
+    def __init__(self, rules: List[Dict[str, Any]], max_length: int = 20, name: str = ""):
+        """
+        Args:
+            rules: fast_rules.rules 목록
+            max_length: 규칙으로 결정할 최대 발화 길이 (공백 제외 글자 수)
+            name: 분류기 이름 (로그/통계용)
+        """
+        self.name = name
+        self.max_length = max_length
+        self.rules = []
+
+        keywords = []
+        for index, rule in enumerate(rules):
+            self.rules.append({
+                "id": rule.get("id") or f"{rule['label']}_{index + 1}",
+                "label": rule["label"],
+                "confidence": float(rule.get("confidence", 0.9)),
+                "patterns": [re.compile(pattern) for pattern in rule.get("patterns", [])],
+                "exclude": [_compact(word) for word in rule.get("exclude", [])],
+            })
+            keywords.extend((_compact(keyword), index) for keyword in rule.get("keywords", []))
+
+        self.matcher = AhoCorasick(keywords)
+
+        self._lock = threading.Lock()
+        self.stats = {
+            "rule_decisions": 0,
+            "escalated": 0,
+            "conflicts": 0,
+            "shadow_agree": 0,
+            "shadow_disagree": 0,
+        }
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], name: str = "") -> Optional["FastRuleEngine"]:
+        """체크리스트 YAML 전체 설정에서 생성 (fast_rules가 없거나 비어 있으면 None)"""
+        fast_rules = config.get("fast_rules") or {}
+        if not fast_rules.get("rules") or fast_rules.get("enabled") is False:
+            return None
+        return cls(fast_rules["rules"], max_length=int(fast_rules.get("max_length", 20)), name=name)
+
+    def _count(self, counter: str):
+        with self._lock:
+            self.stats[counter] += 1
+
+    def match(self, utterance: str) -> Optional[Dict[str, Any]]:
+        """
+        규칙으로 결정 가능한 발화면 결정 반환, 애매하면 None (LLM으로 escalate)
+
+        Returns:
+            {"label": "management", "confidence": 0.95, "rule_id": "mgmt_attention"} 또는 None
+        """
+        compact = _compact(utterance)
+        if not compact or len(compact) > self.max_length:
+            self._count("escalated")
+            return None
+
+        candidates = set(self.matcher.find_all(compact))
+        for index, rule in enumerate(self.rules):
+            if index not in candidates and any(pattern.search(utterance) for pattern in rule["patterns"]):
+                candidates.add(index)
+
+        matched = [
+            self.rules[index] for index in sorted(candidates)
+            if not any(word in compact for word in self.rules[index]["exclude"])
+        ]
+
+        labels = {rule["label"] for rule in matched}
+        if len(labels) != 1:
+            self._count("conflicts" if labels else "escalated")
+            return None
+
+        best = max(matched, key=lambda rule: rule["confidence"])
+        self._count("rule_decisions")
+        return {"label": best["label"], "confidence": best["confidence"], "rule_id": best["id"]}
+
+    def record_shadow(self, rule_decision: Optional[Dict[str, Any]], llm_labels: List[str]):
+        """shadow 모드: 규칙 결정과 LLM 결과의 일치 여부 집계"""
+        if rule_decision is None:
+            return
+        if rule_decision["label"] in llm_labels:
+            self._count("shadow_agree")
+        else:
+            self._count("shadow_disagree")
+            logger.info(
+                f"Fast rule disagreement ({self.name}): rule={rule_decision['label']} "
+                f"({rule_decision['rule_id']}), llm={llm_labels}"
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+        decided = stats["rule_decisions"] + stats["escalated"] + stats["conflicts"]
+        shadowed = stats["shadow_agree"] + stats["shadow_disagree"]
+        return {
+            **stats,
+            "rules": len(self.rules),
+            "rule_rate": round(stats["rule_decisions"] / decided, 3) if decided else 0.0,
+            "shadow_agreement": round(stats["shadow_agree"] / shadowed, 3) if shadowed else None,
+        }
@@ -0,0 +1,99 @@
+"""
+Job Status Events
+작업 상태 변경을 Redis pub/sub으로 발행하고 Server-Sent Events로 스트리밍
+
+클라이언트/게이트웨이가 5초마다 GET /api/analyze/{job_id} (전체 결과가 포함될 수 있는 레코드)를
+폴링하는 대신, 상태가 바뀔 때만 작은 이벤트를 받도록 한다. 결과 본문은 이벤트에 포함하지 않으며,
+완료 이벤트를 받은 뒤 기존 상태 조회 API로 한 번 가져온다.
+
+(transcription 서비스의 utils/job_events.py와 같은 구현, 서비스별 이미지가 분리되어 있어 직접 import하지 않음)
+"""
+
+import json
+import logging
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# 이벤트에서 제외하는 대용량 필드
+OMITTED_FIELDS = ("result",)
+
+KEEPALIVE_SECONDS = 15.0
+
+
+def job_event_channel(prefix: str, job_id: str) -> str:
+    """작업 상태 이벤트 채널 이름 (예: analysis_job_events:{job_id})"""
+    return f"{prefix}:{job_id}"
+
+
+def status_event(job_data: Dict[str, Any]) -> Dict[str, Any]:
+    """작업 상태 레코드 → 이벤트 (결과 본문 제외, has_result로 존재 여부만 표시)"""
+    event = {key: value for key, value in job_data.items() if key not in OMITTED_FIELDS}
+    if "has_result" not in event:
+        event["has_result"] = any(job_data.get(key) is not None for key in OMITTED_FIELDS)
+    return event
+
+
+def publish_job_status(redis_client, channel: str, job_data: Dict[str, Any]):
+    """상태 이벤트 발행 (실패해도 작업은 계속 진행, 구독자는 상태 조회 API로 복구 가능)"""
+    try:
+        redis_client.publish(channel, json.dumps(status_event(job_data), ensure_ascii=False))
+    except Exception as e:
+        logger.warning(f"Failed to publish job status event on {channel}: {e}")
+
+
+def format_sse(data: Dict[str, Any], event: str = "status") -> str:
+    """SSE 메시지 한 건"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def is_terminal(status: Optional[str], terminal_statuses: Iterable[str]) -> bool:
+    return (status or "").lower() in terminal_statuses
+
+
+async def stream_job_events(
+    async_redis,
+    channel: str,
+    load_snapshot: Callable[[], Optional[Dict[str, Any]]],
+    terminal_statuses: Iterable[str],
+    keepalive_seconds: float = KEEPALIVE_SECONDS
+) -> AsyncIterator[str]:
+    """
+    작업 상태 SSE 스트림
+
+    구독을 먼저 시작한 뒤 현재 상태(snapshot)를 보내므로 그 사이의 상태 변경을 놓치지 않는다.
+    종료 상태(completed/failed 등) 이벤트를 보낸 뒤 스트림을 닫는다.
+
+    Args:
+        async_redis: redis.asyncio 클라이언트 (decode_responses=True)
+        channel: job_event_channel() 결과
+        load_snapshot: 현재 상태 레코드 조회 (없으면 None)
+        terminal_statuses: 스트림을 종료할 상태 (소문자)
+        keepalive_seconds: 이벤트가 없을 때 keepalive 주석을 보내는 간격
+    """
+    terminal_statuses = {status.lower() for status in terminal_statuses}
+    pubsub = async_redis.pubsub()
+    await pubsub.subscribe(channel)
+    try:
+        snapshot = load_snapshot()
+        if snapshot is None:
+            yield format_sse({"error": "Job not found"}, event="error")
+            return
+
+        yield format_sse(status_event(snapshot))
+        if is_terminal(snapshot.get("status"), terminal_statuses):
+            return
+
+        while True:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=keepalive_seconds)
+            if message is None:
+                # 프록시/클라이언트의 idle timeout 방지
+                yield ": keepalive\n\n"
+                continue
+
+            event = json.loads(message["data"])
+            yield format_sse(event)
+            if is_terminal(event.get("status"), terminal_statuses):
+                return
+    finally:
+        await pubsub.reset()
@@ -0,0 +1,121 @@
+"""
+Analysis Job Store
+분석 작업의 상태와 결과를 Redis에 분리 저장
+
+상태(status/message/progress 등)는 작은 Redis hash(analysis_job_status:{job_id})에 두고,
+결과는 완료 시 한 번만 analysis_job_result:{job_id} hash에 최상위 섹션별로 압축(zlib) 저장한다.
+상태 갱신/폴링/SSE snapshot은 결과 크기(발화 수)와 무관하게 수백 바이트만 읽고 쓰며,
+리포트 엔드포인트는 필요한 섹션(예: framework, module2_result)만 읽어 압축을 푼다.
+"""
+
+import json
+import zlib
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+STATUS_KEY_PREFIX = "analysis_job_status"
+RESULT_KEY_PREFIX = "analysis_job_result"
+
+COMPRESSION_LEVEL = 6
+
+
+def status_key(job_id: str) -> str:
+    return f"{STATUS_KEY_PREFIX}:{job_id}"
+
+
+def result_key(job_id: str) -> str:
+    return f"{RESULT_KEY_PREFIX}:{job_id}"
+
+
+def _decode(value) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+class AnalysisJobStore:
+    """분석 작업 상태(hash) + 결과(섹션별 압축 hash) 저장소"""
+
+    def __init__(self, redis_client):
+        """
+        Args:
+            redis_client: Redis 클라이언트 (decode_responses=False, 압축된 결과를 bytes로 읽음)
+        """
+        self.redis = redis_client
+
+    def save_status(self, job_id: str, job_data: Dict[str, Any], ttl: int):
+        """
+        작업 상태 저장 (기존 상태를 통째로 교체, 필드 값은 JSON)
+
+        결과 본문("result")은 저장하지 않는다 → save_result() 사용
+        """
+        fields = {
+            key: json.dumps(value, ensure_ascii=False, default=str)
+            for key, value in job_data.items() if key != "result"
+        }
+        pipeline = self.redis.pipeline(transaction=True)
+        pipeline.delete(status_key(job_id))
+        if fields:
+            pipeline.hset(status_key(job_id), mapping=fields)
+            pipeline.expire(status_key(job_id), ttl)
+        pipeline.execute()
+
+    def load_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태 (없으면 None)"""
+        raw = self.redis.hgetall(status_key(job_id))
+        if not raw:
+            return None
+        return {_decode(key): json.loads(value) for key, value in raw.items()}
+
+    def load_status_fields(self, job_id: str, fields: List[str]) -> Dict[str, Any]:
+        """작업 상태 중 일부 필드만 (없는 필드는 None)"""
+        values = self.redis.hmget(status_key(job_id), fields)
+        return {field: json.loads(value) if value is not None else None for field, value in zip(fields, values)}
+
+    def save_result(self, job_id: str, result: Dict[str, Any], ttl: int):
+        """완료된 작업의 결과 저장 (최상위 섹션별 zlib 압축, 작업당 한 번)"""
+        sections = {
+            key: zlib.compress(
+                json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"), COMPRESSION_LEVEL
+            )
+            for key, value in result.items()
+        }
+        pipeline = self.redis.pipeline(transaction=True)
+        pipeline.delete(result_key(job_id))
+        if sections:
+            pipeline.hset(result_key(job_id), mapping=sections)
+            pipeline.expire(result_key(job_id), ttl)
+        pipeline.execute()
+
+        logger.info(
+            f"Job {job_id}: stored result ({len(sections)} sections, "
+            f"{sum(len(value) for value in sections.values())} bytes compressed)"
+        )
+
+    def load_result(self, job_id: str, sections: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        작업 결과 (없으면 None)
+
+        Args:
+            sections: 읽을 최상위 섹션 이름 (None이면 전체). 결과에 없는 섹션은 생략
+        """
+        if sections is None:
+            raw = {_decode(key): value for key, value in self.redis.hgetall(result_key(job_id)).items()}
+        else:
+            sections = list(sections)
+            raw = dict(zip(sections, self.redis.hmget(result_key(job_id), sections)))
+
+        if not any(value is not None for value in raw.values()):
+            return None
+        return {
+            key: json.loads(zlib.decompress(value).decode("utf-8"))
+            for key, value in raw.items() if value is not None
+        }
+
+    def status_keys(self) -> List[str]:
+        """저장된 모든 작업 상태 키"""
+        return [_decode(key) for key in self.redis.scan_iter(match=f"{STATUS_KEY_PREFIX}:*")]
+
+    @staticmethod
+    def job_id_from_key(key: str) -> str:
+        return key.split(":", 1)[1]
@@ -0,0 +1,121 @@
+"""
+In-Process LRU Cache
+엔트리 수/메모리/TTL 제한이 있는 스레드 안전 LRU 캐시
+"""
+
+import sys
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class LRUCache:
+    """
+    프로세스 내 LRU 캐시
+
+    - max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    - max_bytes(0 = 무제한)를 넘어도 같은 방식으로 제거 (값 크기는 sys.getsizeof 기준)
+      sys.getsizeof는 컨테이너 내부를 세지 않으므로, 메모리 제한이 필요하면 직렬화된 값(str/bytes)을 저장
+    - ttl_seconds(0 = 무제한)가 지난 항목은 조회 시 만료
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 0, ttl_seconds: float = 0):
+        """
+        Args:
+            max_entries: 최대 항목 수
+            max_bytes: 최대 메모리 (바이트, 0 = 무제한)
+            ttl_seconds: 기본 만료 시간 (초, 0 = 무제한)
+        """
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(0, max_bytes)
+        self.ttl_seconds = max(0, ttl_seconds)
+
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (value, expires_at, size)
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _sizeof(key: str, value: Any) -> int:
+        return sys.getsizeof(key) + sys.getsizeof(value)
+
+    def _remove(self, key: str):
+        _, _, size = self._data.pop(key)
+        self._bytes -= size
+
+    def get(self, key: str) -> Optional[Any]:
+        """값 조회 (없거나 만료되었으면 None)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at, _ = entry
+            if expires_at and time.monotonic() >= expires_at:
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        """
+        값 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값 (호출자가 이후 변경하지 않아야 함)
+            ttl_seconds: 항목별 만료 시간 (기본값: 생성 시 ttl_seconds)
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = time.monotonic() + ttl if ttl else 0.0
+        size = self._sizeof(key, value)
+
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+            self._data[key] = (value, expires_at, size)
+            self._bytes += size
+
+            while len(self._data) > self.max_entries or \
+                    (self.max_bytes and self._bytes > self.max_bytes and len(self._data) > 1):
+                oldest = next(iter(self._data))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            if key not in self._data:
+                return False
+            self._remove(key)
+            return True
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
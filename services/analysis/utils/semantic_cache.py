@@ -3,15 +3,89 @@ Semantic Cache Manager for Analysis Service
 Provides deterministic caching of LLM classification results
 """
 
+import os
+import zlib
+import base64
 import hashlib
 import json
 import logging
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import redis
 
+from utils.lru_cache import LRUCache
+from utils.text_normalization import (
+    NORMALIZATION_NONE,
+    normalize_for_cache,
+    normalization_marker,
+    parse_normalization_config
+)
+
 logger = logging.getLogger(__name__)
 
+# Pending hit/miss counters are flushed to Redis after this many lookups
+STATS_FLUSH_EVERY = 100
+# Keys deleted per round trip during SCAN-based invalidation
+INVALIDATE_BATCH_SIZE = 500
+
+# Compact entry encoding: prefix + base64(zlib(minified JSON)).
+# Base64 keeps values text-safe for clients created with decode_responses=True;
+# entries without the prefix are plain JSON (legacy v1 format) and decode as before.
+COMPACT_PREFIX = "z1:"
+ENCODING_JSON = "json"
+ENCODING_COMPACT = "compact"
+
+# Context fields left out of normalized keys: near-duplicate utterances are said at
+# different times, so normalized types only key on the utterance position flags
+NORMALIZED_IGNORED_CONTEXT = ("timestamp",)
+
+
+def compute_fingerprint(*parts: Any) -> str:
+    """
+    Short fingerprint of everything that determines a classifier's answers
+    (checklist definition incl. prompt template and decision rules, model name)
+    """
+    content = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+
+
+def _strip_raw_runs(value: Any) -> Any:
+    """Copy of a classification result without per-run voting details (raw_runs)"""
+    if isinstance(value, dict):
+        return {k: _strip_raw_runs(v) for k, v in value.items() if k != "raw_runs"}
+    if isinstance(value, list):
+        return [_strip_raw_runs(v) for v in value]
+    return value
+
+
+def encode_entry(cache_data: Dict[str, Any], encoding: str = ENCODING_COMPACT) -> str:
+    """Serialize a cache entry (compact or legacy JSON)"""
+    if encoding == ENCODING_COMPACT:
+        payload = json.dumps(cache_data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return COMPACT_PREFIX + base64.b64encode(zlib.compress(payload, 6)).decode("ascii")
+    return json.dumps(cache_data, ensure_ascii=False)
+
+
+def decode_entry(raw: str) -> Dict[str, Any]:
+    """Deserialize a cache entry written in either format"""
+    if raw.startswith(COMPACT_PREFIX):
+        return json.loads(zlib.decompress(base64.b64decode(raw[len(COMPACT_PREFIX):])).decode("utf-8"))
+    return json.loads(raw)
+
+
+def utterance_cache_context(utterances: List[Dict[str, Any]], index: int) -> Dict[str, Any]:
+    """
+    Cache context for utterances[index], matching the context the classifiers'
+    classify_single_utterance methods use for the same utterance
+    """
+    return {
+        "timestamp": utterances[index].get("timestamp"),
+        "has_previous": index > 0,
+        "has_next": index < len(utterances) - 1
+    }
+
+
 class SemanticCache:
     """
     Semantic caching system for LLM classification results
@@ -19,14 +93,216 @@ class SemanticCache:
     Ensures consistency by caching the first (majority-voted) result
     and returning it for subsequent identical utterances.
 
-    Cache Key Format: semantic:{version}:{classifier_type}:{content_hash}
+    Cache Key Format: semantic:{version}:{classifier_type}:{fingerprint}:{content_hash}
+    (legacy entries without a registered fingerprint: semantic:{version}:{classifier_type}:{content_hash})
+
+    Classifiers register a fingerprint of their checklist/prompt/model. When it
+    changes, new keys stop matching that classifier type's old entries, which then
+    expire by TTL (other processes may still be running the old definition, e.g.
+    during a rolling deploy). Legacy entries can optionally be adopted (re-keyed).
+
+    Statistics are maintained incrementally instead of scanning the keyspace:
+    - semantic_stats:{version} hash: {classifier_type}:{hits|misses|sets|bytes} counters
+    - semantic_stats:{version}:keys:{classifier_type} HyperLogLog of written keys
+      (approximate distinct entries; not decremented on expiry or invalidation)
+
+    Two tiers: an in-process LRU (consulted first) over Redis. The local tier holds
+    the same encoded payload as Redis and decodes it on hit, so its memory limit
+    is measured on the actual stored strings. Local entries never outlive their
+    Redis counterpart: the local TTL is capped by the remaining Redis TTL derived
+    from the entry's cache metadata.
+
+    Optional per-type text normalization ("basic": NFC + punctuation/whitespace
+    folding, "fillers": basic + filler removal) lets near-duplicate utterances share
+    an entry. Normalized keys ignore the timestamp, so keep time-dependent types
+    (stage) at "none". Hits that a raw key would have missed are counted as
+    normalized_hits.
     """
 
-    def __init__(self, redis_client: redis.Redis):
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        local_max_entries: Optional[int] = None,
+        local_max_mb: Optional[float] = None,
+        local_ttl: Optional[int] = None,
+        encoding: Optional[str] = None,
+        keep_raw_runs: Optional[bool] = None,
+        adopt_legacy: Optional[bool] = None,
+        normalization: Optional[Dict[str, str]] = None
+    ):
+        """
+        Args:
+            redis_client: Redis client (decode_responses=True)
+            local_max_entries: In-process tier size (default: env SEMANTIC_CACHE_LOCAL_SIZE or 20000, 0 disables)
+            local_max_mb: In-process tier memory limit (default: env SEMANTIC_CACHE_LOCAL_MAX_MB or 128)
+            local_ttl: In-process tier TTL in seconds (default: env SEMANTIC_CACHE_LOCAL_TTL or 86400)
+            encoding: Entry encoding for writes, "compact" (zlib + base64) or "json"
+                      (default: env SEMANTIC_CACHE_ENCODING or compact). Reads accept both.
+            keep_raw_runs: Keep per-run voting details in cached results
+                      (default: env SEMANTIC_CACHE_KEEP_RAW_RUNS or false)
+            adopt_legacy: Re-key entries written before fingerprints existed to the registered
+                      fingerprint instead of letting them expire. Only safe when the checklist and
+                      model are known to be unchanged since those entries were written
+                      (default: env SEMANTIC_CACHE_ADOPT_LEGACY or false)
+            normalization: Key normalization mode per classifier type ("none" | "basic" | "fillers",
+                      "default" applies to unlisted types; default: env SEMANTIC_CACHE_NORMALIZE,
+                      e.g. "context=fillers,level=basic", or none)
+        """
         self.redis = redis_client
         self.cache_version = "v1"
         self.ttl = 2592000  # 30 days in seconds
 
+        if local_max_entries is None:
+            local_max_entries = int(os.getenv("SEMANTIC_CACHE_LOCAL_SIZE", "20000"))
+        if local_max_mb is None:
+            local_max_mb = float(os.getenv("SEMANTIC_CACHE_LOCAL_MAX_MB", "128"))
+        if local_ttl is None:
+            local_ttl = int(os.getenv("SEMANTIC_CACHE_LOCAL_TTL", "86400"))
+
+        if encoding is None:
+            encoding = os.getenv("SEMANTIC_CACHE_ENCODING", ENCODING_COMPACT).lower()
+        if encoding not in (ENCODING_COMPACT, ENCODING_JSON):
+            logger.warning(f"Unknown semantic cache encoding '{encoding}', using {ENCODING_COMPACT}")
+            encoding = ENCODING_COMPACT
+        self.encoding = encoding
+
+        if keep_raw_runs is None:
+            keep_raw_runs = os.getenv("SEMANTIC_CACHE_KEEP_RAW_RUNS", "false").lower() == "true"
+        self.keep_raw_runs = keep_raw_runs
+
+        if adopt_legacy is None:
+            adopt_legacy = os.getenv("SEMANTIC_CACHE_ADOPT_LEGACY", "false").lower() == "true"
+        self.adopt_legacy = adopt_legacy
+
+        if normalization is None:
+            normalization = parse_normalization_config(os.getenv("SEMANTIC_CACHE_NORMALIZE", ""))
+        self.normalization = dict(normalization)
+
+        # Checklist/prompt/model fingerprint per classifier type
+        self.fingerprints: Dict[str, str] = {}
+
+        self.local_ttl = min(local_ttl, self.ttl)
+        self.local_cache = None
+        if local_max_entries > 0:
+            self.local_cache = LRUCache(
+                max_entries=local_max_entries,
+                max_bytes=int(local_max_mb * 1024 * 1024),
+                ttl_seconds=self.local_ttl
+            )
+
+        # Hit/miss counters per tier
+        self._stats_lock = threading.Lock()
+        self.counters = {
+            'local_hits': 0,
+            'redis_hits': 0,
+            'misses': 0,
+            'normalized_hits': 0,
+            'sets': 0,
+            'bytes': 0
+        }
+
+        # Shared (Redis) counters, flushed in batches
+        self.stats_key = f"semantic_stats:{self.cache_version}"
+        self.fingerprints_key = f"{self.stats_key}:fingerprints"
+        self._pending_counters: Dict[str, int] = {}
+        self._pending_lookups = 0
+
+    def _count(self, counter: str, classifier_type: str, amount: int = 1):
+        """Update per-tier counters and queue the shared Redis counter"""
+        field = {
+            'local_hits': 'hits',
+            'redis_hits': 'hits'
+        }.get(counter, counter)
+
+        with self._stats_lock:
+            self.counters[counter] += amount
+            pending_field = f"{classifier_type}:{field}"
+            self._pending_counters[pending_field] = self._pending_counters.get(pending_field, 0) + amount
+            if counter in ('local_hits', 'redis_hits', 'misses'):
+                self._pending_lookups += amount
+
+    def _keys_hll(self, classifier_type: str) -> str:
+        return f"{self.stats_key}:keys:{classifier_type}"
+
+    def _queue_stats(self, pipeline):
+        """Add pending counters to a pipeline (piggybacks on writes)"""
+        with self._stats_lock:
+            pending = self._pending_counters
+            self._pending_counters = {}
+            self._pending_lookups = 0
+
+        for field, amount in pending.items():
+            pipeline.hincrby(self.stats_key, field, amount)
+
+    def flush_stats(self):
+        """Write pending counters to Redis in one round trip"""
+        try:
+            pipeline = self.redis.pipeline(transaction=False)
+            self._queue_stats(pipeline)
+            pipeline.execute()
+        except Exception as e:
+            logger.warning(f"Semantic cache stats flush error: {str(e)}")
+
+    def _maybe_flush_stats(self):
+        if self._pending_lookups >= STATS_FLUSH_EVERY:
+            self.flush_stats()
+
+    def _queue_set(
+        self, pipeline, key: str, classifier_type: str, cache_data: Dict[str, Any], ttl: Optional[int]
+    ) -> str:
+        """SETEX plus the matching stats updates, returns the encoded payload"""
+        payload = encode_entry(cache_data, self.encoding)
+        pipeline.setex(key, ttl or self.ttl, payload)
+        pipeline.pfadd(self._keys_hll(classifier_type), key)
+        self._count('sets', classifier_type)
+        self._count('bytes', classifier_type, len(payload.encode('utf-8')))
+        return payload
+
+    def _local_ttl_for(self, cache_data: Dict[str, Any]) -> int:
+        """
+        Local TTL for an entry: min(local_ttl, remaining Redis TTL)
+        """
+        metadata = cache_data.get('_cache_metadata') or {}
+        try:
+            cached_at = datetime.fromisoformat(metadata['cached_at'])
+            ttl_seconds = int(metadata.get('ttl_seconds', self.ttl))
+        except (KeyError, TypeError, ValueError):
+            return self.local_ttl
+
+        remaining = ttl_seconds - (datetime.now() - cached_at).total_seconds()
+        return max(0, min(self.local_ttl, int(remaining)))
+
+    def _set_local(self, key: str, payload: str, cache_data: Dict[str, Any], ttl: Optional[int] = None):
+        """Store the encoded payload locally (cache_data: its decoded form, for the TTL)"""
+        if self.local_cache is None:
+            return
+        local_ttl = self._local_ttl_for(cache_data) if ttl is None else min(self.local_ttl, ttl)
+        if local_ttl > 0:
+            self.local_cache.set(key, payload, ttl_seconds=local_ttl)
+
+    def _get_local(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.local_cache is None:
+            return None
+        payload = self.local_cache.get(key)
+        return decode_entry(payload) if payload is not None else None
+
+    @staticmethod
+    def _with_hit_metadata(cache_data: Dict[str, Any], key: str, tier: str) -> Dict[str, Any]:
+        """
+        Copy of a cached entry with hit metadata
+
+        Top-level copy only: callers add per-utterance fields (utterance_id, ...)
+        at the top level, nested checklist results are treated as read-only.
+        """
+        result = dict(cache_data)
+        result['_cache_metadata'] = {
+            'cache_hit': True,
+            'cache_key': key,
+            'cache_tier': tier,
+            'retrieved_at': datetime.now().isoformat()
+        }
+        return result
+
     def generate_key(self, utterance_text: str, classifier_type: str, context: Optional[Dict] = None) -> str:
         """
         Generate a cache key from utterance text and classifier type
@@ -37,18 +313,199 @@ class SemanticCache:
             context: Optional context data that affects classification
 
         Returns:
-            Cache key in format: semantic:v1:{hash}
+            Cache key in format: semantic:v1:{classifier_type}:{fingerprint}:{hash}
         """
+        mode = self.normalization_mode(classifier_type)
+        if mode == NORMALIZATION_NONE:
+            content = self._key_content(utterance_text, classifier_type, context)
+        else:
+            # Mode marker keeps normalized keys apart from raw keys of the same text
+            content = self._key_content(
+                normalize_for_cache(utterance_text, mode),
+                f"{classifier_type}:n:{normalization_marker(mode)}",
+                {k: v for k, v in (context or {}).items() if k not in NORMALIZED_IGNORED_CONTEXT}
+            )
+
+        # Generate SHA256 hash
+        hash_key = hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+        fingerprint = self.fingerprints.get(classifier_type)
+        if fingerprint:
+            return f"semantic:{self.cache_version}:{classifier_type}:{fingerprint}:{hash_key}"
+        return f"semantic:{self.cache_version}:{classifier_type}:{hash_key}"
+
+    @staticmethod
+    def _key_content(utterance_text: str, classifier_type: str, context: Optional[Dict] = None) -> str:
         # Include context in hash if provided (e.g., lesson stage for context classification)
         content = f"{classifier_type}:{utterance_text}"
         if context:
             context_str = json.dumps(context, sort_keys=True)
             content += f":{context_str}"
+        return content
 
-        # Generate SHA256 hash
-        hash_key = hashlib.sha256(content.encode('utf-8')).hexdigest()
+    def normalization_mode(self, classifier_type: str) -> str:
+        """
+        Key normalization mode for a classifier type
 
-        return f"semantic:{self.cache_version}:{classifier_type}:{hash_key}"
+        Variant types ("context_batch", "context_fused", ...) use their base type's mode
+        unless configured explicitly.
+        """
+        base_type = classifier_type.split("_", 1)[0]
+        return self.normalization.get(
+            classifier_type,
+            self.normalization.get(base_type, self.normalization.get("default", NORMALIZATION_NONE))
+        )
+
+    def _source_digest(self, utterance_text: str, classifier_type: str, context: Optional[Dict] = None) -> Optional[str]:
+        """
+        Digest of the raw (unnormalized) key content, stored with normalized entries
+        to tell near-duplicate hits from exact repeats. None for raw-keyed types.
+        """
+        if self.normalization_mode(classifier_type) == NORMALIZATION_NONE:
+            return None
+        content = self._key_content(utterance_text, classifier_type, context)
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+
+    def _count_normalized_hit(self, cache_data: Dict[str, Any], classifier_type: str, source_digest: Optional[str]):
+        """Count a hit that only the normalized key made possible"""
+        if source_digest is None:
+            return
+        stored_digest = (cache_data.get('_cache_metadata') or {}).get('source_digest')
+        if stored_digest and stored_digest != source_digest:
+            self._count('normalized_hits', classifier_type)
+
+    def register_fingerprint(self, classifier_type: str, fingerprint: str, migrate: bool = True):
+        """
+        Register the checklist/prompt/model fingerprint for a classifier type
+
+        Keys for this type include the fingerprint from now on, so entries written
+        under another fingerprint are no longer read and expire by TTL. If it differs
+        from the fingerprint last published in Redis and adopt_legacy is enabled,
+        legacy entries are adopted by a background migration.
+
+        Args:
+            classifier_type: Type of classifier
+            fingerprint: compute_fingerprint(...) of the classifier definition
+            migrate: Start the background legacy adoption when the fingerprint changed
+        """
+        if self.fingerprints.get(classifier_type) == fingerprint:
+            return
+        self.fingerprints[classifier_type] = fingerprint
+
+        try:
+            published = self.redis.hget(self.fingerprints_key, classifier_type)
+            if published == fingerprint:
+                return
+            self.redis.hset(self.fingerprints_key, classifier_type, fingerprint)
+        except Exception as e:
+            logger.error(f"Semantic cache fingerprint registration error: {str(e)}")
+            return
+
+        logger.info(
+            f"Semantic cache fingerprint changed ({classifier_type}): {published or 'none'} -> {fingerprint}"
+        )
+        if migrate and self.adopt_legacy:
+            threading.Thread(
+                target=self.migrate_fingerprints,
+                args=([classifier_type],),
+                name=f"semantic-cache-migrate-{classifier_type}",
+                daemon=True
+            ).start()
+
+    def migrate_fingerprints(
+        self,
+        classifier_types: Optional[List[str]] = None,
+        adopt_legacy: Optional[bool] = None,
+        purge_stale: bool = False,
+        dry_run: bool = False
+    ) -> Dict[str, int]:
+        """
+        Re-key legacy entries / count entries per fingerprint (incremental SCAN)
+
+        - current fingerprint: kept
+        - other fingerprint: left to expire by TTL (another process may still use it);
+          deleted only with purge_stale
+        - no fingerprint (legacy): re-keyed to the current fingerprint when
+          adopt_legacy, otherwise left to expire by TTL
+
+        Args:
+            classifier_types: Types to migrate (default: all with a known fingerprint)
+            adopt_legacy: Override self.adopt_legacy
+            purge_stale: Delete entries of other fingerprints (manual cleanup once no
+                         process runs an older checklist/model)
+            dry_run: Only count, do not modify
+
+        Returns:
+            Counts: kept, stale, expired (purged), adopted, legacy
+        """
+        adopt_legacy = self.adopt_legacy if adopt_legacy is None else adopt_legacy
+        counts = {'kept': 0, 'stale': 0, 'expired': 0, 'adopted': 0, 'legacy': 0}
+
+        try:
+            current = {**(self.redis.hgetall(self.fingerprints_key) or {}), **self.fingerprints}
+        except Exception as e:
+            logger.error(f"Semantic cache migration error: {str(e)}")
+            return counts
+
+        for classifier_type in classifier_types or list(current.keys()):
+            fingerprint = current.get(classifier_type)
+            if not fingerprint:
+                continue
+
+            # One migration per type at a time across processes
+            lock_key = f"{self.stats_key}:migration:{classifier_type}"
+            try:
+                if not dry_run and not self.redis.set(lock_key, fingerprint, nx=True, ex=3600):
+                    logger.info(f"Semantic cache migration already running ({classifier_type})")
+                    continue
+
+                prefix = f"semantic:{self.cache_version}:{classifier_type}:"
+                pipeline = self.redis.pipeline(transaction=False)
+                queued = 0
+
+                for key in self.redis.scan_iter(match=f"{prefix}*", count=1000):
+                    parts = key[len(prefix):].split(':')
+
+                    if len(parts) == 2 and parts[0] == fingerprint:
+                        counts['kept'] += 1
+                        continue
+                    elif len(parts) == 2 and not purge_stale:
+                        counts['stale'] += 1
+                        continue
+                    elif len(parts) == 2:
+                        counts['expired'] += 1
+                        pipeline.delete(key)
+                    elif adopt_legacy:
+                        counts['adopted'] += 1
+                        # RENAME keeps the TTL; if the new key already exists drop the legacy copy
+                        pipeline.renamenx(key, f"{prefix}{fingerprint}:{parts[0]}")
+                        pipeline.delete(key)
+                    else:
+                        counts['legacy'] += 1
+                        continue
+
+                    queued += 1
+                    if queued >= INVALIDATE_BATCH_SIZE:
+                        if not dry_run:
+                            pipeline.execute()
+                        pipeline = self.redis.pipeline(transaction=False)
+                        queued = 0
+
+                if queued and not dry_run:
+                    pipeline.execute()
+
+            except Exception as e:
+                logger.error(f"Semantic cache migration error ({classifier_type}): {str(e)}")
+
+            finally:
+                if not dry_run:
+                    try:
+                        self.redis.delete(lock_key)
+                    except Exception:
+                        pass
+
+        logger.info(f"Semantic cache migration{' (dry run)' if dry_run else ''}: {counts}")
+        return counts
 
     def get(self, utterance_text: str, classifier_type: str, context: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
         """
@@ -64,22 +521,32 @@ class SemanticCache:
         """
         try:
             key = self.generate_key(utterance_text, classifier_type, context)
+            source_digest = self._source_digest(utterance_text, classifier_type, context)
+
+            # Tier 1: in-process LRU
+            local_data = self._get_local(key)
+            if local_data is not None:
+                self._count('local_hits', classifier_type)
+                self._count_normalized_hit(local_data, classifier_type, source_digest)
+                self._maybe_flush_stats()
+                logger.debug(f"✓ Semantic cache local HIT ({classifier_type}): {key[:60]}...")
+                return self._with_hit_metadata(local_data, key, 'local')
+
+            # Tier 2: Redis
             cached_data = self.redis.get(key)
 
             if cached_data:
-                result = json.loads(cached_data)
-                logger.info(f"✓ Semantic cache HIT ({classifier_type}): {key[:60]}...")
-
-                # Add cache hit metadata
-                result['_cache_metadata'] = {
-                    'cache_hit': True,
-                    'cache_key': key,
-                    'retrieved_at': datetime.now().isoformat()
-                }
-
-                return result
-
-            logger.info(f"✗ Semantic cache MISS ({classifier_type}): {key[:60]}...")
+                cache_data = decode_entry(cached_data)
+                self._set_local(key, cached_data, cache_data)
+                self._count('redis_hits', classifier_type)
+                self._count_normalized_hit(cache_data, classifier_type, source_digest)
+                self._maybe_flush_stats()
+                logger.debug(f"✓ Semantic cache HIT ({classifier_type}): {key[:60]}...")
+                return self._with_hit_metadata(cache_data, key, 'redis')
+
+            self._count('misses', classifier_type)
+            self._maybe_flush_stats()
+            logger.debug(f"✗ Semantic cache MISS ({classifier_type}): {key[:60]}...")
             return None
 
         except Exception as e:
@@ -109,32 +576,171 @@ class SemanticCache:
         """
         try:
             key = self.generate_key(utterance_text, classifier_type, context)
-
-            # Add cache metadata to result
-            cache_data = {
-                **result,
-                '_cache_metadata': {
-                    'cached_at': datetime.now().isoformat(),
-                    'cache_version': self.cache_version,
-                    'classifier_type': classifier_type,
-                    'ttl_seconds': ttl or self.ttl
-                }
-            }
-
-            # Store in Redis with TTL
-            self.redis.setex(
-                key,
-                ttl or self.ttl,
-                json.dumps(cache_data, ensure_ascii=False)
+            cache_data = self._build_cache_data(
+                result, classifier_type, ttl, self._source_digest(utterance_text, classifier_type, context)
             )
 
-            logger.info(f"✓ Cached result ({classifier_type}): {key[:60]}...")
+            # Store in Redis with TTL (stats updates ride along in the same round trip)
+            pipeline = self.redis.pipeline(transaction=False)
+            payload = self._queue_set(pipeline, key, classifier_type, cache_data, ttl)
+            self._queue_stats(pipeline)
+            pipeline.execute()
+            self._set_local(key, payload, cache_data, ttl or self.ttl)
+
+            logger.debug(f"✓ Cached result ({classifier_type}): {key[:60]}...")
             return True
 
         except Exception as e:
             logger.error(f"Semantic cache storage error: {str(e)}")
             return False
 
+    def _build_cache_data(
+        self,
+        result: Dict[str, Any],
+        classifier_type: str,
+        ttl: Optional[int],
+        source_digest: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Add cache metadata to result (dropping raw_runs unless keep_raw_runs)"""
+        if not self.keep_raw_runs:
+            result = _strip_raw_runs(result)
+        metadata = {
+            'cached_at': datetime.now().isoformat(),
+            'cache_version': self.cache_version,
+            'classifier_type': classifier_type,
+            'ttl_seconds': ttl or self.ttl
+        }
+        if source_digest:
+            metadata['source_digest'] = source_digest
+        return {**result, '_cache_metadata': metadata}
+
+    def get_many(self, lookups: List[Tuple[str, str, Optional[Dict]]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Retrieve many cached classification results with a single MGET
+
+        Local-tier hits are served without Redis; the remaining keys are
+        fetched in one round trip and backfilled into the local tier.
+
+        Args:
+            lookups: [(utterance_text, classifier_type, context), ...]
+
+        Returns:
+            Cached result (or None on miss) for each lookup, in order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(lookups)
+        if not lookups:
+            return results
+
+        try:
+            keys = [
+                self.generate_key(utterance_text, classifier_type, context)
+                for utterance_text, classifier_type, context in lookups
+            ]
+            source_digests = [
+                self._source_digest(utterance_text, classifier_type, context)
+                for utterance_text, classifier_type, context in lookups
+            ]
+
+            # Tier 1: in-process LRU
+            remote = []
+            for i, key in enumerate(keys):
+                local_data = self._get_local(key)
+                if local_data is not None:
+                    self._count('local_hits', lookups[i][1])
+                    self._count_normalized_hit(local_data, lookups[i][1], source_digests[i])
+                    results[i] = self._with_hit_metadata(local_data, key, 'local')
+                else:
+                    remote.append(i)
+
+            # Tier 2: Redis (single MGET, duplicate keys fetched once)
+            if remote:
+                unique_keys = list(dict.fromkeys(keys[i] for i in remote))
+                values = dict(zip(unique_keys, self.redis.mget(unique_keys)))
+                decoded = {}
+
+                for i in remote:
+                    key = keys[i]
+                    if key not in decoded:
+                        decoded[key] = decode_entry(values[key]) if values[key] else None
+                        if decoded[key] is not None:
+                            self._set_local(key, values[key], decoded[key])
+
+                    if decoded[key] is None:
+                        self._count('misses', lookups[i][1])
+                    else:
+                        self._count('redis_hits', lookups[i][1])
+                        self._count_normalized_hit(decoded[key], lookups[i][1], source_digests[i])
+                        results[i] = self._with_hit_metadata(decoded[key], key, 'redis')
+
+            self._maybe_flush_stats()
+
+            hits = sum(1 for result in results if result is not None)
+            logger.info(f"Semantic cache prefetch: {hits}/{len(lookups)} hits ({len(remote)} looked up in Redis)")
+            return results
+
+        except Exception as e:
+            logger.error(f"Semantic cache bulk retrieval error: {str(e)}")
+            return results
+
+    def prefetch(self, utterances: List[Dict[str, Any]], classifier_type: str) -> List[Optional[Dict[str, Any]]]:
+        """
+        Bulk lookup for a whole transcript (classify_multiple_utterances input)
+
+        Args:
+            utterances: [{"text": "...", "timestamp": "...", ...}, ...]
+            classifier_type: Type of classifier
+
+        Returns:
+            Cached result (or None on miss) for each utterance, in order
+        """
+        return self.get_many([
+            (utterance["text"], classifier_type, utterance_cache_context(utterances, i))
+            for i, utterance in enumerate(utterances)
+        ])
+
+    def set_many(
+        self,
+        entries: List[Tuple[str, str, Dict[str, Any], Optional[Dict]]],
+        ttl: Optional[int] = None
+    ) -> int:
+        """
+        Store many classification results with one pipelined round trip
+
+        Args:
+            entries: [(utterance_text, classifier_type, result, context), ...]
+            ttl: Optional TTL in seconds (default: 30 days)
+
+        Returns:
+            Number of entries stored
+        """
+        if not entries:
+            return 0
+
+        try:
+            pipeline = self.redis.pipeline(transaction=False)
+            stored = []
+
+            for utterance_text, classifier_type, result, context in entries:
+                key = self.generate_key(utterance_text, classifier_type, context)
+                cache_data = self._build_cache_data(
+                    result, classifier_type, ttl, self._source_digest(utterance_text, classifier_type, context)
+                )
+                payload = self._queue_set(pipeline, key, classifier_type, cache_data, ttl)
+                stored.append((key, payload, cache_data))
+
+            self._queue_stats(pipeline)
+            pipeline.execute()
+
+            for key, payload, cache_data in stored:
+                self._set_local(key, payload, cache_data, ttl or self.ttl)
+
+            logger.debug(f"✓ Cached {len(stored)} results (pipelined)")
+            return len(stored)
+
+        except Exception as e:
+            logger.error(f"Semantic cache bulk storage error: {str(e)}")
+            return 0
+
     def invalidate(self, utterance_text: str, classifier_type: str, context: Optional[Dict] = None) -> bool:
         """
         Delete a specific cache entry
@@ -149,6 +755,8 @@ class SemanticCache:
         """
         try:
             key = self.generate_key(utterance_text, classifier_type, context)
+            if self.local_cache is not None:
+                self.local_cache.delete(key)
             deleted = self.redis.delete(key)
 
             if deleted:
@@ -173,14 +781,26 @@ class SemanticCache:
             Number of keys deleted
         """
         try:
-            keys = self.redis.keys(pattern)
-            if keys:
-                deleted = self.redis.delete(*keys)
+            # Local tier cannot be matched by pattern cheaply; drop it entirely
+            if self.local_cache is not None:
+                self.local_cache.clear()
+
+            # Incremental SCAN instead of KEYS (never blocks Redis for the whole keyspace)
+            deleted = 0
+            batch = []
+            for key in self.redis.scan_iter(match=pattern, count=1000):
+                batch.append(key)
+                if len(batch) >= INVALIDATE_BATCH_SIZE:
+                    deleted += self.redis.delete(*batch)
+                    batch = []
+            if batch:
+                deleted += self.redis.delete(*batch)
+
+            if deleted:
                 logger.info(f"✓ Invalidated {deleted} cache entries matching: {pattern}")
-                return deleted
             else:
                 logger.info(f"✗ No cache entries found matching: {pattern}")
-                return 0
+            return deleted
 
         except Exception as e:
             logger.error(f"Semantic cache pattern invalidation error: {str(e)}")
@@ -194,31 +814,32 @@ class SemanticCache:
             Dictionary with cache stats
         """
         try:
-            all_keys = self.redis.keys(f"semantic:{self.cache_version}:*")
-
-            # Count by classifier type
-            type_counts = {
-                'stage': 0,
-                'context': 0,
-                'level': 0,
-                'other': 0
-            }
-
-            for key in all_keys:
-                if ':stage:' in key:
-                    type_counts['stage'] += 1
-                elif ':context:' in key:
-                    type_counts['context'] += 1
-                elif ':level:' in key:
-                    type_counts['level'] += 1
-                else:
-                    type_counts['other'] += 1
+            self.flush_stats()
+
+            # Maintained counters (O(number of classifier types), no keyspace scan)
+            counters = self.redis.hgetall(self.stats_key) or {}
+            by_type: Dict[str, Dict[str, int]] = {}
+            for field, value in counters.items():
+                classifier_type, _, name = field.rpartition(':')
+                by_type.setdefault(classifier_type, {})[name] = int(value)
+
+            type_counts = {}
+            for classifier_type, type_stats in by_type.items():
+                type_counts[classifier_type] = self.redis.pfcount(self._keys_hll(classifier_type))
+                lookups = type_stats.get('hits', 0) + type_stats.get('misses', 0)
+                type_stats['hit_rate'] = round(type_stats.get('hits', 0) / lookups, 3) if lookups else 0.0
+                type_stats['normalized_hit_rate'] = (
+                    round(type_stats.get('normalized_hits', 0) / lookups, 3) if lookups else 0.0
+                )
+                type_stats['normalization'] = self.normalization_mode(classifier_type)
 
             stats = {
-                'total_cached_entries': len(all_keys),
+                'total_cached_entries': sum(type_counts.values()),  # approximate (HyperLogLog)
                 'by_classifier_type': type_counts,
+                'counters_by_classifier_type': by_type,
                 'cache_version': self.cache_version,
                 'default_ttl_days': self.ttl // 86400,
+                'tiers': self.get_tier_stats(),
                 'redis_memory_used_mb': self.redis.info('memory')['used_memory'] / (1024 * 1024)
             }
 
@@ -228,11 +849,34 @@ class SemanticCache:
             logger.error(f"Semantic cache stats error: {str(e)}")
             return {'error': str(e)}
 
+    def get_tier_stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss counters per tier (no Redis access)
+
+        Returns:
+            Dictionary with local/redis hit counts, hit rates and local LRU usage
+        """
+        with self._stats_lock:
+            counters = dict(self.counters)
+
+        lookups = counters['local_hits'] + counters['redis_hits'] + counters['misses']
+        return {
+            **counters,
+            'lookups': lookups,
+            'hit_rate': round((counters['local_hits'] + counters['redis_hits']) / lookups, 3) if lookups else 0.0,
+            'local_hit_rate': round(counters['local_hits'] / lookups, 3) if lookups else 0.0,
+            'normalized_hit_rate': round(counters['normalized_hits'] / lookups, 3) if lookups else 0.0,
+            'normalization': dict(self.normalization),
+            'local': self.local_cache.get_stats() if self.local_cache is not None else None
+        }
+
     def clear_all(self) -> int:
         """
-        Clear all semantic cache entries (use with caution!)
+        Clear all semantic cache entries and their statistics (use with caution!)
 
         Returns:
             Number of keys deleted
         """
-        return self.invalidate_pattern(f"semantic:{self.cache_version}:*")
+        deleted = self.invalidate_pattern(f"semantic:{self.cache_version}:*")
+        self.invalidate_pattern(f"{self.stats_key}*")
+        return deleted
@@ -0,0 +1,142 @@
+"""
+Text Normalization for Cache Keys
+캐시 키 해싱 전 발화 정규화 (거의 같은 발화를 같은 키로)
+
+"자 여러분 조용히 하세요." 와 "자, 여러분 조용히 하세요" 처럼 문장부호/공백/간투사만 다른
+발화가 같은 캐시 항목을 쓰도록 한다. 정규화된 텍스트는 키 계산에만 쓰이며,
+LLM에는 항상 원문이 전달된다.
+
+정규화 모드:
+    none: 원문 그대로 (기존 키와 동일)
+    basic: Unicode NFC + 문장부호 제거 + 공백 정리 + 소문자화
+    fillers: basic + 의미 없는 간투사 제거 (CACHE_KEY_FILLERS)
+"""
+
+import re
+import hashlib
+import unicodedata
+from typing import Dict, List, Optional
+
+NORMALIZATION_NONE = "none"
+NORMALIZATION_BASIC = "basic"
+NORMALIZATION_FILLERS = "fillers"
+NORMALIZATION_MODES = [NORMALIZATION_NONE, NORMALIZATION_BASIC, NORMALIZATION_FILLERS]
+
+# services/transcription/utils/text_preprocessing.py의 KOREAN_FILLERS와 동일
+# (서비스별 이미지가 분리되어 있어 직접 import하지 않음)
+KOREAN_FILLERS = [
+    '어', '음', '그', '저', '뭐', '이제', '그냥', '약간',
+    '어떻게', '이런', '저런', '그런', '막', '좀', '되게'
+]
+
+# 캐시 키용 간투사: 분류(단계/맥락/인지 수준)에 영향이 없는 소리/말버릇만.
+# KOREAN_FILLERS의 '어떻게', '이런', '그런', '저', '뭐' 등은 전사본 정리에는 무해하지만
+# 질문 여부나 지시 대상을 바꾸므로 캐시 키에서는 지우지 않는다
+# ("어떻게 풀었어요?"와 "풀었어요?"는 수준/맥락이 다름)
+CACHE_KEY_FILLERS = ['어', '음', '아', '에', '으', '막', '그냥']
+
+# 반복 축약 ("어어어" -> "어"): transcription 정리는 모든 문자에 적용하지만, 캐시 키에서는
+# 한글 음절/자모만 ("1000번"과 "10번"이 같은 키가 되지 않도록)
+_REPEAT_PATTERN = r'(.)\1{2,}'
+_CACHE_KEY_REPEAT_PATTERN = r'([가-힣ㄱ-ㅎㅏ-ㅣ])\1{2,}'
+
+# 목록/반복 규칙이 바뀌면 이전 규칙으로 만든 키와 섞이지 않도록 캐시 키의 모드 표시에 포함
+CACHE_KEY_FILLERS_DIGEST = hashlib.sha256(
+    "\n".join(CACHE_KEY_FILLERS + [_CACHE_KEY_REPEAT_PATTERN]).encode("utf-8")
+).hexdigest()[:8]
+
+
+def _compile_fillers(fillers: List[str]) -> List[re.Pattern]:
+    return [re.compile(r'\b' + re.escape(filler) + r'\b') for filler in fillers]
+
+
+_FILLER_PATTERNS = _compile_fillers(KOREAN_FILLERS)
+_CACHE_KEY_FILLER_PATTERNS = _compile_fillers(CACHE_KEY_FILLERS)
+
+
+def remove_fillers(text: str, fillers: Optional[List[str]] = None) -> str:
+    """
+    간투사 제거 (transcription 서비스의 remove_fillers와 같은 동작)
+
+    Args:
+        text: 입력 텍스트
+        fillers: 간투사 목록 (기본값: KOREAN_FILLERS)
+
+    Returns:
+        간투사가 제거된 텍스트
+    """
+    patterns = _FILLER_PATTERNS if fillers is None else _compile_fillers(fillers)
+    return _remove_filler_patterns(text, patterns, _REPEAT_PATTERN)
+
+
+def _remove_filler_patterns(text: str, patterns: List[re.Pattern], repeat_pattern: str) -> str:
+    # 단독으로 쓰인 간투사 제거
+    for pattern in patterns:
+        text = pattern.sub('', text)
+
+    # 반복 문자 축약 (예: "어어어" -> "어")
+    text = re.sub(repeat_pattern, r'\1', text)
+
+    # 공백 정리
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def fold_punctuation(text: str) -> str:
+    """NFC 정규화 후 문장부호를 공백으로 바꾸고 공백/대소문자 정리"""
+    text = unicodedata.normalize('NFC', text)
+    text = ''.join(
+        ' ' if unicodedata.category(char).startswith('P') else char
+        for char in text
+    )
+    return re.sub(r'\s+', ' ', text).strip().lower()
+
+
+def normalize_for_cache(text: str, mode: str = NORMALIZATION_NONE) -> str:
+    """
+    캐시 키용 정규화
+
+    Args:
+        text: 발화 원문
+        mode: "none" | "basic" | "fillers"
+
+    Returns:
+        정규화된 텍스트 (none이면 원문)
+    """
+    if mode == NORMALIZATION_NONE:
+        return text
+
+    text = fold_punctuation(text)
+    if mode == NORMALIZATION_FILLERS:
+        normalized = _remove_filler_patterns(text, _CACHE_KEY_FILLER_PATTERNS, _CACHE_KEY_REPEAT_PATTERN)
+        # 간투사만으로 이루어진 발화는 원래 텍스트 유지 (빈 키 방지)
+        text = normalized or text
+
+    return text
+
+
+def normalization_marker(mode: str) -> str:
+    """캐시 키에 넣을 모드 표시 (fillers는 간투사 목록 digest 포함)"""
+    if mode == NORMALIZATION_FILLERS:
+        return f"{mode}-{CACHE_KEY_FILLERS_DIGEST}"
+    return mode
+
+
+def parse_normalization_config(spec: str) -> Dict[str, str]:
+    """
+    정규화 설정 문자열 파싱
+
+    Args:
+        spec: "basic" (모든 분류기) 또는 "default=basic,context=fillers,stage=none"
+
+    Returns:
+        {"default": "basic", "context": "fillers", ...} (알 수 없는 모드는 무시)
+    """
+    config: Dict[str, str] = {}
+    for entry in (spec or "").split(","):
+        entry = entry.strip().lower()
+        if not entry:
+            continue
+        classifier_type, _, mode = entry.rpartition("=")
+        if mode in NORMALIZATION_MODES:
+            config[classifier_type or "default"] = mode
+    return config
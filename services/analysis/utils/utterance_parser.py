@@ -1,15 +1,158 @@
 """
 Utterance Parser Utility
 Converts Module 1 transcript segments into utterance format for analysis
+
+Caption segments (YouTube splits sentences every 2-5 seconds) are coalesced into
+sentence-level utterances before classification.
+
+Environment variables:
+    UTTERANCE_COALESCING: Merge adjacent segments into sentences (default: true)
+    UTTERANCE_MAX_SECONDS: Max duration of a merged utterance (default: 20)
+    UTTERANCE_MAX_CHARS: Max length of a merged utterance (default: 150)
+    UTTERANCE_MAX_GAP_SECONDS: Pause that always ends an utterance (default: 3)
 """
 
+import os
+import re
 import logging
 from typing import List, Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Sentence-final punctuation, or a Korean sentence-final ending on a word of 2+ chars
+# (다/요/죠/까/냐/자 cover 습니다, 해요, 하죠, 할까, 하냐, 하자 ...; a bare "다" is the adverb "all")
+_SENTENCE_END_PUNCTUATION = re.compile(r"[.?!…。？！]['\"”’)\]]*$")
+_SENTENCE_END_KOREAN = re.compile(r"\S[다요죠까냐자][~]*$")
+# Informal (반말) endings: 했어, 좋아, 뭐야, 그렇지, 할래, 하네, 그렇군, and bare imperatives 해/봐/줘/돼
+_SENTENCE_END_INFORMAL = re.compile(r"(\S[어아야지래네군]|[해봐줘돼])[~]*$")
+# One-word replies that end an utterance on their own
+_SENTENCE_END_WORDS = {"네", "예", "응", "아니", "아뇨"}
+# Common lesson nouns that look like informal endings (단어, 페이지, 이해 ...)
+_INFORMAL_END_EXCEPTIONS = {
+    "단어", "영어", "국어", "언어", "용어", "페이지", "이미지", "메시지", "미래", "이해", "분야"
+}
+# Connective endings / trailing commas that always continue into the next segment
+_CONTINUATION = re.compile(r"(,|고|서|며|면|는데|지만|니까|려고|도록|는|은|을|를|이|가|의|에|와|과|랑)$")
+
+
+def is_sentence_end(text: str) -> bool:
+    """Whether text ends a Korean (or punctuated) sentence"""
+    text = text.rstrip()
+    if not text:
+        return False
+    if _SENTENCE_END_PUNCTUATION.search(text):
+        return True
+    last_word = text.split()[-1]
+    if last_word.rstrip("~") in _SENTENCE_END_WORDS:
+        return True
+    if _CONTINUATION.search(last_word):
+        return False
+    if _SENTENCE_END_KOREAN.search(last_word):
+        return True
+    return bool(_SENTENCE_END_INFORMAL.search(last_word)) and last_word.rstrip("~") not in _INFORMAL_END_EXCEPTIONS
+
+
+def _segment_start(segment: Dict[str, Any]) -> Optional[float]:
+    start = segment.get('timestamp', segment.get('start'))
+    try:
+        return float(start) if start is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _segment_end(segment: Dict[str, Any], start: Optional[float]) -> Optional[float]:
+    """Segment end time, or None when the segment has neither 'end' nor 'duration'"""
+    if segment.get('end') is not None:
+        return float(segment['end'])
+    if start is not None and segment.get('duration') is not None:
+        return start + float(segment['duration'])
+    return None
+
+
+def coalesce_segments(
+    segments: List[Dict[str, Any]],
+    max_seconds: Optional[float] = None,
+    max_chars: Optional[int] = None,
+    max_gap_seconds: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    Merge adjacent caption segments into sentence-level segments
+
+    A merged segment ends at a sentence ending, a speaker change, a pause longer
+    than max_gap_seconds, or before it would exceed max_seconds / max_chars.
+
+    Args:
+        segments: [{'timestamp': 125, 'text': '...'}, ...]
+                  ('start'/'duration'/'end'/'speaker' are used when present)
+        max_seconds: Max duration (default: env UTTERANCE_MAX_SECONDS or 20)
+        max_chars: Max text length (default: env UTTERANCE_MAX_CHARS or 150)
+        max_gap_seconds: Pause that ends an utterance (default: env UTTERANCE_MAX_GAP_SECONDS or 3)
 
-def segments_to_utterances(segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    Returns:
+        [{'timestamp': start, 'end': end, 'text': '...', 'segment_count': 3}, ...]
+        (start is None when the source segments have no timestamps; end is None when the
+        last merged segment has no 'end'/'duration' - pauses and durations are then
+        measured from segment start times)
+    """
+    if max_seconds is None:
+        max_seconds = float(os.getenv("UTTERANCE_MAX_SECONDS", "20"))
+    if max_chars is None:
+        max_chars = int(os.getenv("UTTERANCE_MAX_CHARS", "150"))
+    if max_gap_seconds is None:
+        max_gap_seconds = float(os.getenv("UTTERANCE_MAX_GAP_SECONDS", "3"))
+
+    merged: List[Dict[str, Any]] = []
+    current: Optional[Dict[str, Any]] = None
+    current_latest: Optional[float] = None  # latest known end (or start) time of the current utterance
+
+    for segment in segments:
+        text = (segment.get('text') or '').strip()
+        if not text:
+            continue
+
+        start = _segment_start(segment)
+        end = _segment_end(segment, start)
+        latest = end if end is not None else start
+        speaker = segment.get('speaker')
+
+        if current is not None:
+            boundary = (
+                is_sentence_end(current['text'])
+                or speaker != current.get('speaker')
+                or len(current['text']) + 1 + len(text) > max_chars
+                or (start is not None and current_latest is not None
+                    and start - current_latest > max_gap_seconds)
+                or (latest is not None and current['timestamp'] is not None
+                    and latest - current['timestamp'] > max_seconds)
+            )
+            if not boundary:
+                current['text'] = f"{current['text']} {text}"
+                current['end'] = end
+                current['segment_count'] += 1
+                current_latest = latest if latest is not None else current_latest
+                continue
+            merged.append(current)
+
+        current = {
+            'timestamp': start,
+            'end': end,
+            'text': text,
+            'segment_count': 1
+        }
+        current_latest = latest
+        if speaker is not None:
+            current['speaker'] = speaker
+
+    if current is not None:
+        merged.append(current)
+
+    return merged
+
+
+def segments_to_utterances(
+    segments: List[Dict[str, Any]],
+    coalesce: Optional[bool] = None
+) -> List[Dict[str, Any]]:
     """
     Convert Module 1 segments to utterance format for analysis
 
@@ -20,6 +163,8 @@ def segments_to_utterances(segments: List[Dict[str, Any]]) -> List[Dict[str, Any
                 {'timestamp': 150, 'text': 'next utterance'},
                 ...
             ]
+        coalesce: Merge caption fragments into sentence-level utterances first
+                  (default: env UTTERANCE_COALESCING or true)
 
     Returns:
         List of utterances in analysis format
@@ -28,11 +173,18 @@ def segments_to_utterances(segments: List[Dict[str, Any]]) -> List[Dict[str, Any
                 {'id': 'utt_0002', 'text': '...', 'timestamp': '00:02:30'},
                 ...
             ]
+        Coalesced utterances also carry 'segment_count', and 'end_timestamp' when the
+        segments have 'end'/'duration' (omitted otherwise, never estimated).
     """
     if not segments:
         logger.warning("No segments provided to convert")
         return []
 
+    if coalesce is None:
+        coalesce = os.getenv("UTTERANCE_COALESCING", "true").lower() == "true"
+    if coalesce:
+        return _coalesced_utterances(segments)
+
     utterances = []
 
     for i, segment in enumerate(segments):
@@ -64,6 +216,34 @@ def segments_to_utterances(segments: List[Dict[str, Any]]) -> List[Dict[str, Any
     return utterances
 
 
+def _coalesced_utterances(segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    merged = coalesce_segments(segments)
+
+    utterances = []
+    for i, segment in enumerate(merged):
+        if segment['timestamp'] is not None:
+            timestamp_str = seconds_to_hms(segment['timestamp'])
+        else:
+            # If no timestamp, use sequential fake timestamp
+            timestamp_str = f"00:{i//60:02d}:{i%60:02d}"
+
+        utterance = {
+            "id": f"utt_{i+1:04d}",
+            "text": segment['text'],
+            "timestamp": timestamp_str,
+            "segment_count": segment['segment_count']
+        }
+        if segment['end'] is not None:
+            utterance["end_timestamp"] = seconds_to_hms(segment['end'])
+        if segment.get('speaker') is not None:
+            utterance["speaker"] = segment['speaker']
+
+        utterances.append(utterance)
+
+    logger.info(f"Coalesced {len(segments)} segments into {len(utterances)} utterances")
+    return utterances
+
+
 def seconds_to_hms(seconds: int) -> str:
     """
     Convert seconds (integer) to HH:MM:SS format (string)
@@ -74,6 +254,7 @@ def seconds_to_hms(seconds: int) -> str:
     Returns:
         Formatted timestamp string (e.g., "00:02:05")
     """
+    seconds = int(seconds)
     hours = seconds // 3600
     minutes = (seconds % 3600) // 60
     secs = seconds % 60
@@ -98,16 +98,17 @@ async def analyze_transcript_by_id(request: TranscriptAnalysisRequest):
 
 
 @router.get("/{job_id}")
-async def get_analysis_status(job_id: str):
+async def get_analysis_status(job_id: str, include_result: bool = True):
     """
     Get analysis job status
 
-    Proxies to analysis service
+    Proxies to analysis service (include_result=false returns the status record only)
     """
     try:
         async with await get_http_client() as client:
             response = await client.get(
-                f"{settings.analysis_service_url}/api/analyze/{job_id}"
+                f"{settings.analysis_service_url}/api/analyze/{job_id}",
+                params={"include_result": str(include_result).lower()}
             )
 
             if response.status_code == 200:
@@ -8,7 +8,7 @@ import uuid
 import json
 import asyncio
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 from pydantic import BaseModel, HttpUrl
 import httpx
@@ -60,6 +60,86 @@ async def get_http_client():
     return httpx.AsyncClient(timeout=settings.service_timeout)
 
 
+# Job status streams (SSE) - services send a keepalive every 15 seconds
+JOB_EVENTS_READ_TIMEOUT = 60.0
+# Status polling interval when the event stream is unavailable
+JOB_STATUS_FALLBACK_INTERVAL = 5
+
+
+async def _follow_job_events(
+    client: httpx.AsyncClient,
+    events_url: str,
+    terminal_statuses: set,
+    on_event: Optional[Callable[[Dict[str, Any]], None]]
+) -> Optional[str]:
+    """Read a job's SSE stream until a terminal status event (None if the stream ends first)"""
+    timeout = httpx.Timeout(settings.service_timeout, read=JOB_EVENTS_READ_TIMEOUT)
+    async with client.stream("GET", events_url, timeout=timeout) as response:
+        if response.status_code != 200:
+            return None
+
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+
+            event = json.loads(line[len("data:"):].strip())
+            if on_event:
+                on_event(event)
+
+            status = (event.get("status") or "").lower()
+            if status in terminal_statuses:
+                return status
+
+    return None
+
+
+async def wait_for_job(
+    client: httpx.AsyncClient,
+    status_url: str,
+    events_url: str,
+    terminal_statuses,
+    max_wait_seconds: float,
+    on_event: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Wait for a service job to reach a terminal status
+
+    Follows the job's status event stream instead of polling. If the stream is
+    unavailable or drops, checks the status endpoint once, waits
+    JOB_STATUS_FALLBACK_INTERVAL seconds and reconnects.
+
+    Returns:
+        Full status record from status_url, or None on timeout
+    """
+    terminal_statuses = {status.lower() for status in terminal_statuses}
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_wait_seconds
+
+    while True:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return None
+
+        try:
+            await asyncio.wait_for(
+                _follow_job_events(client, events_url, terminal_statuses, on_event),
+                timeout=remaining
+            )
+        except asyncio.TimeoutError:
+            return None
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning(f"Job event stream {events_url} interrupted: {e}")
+
+        # Terminal event received (or stream unavailable): the status endpoint has the full record
+        status_response = await client.get(status_url)
+        if status_response.status_code == 200:
+            status_data = status_response.json()
+            if (status_data.get("status") or "").lower() in terminal_statuses:
+                return status_data
+
+        await asyncio.sleep(JOB_STATUS_FALLBACK_INTERVAL)
+
+
 async def run_full_analysis_workflow(
     workflow_id: str,
     video_url: str,
@@ -157,53 +237,45 @@ async def run_full_analysis_workflow(
                     f"Transcription job submitted: {transcription_job_id}"
                 )
 
-                # Poll for transcription completion
-                max_attempts = 240  # 20 minutes (5 sec intervals)
-                attempt = 0
+                # Wait for transcription completion (20 minutes max)
+                status_data = await wait_for_job(
+                    client,
+                    f"{settings.transcription_service_url}/api/transcribe/{transcription_job_id}",
+                    f"{settings.transcription_service_url}/api/jobs/{transcription_job_id}/events",
+                    ("completed", "success", "failed", "failure"),
+                    max_wait_seconds=20 * 60
+                )
+
+                if status_data is None:
+                    raise Exception("Transcription timeout")
 
-                while attempt < max_attempts:
-                    status_response = await client.get(
-                        f"{settings.transcription_service_url}/api/transcribe/{transcription_job_id}"
+                # Handle both "completed" and "success" status values
+                if status_data["status"].lower() not in ("completed", "success"):
+                    raise Exception("Transcription job failed")
+
+                # Get transcript from status response (result is embedded)
+                result_data = status_data.get("result", {})
+                transcript_text = result_data.get("transcript", "")
+                segments = result_data.get("segments", [])
+
+                # 세그먼트 최소 개수 검증 (엄격 모드)
+                if not segments or len(segments) < 10:
+                    segment_count = len(segments) if segments else 0
+                    logger.error(f"Insufficient segments from transcription: {segment_count}")
+                    update_status(
+                        "transcription",
+                        "error",
+                        f"전사 세그먼트 부족 (최소 10개 필요, 현재 {segment_count}개)",
+                        {"transcription_job_id": transcription_job_id}
                     )
+                    raise Exception(f"Insufficient segments: {segment_count} (minimum 10 required)")
 
-                    if status_response.status_code == 200:
-                        status_data = status_response.json()
-
-                        # Handle both "completed" and "success" status values
-                        if status_data.get("status") in ("completed", "success"):
-                            # Get transcript from status response (result is embedded)
-                            result_data = status_data.get("result", {})
-                            transcript_text = result_data.get("transcript", "")
-                            segments = result_data.get("segments", [])
-
-                            # 세그먼트 최소 개수 검증 (엄격 모드)
-                            if not segments or len(segments) < 10:
-                                segment_count = len(segments) if segments else 0
-                                logger.error(f"Insufficient segments from transcription: {segment_count}")
-                                update_status(
-                                    "transcription",
-                                    "error",
-                                    f"전사 세그먼트 부족 (최소 10개 필요, 현재 {segment_count}개)",
-                                    {"transcription_job_id": transcription_job_id}
-                                )
-                                raise Exception(f"Insufficient segments: {segment_count} (minimum 10 required)")
-
-                            update_status(
-                                "transcription",
-                                "completed",
-                                f"Transcription completed ({len(segments)} segments)",
-                                {"transcription_job_id": transcription_job_id}
-                            )
-                            break
-
-                        elif status_data.get("status") == "failed":
-                            raise Exception("Transcription job failed")
-
-                    await asyncio.sleep(5)
-                    attempt += 1
-
-                if attempt >= max_attempts:
-                    raise Exception("Transcription timeout")
+                update_status(
+                    "transcription",
+                    "completed",
+                    f"Transcription completed ({len(segments)} segments)",
+                    {"transcription_job_id": transcription_job_id}
+                )
 
             # Step 2: Analysis
             update_status("analysis", "processing", "Starting analysis...")
@@ -234,38 +306,46 @@ async def run_full_analysis_workflow(
                 f"Analysis job submitted: {analysis_job_id}"
             )
 
-            # Poll for analysis completion (90 minutes max due to API rate limiting)
-            max_attempts = 1080  # 90 minutes (5 sec intervals)
-            attempt = 0
-
-            while attempt < max_attempts:
-                status_response = await client.get(
-                    f"{settings.analysis_service_url}/api/analyze/{analysis_job_id}"
+            def report_analysis_progress(event: Dict[str, Any]):
+                """Forward analysis progress events to the workflow status"""
+                if event.get("status") != "processing" or event.get("progress") is None:
+                    return
+                update_status(
+                    "analysis",
+                    "processing",
+                    event.get("message") or "Analysis in progress...",
+                    {
+                        "analysis_id": analysis_job_id,
+                        "progress": event.get("progress"),
+                        "eta_seconds": event.get("eta_seconds")
+                    }
                 )
 
-                if status_response.status_code == 200:
-                    status_data = status_response.json()
-
-                    if status_data.get("status") == "completed":
-                        update_status(
-                            "analysis",
-                            "completed",
-                            "Analysis completed",
-                            {
-                                "transcription_job_id": transcription_job_id,
-                                "analysis_id": analysis_job_id  # Changed from analysis_job_id to match frontend expectation
-                            }
-                        )
-                        break
+            # Wait for analysis completion (90 minutes max due to API rate limiting)
+            status_data = await wait_for_job(
+                client,
+                f"{settings.analysis_service_url}/api/analyze/{analysis_job_id}?include_result=false",
+                f"{settings.analysis_service_url}/api/analyze/{analysis_job_id}/events",
+                ("completed", "failed"),
+                max_wait_seconds=90 * 60,
+                on_event=report_analysis_progress
+            )
 
-                    elif status_data.get("status") == "failed":
-                        raise Exception("Analysis job failed")
+            if status_data is None:
+                raise Exception("Analysis timeout")
 
-                await asyncio.sleep(5)
-                attempt += 1
+            if status_data["status"] != "completed":
+                raise Exception("Analysis job failed")
 
-            if attempt >= max_attempts:
-                raise Exception("Analysis timeout")
+            update_status(
+                "analysis",
+                "completed",
+                "Analysis completed",
+                {
+                    "transcription_job_id": transcription_job_id,
+                    "analysis_id": analysis_job_id  # Changed from analysis_job_id to match frontend expectation
+                }
+            )
 
             # Step 3: Report Generation (already available)
             update_status(
@@ -16,7 +16,7 @@ import redis
 from celery import current_task
 
 from celery_app import celery_app
-from main import get_transcript_with_browser_scraping, extract_video_id
+from main import get_transcript_with_browser_scraping, extract_video_id, save_job_status
 
 # Redis connection
 redis_client = redis.Redis(
@@ -28,6 +28,9 @@ redis_client = redis.Redis(
 
 logger = logging.getLogger(__name__)
 
+# Retries for transient errors in process_transcription_task
+TASK_MAX_RETRIES = 2
+
 @celery_app.task(bind=True, name='transcription_service.process_video')
 def process_transcription_task(self, job_id: str, youtube_url: str, language: str = "ko", export_format: str = "json"):
     """
@@ -48,7 +51,7 @@ def process_transcription_task(self, job_id: str, youtube_url: str, language: st
             "updated_at": datetime.now().isoformat(),
             "progress": 10
         }
-        redis_client.setex(f"job:{job_id}", 3600, json.dumps(job_data))
+        save_job_status(job_id, job_data, 3600)
         
         # Update progress to PROGRESS (matches proven method)
         self.update_state(
@@ -62,7 +65,7 @@ def process_transcription_task(self, job_id: str, youtube_url: str, language: st
             "updated_at": datetime.now().isoformat(),
             "progress": 25
         })
-        redis_client.setex(f"job:{job_id}", 3600, json.dumps(job_data))
+        save_job_status(job_id, job_data, 3600)
         
         # Extract video ID
         video_id = extract_video_id(youtube_url)
@@ -79,7 +82,7 @@ def process_transcription_task(self, job_id: str, youtube_url: str, language: st
             "updated_at": datetime.now().isoformat(),
             "progress": 50
         })
-        redis_client.setex(f"job:{job_id}", 3600, json.dumps(job_data))
+        save_job_status(job_id, job_data, 3600)
         
         # Run the DOM scraping transcription (async function needs event loop)
         loop = asyncio.new_event_loop()
@@ -133,7 +136,7 @@ def process_transcription_task(self, job_id: str, youtube_url: str, language: st
             logger.error(f"Job {job_id} failed after {processing_time:.2f}s: {error_msg}")
         
         # Store final result in Redis
-        redis_client.setex(f"job:{job_id}", 3600, json.dumps(job_data))
+        save_job_status(job_id, job_data, 3600)
         
         return job_data
     
@@ -143,20 +146,30 @@ def process_transcription_task(self, job_id: str, youtube_url: str, language: st
         
         logger.error(f"Job {job_id} failed with exception after {processing_time:.2f}s: {error_msg}")
         
-        # Update job status to FAILURE
         job_data = {
             "job_id": job_id,
-            "status": "FAILURE",
             "message": error_msg,
             "updated_at": datetime.now().isoformat(),
             "progress": 0,
             "processing_time": processing_time
         }
         
-        redis_client.setex(f"job:{job_id}", 3600, json.dumps(job_data))
+        if self.request.retries >= TASK_MAX_RETRIES:
+            # Retries exhausted: FAILURE is terminal for SSE subscribers and the gateway
+            job_data["status"] = "FAILURE"
+            save_job_status(job_id, job_data, 3600)
+            raise
+        
+        # Will be retried: record a non-terminal status so waiting clients keep waiting
+        job_data.update({
+            "status": "RETRY",
+            "message": f"Retrying in 60s (attempt {self.request.retries + 1}/{TASK_MAX_RETRIES}): {error_msg}",
+            "retries": self.request.retries + 1
+        })
+        save_job_status(job_id, job_data, 3600)
         
         # Re-raise exception for Celery
-        raise self.retry(exc=e, countdown=60, max_retries=2)
+        raise self.retry(exc=e, countdown=60, max_retries=TASK_MAX_RETRIES)
 
 @celery_app.task(name='transcription_service.cleanup_old_jobs')
 def cleanup_old_jobs():
@@ -19,9 +19,10 @@ from typing import Dict, Any, Optional
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 import redis
+import redis.asyncio as aioredis
 import json
 
 from urllib.parse import urlparse, parse_qs
@@ -32,6 +33,7 @@ from sqlalchemy.orm import Session
 
 # Import cache manager for transcript caching
 from utils.cache_manager import TranscriptCacheManager
+from utils.job_events import job_event_channel, publish_job_status, stream_job_events
 
 # Configure logging first
 logging.basicConfig(level=logging.INFO)
@@ -97,6 +99,24 @@ redis_client = redis.Redis(
     decode_responses=True
 )
 
+# Async Redis connection for job status event streams (SSE)
+async_redis_client = aioredis.Redis(
+    host=os.getenv('REDIS_HOST', 'redis'),
+    port=int(os.getenv('REDIS_PORT', 6379)),
+    password=os.getenv('REDIS_PASSWORD'),
+    decode_responses=True
+)
+
+# Job status events are published on job_events:{job_id}; the stream closes on these statuses
+# (lowercase/uppercase variants come from the background task and the Celery task respectively)
+JOB_EVENTS_CHANNEL_PREFIX = "job_events"
+JOB_TERMINAL_STATUSES = ("completed", "success", "failed", "failure")
+
+def save_job_status(job_id: str, job_data: Dict[str, Any], ttl: int = 86400):
+    """Store the job record (job:{job_id}) and publish a status event"""
+    redis_client.setex(f"job:{job_id}", ttl, json.dumps(job_data))
+    publish_job_status(redis_client, job_event_channel(JOB_EVENTS_CHANNEL_PREFIX, job_id), job_data)
+
 # Initialize cache manager for transcript caching (added 2025-01-11)
 cache_manager = TranscriptCacheManager(redis_client)
 
@@ -234,7 +254,7 @@ async def process_transcription_job(job_id: str, youtube_url: str, language: str
             "progress": 10
         }
         # Extended TTL to 24 hours (86400 seconds)
-        redis_client.setex(f"job:{job_id}", 86400, json.dumps(job_data))
+        save_job_status(job_id, job_data)
         
         # Update to processing
         job_data.update({
@@ -243,7 +263,7 @@ async def process_transcription_job(job_id: str, youtube_url: str, language: str
             "updated_at": datetime.now().isoformat(),
             "progress": 50
         })
-        redis_client.setex(f"job:{job_id}", 86400, json.dumps(job_data))
+        save_job_status(job_id, job_data)
         
         # Extract video ID and process with DOM scraping
         # Add 5-minute timeout to prevent infinite loops
@@ -337,7 +357,7 @@ async def process_transcription_job(job_id: str, youtube_url: str, language: str
             })
         
         # Store updated job status with 24-hour TTL
-        redis_client.setex(f"job:{job_id}", 86400, json.dumps(job_data))
+        save_job_status(job_id, job_data)
         
     except Exception as e:
         logger.error(f"Job {job_id} failed with exception: {str(e)}")
@@ -348,7 +368,7 @@ async def process_transcription_job(job_id: str, youtube_url: str, language: str
             "updated_at": datetime.now().isoformat(),
             "progress": 0
         }
-        redis_client.setex(f"job:{job_id}", 86400, json.dumps(job_data))
+        save_job_status(job_id, job_data)
 
 @app.get("/health")
 async def health_check():
@@ -393,7 +413,7 @@ async def submit_transcription_job(request: TranscriptionRequest, background_tas
                 "cache_hit": True,
                 "cache_source": "redis"
             }
-            redis_client.setex(f"job:{job_id}", 86400, json.dumps(job_data))  # 24h TTL
+            save_job_status(job_id, job_data)  # 24h TTL
 
             return {
                 "job_id": job_id,
@@ -448,7 +468,7 @@ async def submit_transcription_job(request: TranscriptionRequest, background_tas
                     "cache_hit": True,
                     "cache_source": "database"
                 }
-                redis_client.setex(f"job:{job_id}", 86400, json.dumps(job_data))  # 24h TTL
+                save_job_status(job_id, job_data)  # 24h TTL
 
                 return {
                     "job_id": job_id,
@@ -479,7 +499,7 @@ async def submit_transcription_job(request: TranscriptionRequest, background_tas
         }
 
         # Store in Redis
-        redis_client.setex(f"job:{job_id}", 86400, json.dumps(job_data))
+        save_job_status(job_id, job_data)
 
         # Use Celery for proven async processing, fallback to FastAPI background tasks
         if CELERY_AVAILABLE:
@@ -551,6 +571,33 @@ async def get_job_status(job_id: str):
     """Get transcription job status (legacy endpoint)"""
     return await get_job_status_proven(job_id)
 
+@app.get("/api/jobs/{job_id}/events")
+async def stream_job_status(job_id: str):
+    """
+    Stream transcription job status transitions (Server-Sent Events)
+
+    Sends the current status first, then every status change (without the transcript
+    result), and closes once the job completes or fails.
+    Fetch the result from GET /api/jobs/{job_id}/status afterwards.
+    """
+    def load_snapshot() -> Optional[Dict[str, Any]]:
+        job_data = redis_client.get(f"job:{job_id}")
+        return json.loads(job_data) if job_data else None
+
+    if load_snapshot() is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return StreamingResponse(
+        stream_job_events(
+            async_redis_client,
+            job_event_channel(JOB_EVENTS_CHANNEL_PREFIX, job_id),
+            load_snapshot,
+            JOB_TERMINAL_STATUSES
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.get("/api/transcripts/{transcript_id}")
 async def get_transcript_by_id(transcript_id: str, db: Session = Depends(get_db)):
     """Get transcript data from database by transcript ID (for analysis service)"""
@@ -19,6 +19,7 @@ logger = logging.getLogger(__name__)
 # Cache configuration
 CACHE_VERSION = "v1"  # Increment on schema changes
 CACHE_TTL = 604800  # 7 days in seconds (168 hours)
+INVALIDATE_BATCH_SIZE = 500  # Keys deleted per round trip during SCAN invalidation
 
 
 class TranscriptCacheManager:
@@ -31,6 +32,9 @@ class TranscriptCacheManager:
     - Quick video hashing for uploaded files
     - Automatic TTL management
     - Graceful error handling (never blocks transcription)
+    - Incrementally maintained statistics (no KEYS scans):
+      transcript_stats:{version} hash with {source}:{hits|misses|sets|bytes}
+      counters and a HyperLogLog of written keys per source (youtube/upload)
     """
 
     def __init__(self, redis_client: redis.Redis):
@@ -43,6 +47,19 @@ class TranscriptCacheManager:
         self.redis = redis_client
         self.version = CACHE_VERSION
         self.default_ttl = CACHE_TTL
+        self.stats_key = f"transcript_stats:{self.version}"
+
+    def _key_source(self, cache_key: str) -> str:
+        """Key source (youtube/upload) from transcript:{version}:{source}:..."""
+        parts = cache_key.split(":")
+        return parts[2] if len(parts) > 2 else "other"
+
+    def _record(self, cache_key: str, counter: str, amount: int = 1):
+        """Increment a maintained counter (never raises)"""
+        try:
+            self.redis.hincrby(self.stats_key, f"{self._key_source(cache_key)}:{counter}", amount)
+        except Exception as e:
+            logger.debug(f"Cache stats update failed for {cache_key}: {e}")
 
     def generate_youtube_key(self, video_id: str, language: str) -> str:
         """
@@ -156,6 +173,7 @@ class TranscriptCacheManager:
             cached = self.redis.get(cache_key)
             if cached:
                 logger.info(f"Cache HIT: {cache_key}")
+                self._record(cache_key, "hits")
                 data = json.loads(cached)
 
                 # Validate cache version
@@ -166,6 +184,7 @@ class TranscriptCacheManager:
                 return data
             else:
                 logger.info(f"Cache MISS: {cache_key}")
+                self._record(cache_key, "misses")
                 return None
 
         except json.JSONDecodeError as e:
@@ -202,8 +221,15 @@ class TranscriptCacheManager:
             data["cache_version"] = self.version
             data["cached_at"] = datetime.now().isoformat()
 
-            # Store in Redis with TTL
-            self.redis.setex(cache_key, ttl, json.dumps(data))
+            # Store in Redis with TTL (stats updates in the same round trip)
+            payload = json.dumps(data)
+            source = self._key_source(cache_key)
+            pipeline = self.redis.pipeline(transaction=False)
+            pipeline.setex(cache_key, ttl, payload)
+            pipeline.hincrby(self.stats_key, f"{source}:sets", 1)
+            pipeline.hincrby(self.stats_key, f"{source}:bytes", len(payload))
+            pipeline.pfadd(f"{self.stats_key}:keys:{source}", cache_key)
+            pipeline.execute()
             logger.info(f"Cache SET: {cache_key} (TTL: {ttl}s)")
             return True
 
@@ -240,16 +266,24 @@ class TranscriptCacheManager:
         Returns:
             Number of keys deleted
 
-        Warning:
-            This can be slow on large keyspaces. Use sparingly.
+        Note:
+            Uses incremental SCAN and batched deletes, so Redis is never
+            blocked for the whole keyspace (unlike KEYS).
         """
         try:
-            keys = self.redis.keys(pattern)
-            if keys:
-                deleted = self.redis.delete(*keys)
+            deleted = 0
+            batch = []
+            for key in self.redis.scan_iter(match=pattern, count=1000):
+                batch.append(key)
+                if len(batch) >= INVALIDATE_BATCH_SIZE:
+                    deleted += self.redis.delete(*batch)
+                    batch = []
+            if batch:
+                deleted += self.redis.delete(*batch)
+
+            if deleted:
                 logger.info(f"Cache INVALIDATE: {pattern} ({deleted} keys)")
-                return deleted
-            return 0
+            return deleted
 
         except Exception as e:
             logger.error(f"Cache invalidate error for pattern {pattern}: {e}")
@@ -261,18 +295,33 @@ class TranscriptCacheManager:
 
         Returns:
             Dictionary with cache metrics:
-            - total_keys: Number of cached transcripts
+            - total_keys: Approximate number of cached transcripts (HyperLogLog,
+              not decremented on expiry)
+            - by_source: Maintained counters per source (youtube/upload)
             - memory_used: Redis memory usage in bytes
-            - hit_rate: Cache hit rate (if available)
+            - hit_rate: Cache hit rate
         """
         try:
             info = self.redis.info('memory')
 
-            # Count transcript cache keys
-            keys = self.redis.keys(f"transcript:{self.version}:*")
+            # Maintained counters instead of KEYS
+            by_source: Dict[str, Dict[str, int]] = {}
+            for field, value in (self.redis.hgetall(self.stats_key) or {}).items():
+                source, _, counter = field.rpartition(":")
+                by_source.setdefault(source, {})[counter] = int(value)
+
+            total_keys = 0
+            for source, counters in by_source.items():
+                counters["keys"] = self.redis.pfcount(f"{self.stats_key}:keys:{source}")
+                total_keys += counters["keys"]
+
+            hits = sum(counters.get("hits", 0) for counters in by_source.values())
+            lookups = hits + sum(counters.get("misses", 0) for counters in by_source.values())
 
             return {
-                "total_keys": len(keys),
+                "total_keys": total_keys,
+                "by_source": by_source,
+                "hit_rate": round(hits / lookups, 3) if lookups else None,
                 "memory_used_bytes": info.get('used_memory', 0),
                 "memory_human": info.get('used_memory_human', 'N/A'),
                 "cache_version": self.version,
@@ -0,0 +1,100 @@
+"""
+Job Status Events
+Publish job status transitions on Redis pub/sub and stream them as Server-Sent Events
+
+Instead of polling GET /api/jobs/{job_id}/status every few seconds, clients and the
+gateway subscribe once and receive a small event only when the status changes.
+Large fields (the transcript result) are not part of the event; fetch them from the
+status endpoint once the terminal event arrives.
+
+(Same implementation as the analysis service's utils/job_events.py; the services ship
+as separate images, so it is not imported across services.)
+"""
+
+import json
+import logging
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Large fields left out of events
+OMITTED_FIELDS = ("result",)
+
+KEEPALIVE_SECONDS = 15.0
+
+
+def job_event_channel(prefix: str, job_id: str) -> str:
+    """Channel name for a job's status events (e.g. job_events:{job_id})"""
+    return f"{prefix}:{job_id}"
+
+
+def status_event(job_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Job record -> event (result body dropped, has_result flags whether it exists)"""
+    event = {key: value for key, value in job_data.items() if key not in OMITTED_FIELDS}
+    event["has_result"] = any(job_data.get(key) is not None for key in OMITTED_FIELDS)
+    return event
+
+
+def publish_job_status(redis_client, channel: str, job_data: Dict[str, Any]):
+    """Publish a status event (failures are logged only; subscribers can recover via the status endpoint)"""
+    try:
+        redis_client.publish(channel, json.dumps(status_event(job_data), ensure_ascii=False))
+    except Exception as e:
+        logger.warning(f"Failed to publish job status event on {channel}: {e}")
+
+
+def format_sse(data: Dict[str, Any], event: str = "status") -> str:
+    """A single SSE message"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def is_terminal(status: Optional[str], terminal_statuses: Iterable[str]) -> bool:
+    return (status or "").lower() in terminal_statuses
+
+
+async def stream_job_events(
+    async_redis,
+    channel: str,
+    load_snapshot: Callable[[], Optional[Dict[str, Any]]],
+    terminal_statuses: Iterable[str],
+    keepalive_seconds: float = KEEPALIVE_SECONDS
+) -> AsyncIterator[str]:
+    """
+    SSE stream of a job's status
+
+    Subscribes before reading the current status (snapshot), so no transition between
+    the two is lost. Closes after sending a terminal status (completed/failed, ...).
+
+    Args:
+        async_redis: redis.asyncio client (decode_responses=True)
+        channel: result of job_event_channel()
+        load_snapshot: reads the current job record (None if missing)
+        terminal_statuses: statuses that end the stream (lowercase)
+        keepalive_seconds: interval for keepalive comments while no event arrives
+    """
+    terminal_statuses = {status.lower() for status in terminal_statuses}
+    pubsub = async_redis.pubsub()
+    await pubsub.subscribe(channel)
+    try:
+        snapshot = load_snapshot()
+        if snapshot is None:
+            yield format_sse({"error": "Job not found"}, event="error")
+            return
+
+        yield format_sse(status_event(snapshot))
+        if is_terminal(snapshot.get("status"), terminal_statuses):
+            return
+
+        while True:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=keepalive_seconds)
+            if message is None:
+                # Keep proxies/clients from hitting their idle timeout
+                yield ": keepalive\n\n"
+                continue
+
+            event = json.loads(message["data"])
+            yield format_sse(event)
+            if is_terminal(event.get("status"), terminal_statuses):
+                return
+    finally:
+        await pubsub.reset()